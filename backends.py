@@ -0,0 +1,268 @@
+import functools
+import importlib.util
+import weakref
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from correlation import correlation_matrix
+from profiler import TOP_K, ColumnProfile, is_categorical_column, is_numeric_column, profile_column
+
+AGGREGATES = ["sum", "mean", "count", "min", "max", "median"]
+PROFILE_QUANTILES = [0.25, 0.5, 0.75]
+CORR_PAIRS_PER_QUERY = 1_000
+
+
+# Queries an engine rejects (e.g. unsupported column types) are answered by pandas instead
+def _pandas_fallback(method):
+    @functools.wraps(method)
+    def run(self, df, *args, **kwargs):
+        try:
+            return method(self, df, *args, **kwargs)
+        except Exception:
+            return getattr(PandasBackend, method.__name__)(self, df, *args, **kwargs)
+    return run
+
+
+def _float(value):
+    return np.nan if value is None else float(value)
+
+
+def _column_profile(series, n_rows, count, distinct, top_values, stats=None):
+    # stats: (min, max, mean, std, skew, [q25, q50, q75]) from an engine, for numeric columns
+    profile = ColumnProfile(
+        name=series.name,
+        dtype=str(series.dtype),
+        count=count,
+        nulls=n_rows - count,
+        distinct=distinct,
+        is_numeric=is_numeric_column(series),
+        is_categorical=is_categorical_column(series),
+        top_values=top_values,
+    )
+    if stats is not None and count:
+        low, high, mean, std, skew, quartiles = stats
+        profile.min, profile.max, profile.mean, profile.std = _float(low), _float(high), _float(mean), _float(std)
+        # Same conventions as profiler.profile_column: constant columns have skew 0, n < 3 has none
+        profile.skew = 0.0 if profile.std == 0 and count >= 3 else (_float(skew) if count >= 3 else np.nan)
+        profile.q25, profile.q50, profile.q75 = (_float(q) for q in quartiles)
+    return profile
+
+
+def _counts(values, counts, column):
+    return pd.Series(np.asarray(counts, dtype="int64"), index=pd.Index(values, name=column), name="count")
+
+
+class PandasBackend:
+    name = "pandas"
+    module = None
+
+    def __init__(self, path=None):
+        self.path = path  # pandas always works on the in-memory frame
+
+    def profile(self, df, columns, top_k=TOP_K):
+        """{column: ColumnProfile} for `columns`."""
+        return {col: profile_column(df[col], top_k=top_k) for col in columns}
+
+    def value_counts(self, df, column, top_k=None):
+        counts = df[column].value_counts()
+        return counts if top_k is None else counts.head(top_k)
+
+    def quantiles(self, df, columns, qs):
+        """Linearly interpolated quantiles: one row per q, one column per column."""
+        return df[columns].quantile(qs)
+
+    def correlation(self, df, columns):
+        return correlation_matrix(df, columns, approximate=True)
+
+    def group_aggregate(self, df, by, column, agg="sum"):
+        """`agg` of `column` per non-null value of `by`, sorted by group."""
+        return df.groupby(by, observed=True, sort=True)[column].agg(agg)
+
+
+class DuckDBBackend(PandasBackend):
+    name = "duckdb"
+    module = "duckdb"
+    _SQL_AGGREGATES = {"sum": "coalesce(sum({}), 0)", "mean": "avg({})", "count": "count({})",
+                       "min": "min({})", "max": "max({})", "median": "median({})"}
+
+    def __init__(self, path=None):
+        import duckdb
+        super().__init__(path)
+        self.con = duckdb.connect()
+        self._registered = (None, ())   # (weakref to the frame, its columns in the "data" view)
+
+    def _table(self, df, columns):
+        if self.path:
+            return "read_parquet('{}')".format(str(self.path).replace("'", "''"))
+        columns = list(dict.fromkeys(columns))
+        frame, registered = self._registered
+        if frame is None or frame() is not df or not set(columns) <= set(registered):
+            # Arrow view of just the queried columns (zero-copy for numbers and Arrow strings;
+            # NaN becomes NULL), so an unsupported column elsewhere doesn't fail the query
+            self.con.register("data", pa.Table.from_pandas(df[columns], preserve_index=False))
+            self._registered = (weakref.ref(df), columns)
+        return "data"
+
+    @staticmethod
+    def _ident(column):
+        return '"{}"'.format(str(column).replace('"', '""'))
+
+    def _row(self, df, columns, exprs):
+        return self.con.sql(f"SELECT {', '.join(exprs)} FROM {self._table(df, columns)}").fetchone()
+
+    @_pandas_fallback
+    def profile(self, df, columns, top_k=TOP_K):
+        numeric = {col for col in columns if is_numeric_column(df[col])}
+        exprs = []
+        for col in columns:
+            c = self._ident(col)
+            exprs += [f"count({c})", f"count(DISTINCT {c})"]
+            if col in numeric:
+                exprs += [f"min({c})::DOUBLE", f"max({c})::DOUBLE", f"avg({c})", f"stddev_samp({c})",
+                          f"skewness({c})", f"quantile_cont({c}, {PROFILE_QUANTILES})"]
+        values = iter(self._row(df, columns, exprs))
+        profiles = {}
+        for col in columns:
+            count, distinct = next(values), next(values)
+            stats = tuple(next(values) for _ in range(6)) if col in numeric else None
+            profiles[col] = _column_profile(df[col], len(df), count, distinct,
+                                            self.value_counts(df, col, top_k), stats)
+        return profiles
+
+    @_pandas_fallback
+    def value_counts(self, df, column, top_k=None):
+        c = self._ident(column)
+        limit = "" if top_k is None else f" LIMIT {int(top_k)}"
+        rows = self.con.sql(f"SELECT {c}, count(*) AS n FROM {self._table(df, [column])} WHERE {c} IS NOT NULL "
+                            f"GROUP BY {c} ORDER BY n DESC, {c}{limit}").fetchall()
+        return _counts([r[0] for r in rows], [r[1] for r in rows], column)
+
+    @_pandas_fallback
+    def quantiles(self, df, columns, qs):
+        row = self._row(df, columns, [f"quantile_cont({self._ident(col)}, {list(qs)})" for col in columns])
+        return pd.DataFrame({col: [_float(q) for q in values] for col, values in zip(columns, row)},
+                            index=pd.Index(qs), columns=columns)
+
+    @_pandas_fallback
+    def correlation(self, df, columns):
+        # corr() skips rows where either value is NULL: pairwise-complete like df.corr()
+        pairs = [(i, j) for i in range(len(columns)) for j in range(i + 1)]
+        corr = np.full((len(columns), len(columns)), np.nan)
+        for start in range(0, len(pairs), CORR_PAIRS_PER_QUERY):
+            batch = pairs[start:start + CORR_PAIRS_PER_QUERY]
+            row = self._row(df, columns, [f"corr({self._ident(columns[i])}::DOUBLE, {self._ident(columns[j])}::DOUBLE)"
+                                 for i, j in batch])
+            for (i, j), r in zip(batch, row):
+                corr[i, j] = corr[j, i] = _float(r)
+        np.clip(corr, -1, 1, out=corr)
+        result = pd.DataFrame(corr.astype(np.float32), index=columns, columns=columns)
+        result.attrs["sampled_rows"] = None
+        return result
+
+    @_pandas_fallback
+    def group_aggregate(self, df, by, column, agg="sum"):
+        b = self._ident(by)
+        value = self._SQL_AGGREGATES[agg].format(self._ident(column))
+        rows = self.con.sql(f"SELECT {b}, {value} FROM {self._table(df, [by, column])} WHERE {b} IS NOT NULL "
+                            f"GROUP BY {b} ORDER BY {b}").fetchall()
+        return pd.Series([r[1] for r in rows], index=pd.Index([r[0] for r in rows], name=by), name=column)
+
+
+class PolarsBackend(PandasBackend):
+    name = "polars"
+    module = "polars"
+
+    def __init__(self, path=None):
+        import polars
+        super().__init__(path)
+        self.pl = polars
+
+    def _frame(self, df, columns):
+        if self.path:
+            return self.pl.scan_parquet(self.path).select(list(columns))
+        return self.pl.from_pandas(df[list(columns)]).lazy()  # NaN becomes null, as in pandas statistics
+
+    @_pandas_fallback
+    def profile(self, df, columns, top_k=TOP_K):
+        pl = self.pl
+        numeric = {col for col in columns if is_numeric_column(df[col])}
+        exprs = []
+        for i, col in enumerate(columns):
+            values = pl.col(col)
+            exprs += [values.count().alias(f"{i}:count"), values.drop_nulls().n_unique().alias(f"{i}:distinct")]
+            if col in numeric:
+                x = values.cast(pl.Float64)
+                exprs += [x.min().alias(f"{i}:min"), x.max().alias(f"{i}:max"), x.mean().alias(f"{i}:mean"),
+                          x.std().alias(f"{i}:std"), x.skew(bias=False).alias(f"{i}:skew")]
+                exprs += [x.quantile(q, "linear").alias(f"{i}:q{q}") for q in PROFILE_QUANTILES]
+        row = self._frame(df, columns).select(exprs).collect().row(0, named=True)
+        profiles = {}
+        for i, col in enumerate(columns):
+            stats = None
+            if col in numeric:
+                stats = tuple(row[f"{i}:{stat}"] for stat in ("min", "max", "mean", "std", "skew")) + (
+                    [row[f"{i}:q{q}"] for q in PROFILE_QUANTILES],)
+            profiles[col] = _column_profile(df[col], len(df), row[f"{i}:count"], row[f"{i}:distinct"],
+                                            self.value_counts(df, col, top_k), stats)
+        return profiles
+
+    @_pandas_fallback
+    def value_counts(self, df, column, top_k=None):
+        pl = self.pl
+        out = (self._frame(df, [column]).drop_nulls().group_by(column).agg(pl.len().alias("__n"))
+               .sort(["__n", column], descending=[True, False]))
+        out = (out if top_k is None else out.head(top_k)).collect()
+        return _counts(out[column].to_list(), out["__n"].to_list(), column)
+
+    @_pandas_fallback
+    def quantiles(self, df, columns, qs):
+        pl = self.pl
+        exprs = [pl.col(col).cast(pl.Float64).quantile(q, "linear").alias(f"{i}:{j}")
+                 for i, col in enumerate(columns) for j, q in enumerate(qs)]
+        row = self._frame(df, columns).select(exprs).collect().row(0)
+        return pd.DataFrame(np.array(row, dtype=float).reshape(len(columns), len(qs)).T,
+                            index=pd.Index(qs), columns=columns)
+
+    @_pandas_fallback
+    def correlation(self, df, columns):
+        pl = self.pl
+        pairs = [(i, j) for i in range(len(columns)) for j in range(i + 1)]
+        exprs = []
+        for i, j in pairs:
+            a, b = pl.col(columns[i]).cast(pl.Float64), pl.col(columns[j]).cast(pl.Float64)
+            both = a.is_not_null() & b.is_not_null()
+            exprs.append(pl.corr(a.filter(both), b.filter(both)).alias(f"{i}:{j}"))
+        row = self._frame(df, columns).select(exprs).collect().row(0)
+        corr = np.full((len(columns), len(columns)), np.nan)
+        for (i, j), r in zip(pairs, row):
+            corr[i, j] = corr[j, i] = _float(r)
+        np.clip(corr, -1, 1, out=corr)
+        result = pd.DataFrame(corr.astype(np.float32), index=columns, columns=columns)
+        result.attrs["sampled_rows"] = None
+        return result
+
+    @_pandas_fallback
+    def group_aggregate(self, df, by, column, agg="sum"):
+        pl = self.pl
+        value = pl.col(column)
+        value = value.count() if agg == "count" else getattr(value, agg)()
+        out = (self._frame(df, dict.fromkeys([by, column])).filter(pl.col(by).is_not_null())
+               .group_by(by).agg(value.alias("__value")).sort(by).collect())
+        return pd.Series(out["__value"].to_list(), index=pd.Index(out[by].to_list(), name=by), name=column)
+
+
+BACKENDS = {backend.name: backend for backend in (PandasBackend, DuckDBBackend, PolarsBackend)}
+
+
+def available_backends():
+    return [name for name, backend in BACKENDS.items()
+            if backend.module is None or importlib.util.find_spec(backend.module) is not None]
+
+
+def make_backend(name="pandas", path=None):
+    """Backend `name`; DuckDB and Polars scan the Parquet file `path` when given."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown compute backend: {name}")
+    return BACKENDS[name](path)
@@ -0,0 +1,232 @@
+"""Time every analysis and transform path on synthetic data.
+
+    python -m benchmarks.run --scales small medium --output results.json
+    python -m benchmarks.run --scales large --baseline baseline.json
+
+Each operation is timed `--repeat` times (min and median are reported) and
+then run once more under tracemalloc for its peak Python/NumPy allocation
+(Arrow buffers are not traced). With `--baseline`, timings are compared per
+(scale, operation) and the run exits non-zero when one is slower than
+`--tolerance` times the baseline.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from backends import make_backend
+from chart_reduction import line_chart, scatter_chart
+from core import (auto_fix_types, compute_insights, convert_dtype, correct_skew, detect_outliers, fill_missing,
+                  label_encode, one_hot_encode, reservoir_sample, scale_columns, transform_column)
+from correlation import correlation_matrix, high_correlation_pairs
+from data_export import export_bytes
+from data_loader import parse_csv
+from memory_optimizer import optimize_memory
+from profiler import profile_column, profile_dataset
+from streaming import stream_csv
+from .synthetic import make_frame
+
+SCALES = {
+    "small": (10_000, 20),
+    "medium": (100_000, 50),
+    "large": (1_000_000, 200),
+}
+
+
+def _columns(df, kind):
+    return [col for col in df.columns if col.startswith(kind + "_")]
+
+
+class Context:
+    """Frame plus lazily built inputs (CSV bytes/file) shared by the operations of one scale."""
+
+    def __init__(self, df):
+        self.df = df
+        self._csv = None
+        self._path = None
+
+    @property
+    def csv(self):
+        if self._csv is None:
+            self._csv = self.df.to_csv(index=False).encode()
+        return self._csv
+
+    @property
+    def path(self):
+        if self._path is None:
+            fd, self._path = tempfile.mkstemp(suffix=".csv")
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.csv)
+        return self._path
+
+    def close(self):
+        if self._path:
+            os.unlink(self._path)
+
+
+# Operations reading the CSV form of the frame; it is written before their timing starts
+IO_OPERATIONS = {"parse_csv", "stream_csv"}
+
+OPERATIONS = {
+    "parse_csv": lambda ctx: parse_csv(ctx.csv),
+    "stream_csv": lambda ctx: stream_csv(ctx.path),
+    "profile_dataset": lambda ctx: profile_dataset(ctx.df),
+    "profile_id_exact": lambda ctx: profile_column(ctx.df["id_0"], approximate=False),
+    "profile_id_sketch": lambda ctx: profile_column(ctx.df["id_0"], approximate=True),
+    # Engine backends (an ImportError is reported when the engine is not installed)
+    "profile_duckdb": lambda ctx: make_backend("duckdb").profile(ctx.df, ctx.df.columns),
+    "profile_polars": lambda ctx: make_backend("polars").profile(ctx.df, ctx.df.columns),
+    "correlation_duckdb": lambda ctx: make_backend("duckdb").correlation(
+        ctx.df, _columns(ctx.df, "normal") + _columns(ctx.df, "skewed")),
+    "correlation_exact": lambda ctx: correlation_matrix(ctx.df, _columns(ctx.df, "normal") + _columns(ctx.df, "skewed")),
+    "correlation_approx": lambda ctx: correlation_matrix(
+        ctx.df, _columns(ctx.df, "normal") + _columns(ctx.df, "skewed"), approximate=True),
+    "correlation_pandas": lambda ctx: ctx.df[_columns(ctx.df, "normal") + _columns(ctx.df, "skewed")].corr(),
+    "high_correlation_pairs": lambda ctx: high_correlation_pairs(
+        correlation_matrix(ctx.df, _columns(ctx.df, "normal")), 0.85),
+    "insights": lambda ctx: compute_insights(ctx.df),
+    "optimize_memory": lambda ctx: optimize_memory(ctx.df),
+    "convert_dirty_float": lambda ctx: convert_dtype(ctx.df, "dirty_0", "float"),
+    "convert_date": lambda ctx: convert_dtype(ctx.df, "date_0", "datetime"),
+    "auto_fix_types": lambda ctx: auto_fix_types(ctx.df),
+    "fill_mean": lambda ctx: fill_missing(ctx.df, "normal_0", "Mean"),
+    "sample_stratified": lambda ctx: reservoir_sample(ctx.df, stratify="category_0"),
+    "outliers_iqr": lambda ctx: detect_outliers(ctx.df, method="IQR"),
+    "outliers_mad": lambda ctx: detect_outliers(ctx.df, method="Modified Z-score (MAD)"),
+    "outliers_forest": lambda ctx: detect_outliers(ctx.df, method="Isolation Forest"),
+    "scale_standard": lambda ctx: scale_columns(ctx.df, _columns(ctx.df, "normal"), "StandardScaler"),
+    "one_hot": lambda ctx: one_hot_encode(ctx.df, ["category_0"]),
+    "label_encode": lambda ctx: label_encode(ctx.df, _columns(ctx.df, "category")),
+    "yeo_johnson": lambda ctx: transform_column(ctx.df, "skewed_0", "Yeo-Johnson"),
+    "skew_auto": lambda ctx: correct_skew(ctx.df, _columns(ctx.df, "skewed")),
+    "export_csv_zstd": lambda ctx: export_bytes(ctx.df, "CSV (zstd)"),
+    "export_parquet": lambda ctx: export_bytes(ctx.df, "Parquet"),
+    "line_chart_lttb": lambda ctx: line_chart(ctx.df, "int_0", "normal_0"),
+    "scatter_density": lambda ctx: scatter_chart(ctx.df, "normal_0", "normal_1"),
+}
+
+
+def measure(op, ctx, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        op(ctx)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        op(ctx)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds_min": round(min(times), 4), "seconds_median": round(statistics.median(times), 4),
+            "peak_mb": round(peak / 1024 ** 2, 1)}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def run(scales, ops, repeat=3, seed=0):
+    results = []
+    for scale, (n_rows, n_cols) in scales.items():
+        ctx = Context(make_frame(n_rows, n_cols, seed=seed))
+        try:
+            for name in ops:
+                entry = {"scale": scale, "rows": n_rows, "cols": n_cols, "op": name}
+                if name in IO_OPERATIONS:
+                    ctx.path
+                try:
+                    entry.update(measure(OPERATIONS[name], ctx, repeat))
+                except Exception as e:
+                    entry["error"] = f"{type(e).__name__}: {e}"
+                results.append(entry)
+                print(_format_entry(entry), flush=True)
+        finally:
+            ctx.close()
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def _format_entry(entry):
+    head = f"{entry['scale']:>8} {entry['op']:<24}"
+    if "error" in entry:
+        return f"{head} ERROR {entry['error']}"
+    return f"{head} {entry['seconds_min']:>9.4f}s (median {entry['seconds_median']:.4f}s)  peak {entry['peak_mb']:>8.1f} MB"
+
+
+def compare(report, baseline, tolerance):
+    """Print per-operation speed ratios against `baseline`; returns the regressed entries."""
+    previous = {(e["scale"], e["op"]): e for e in baseline["results"] if "error" not in e}
+    regressions = []
+    for entry in report["results"]:
+        old = previous.get((entry["scale"], entry["op"]))
+        if old is None or "error" in entry:
+            continue
+        ratio = entry["seconds_min"] / max(old["seconds_min"], 1e-9)
+        flag = "REGRESSION" if ratio > tolerance else ""
+        print(f"{entry['scale']:>8} {entry['op']:<24} {old['seconds_min']:>9.4f}s -> {entry['seconds_min']:>9.4f}s "
+              f"x{ratio:5.2f}  peak {old['peak_mb']:.1f} -> {entry['peak_mb']:.1f} MB  {flag}")
+        if flag:
+            regressions.append(entry)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark NumeriX analysis and transform paths.")
+    parser.add_argument("--scales", nargs="+", default=["small", "medium"], choices=list(SCALES))
+    parser.add_argument("--rows", type=int, help="custom scale: rows (use with --cols)")
+    parser.add_argument("--cols", type=int, help="custom scale: columns")
+    parser.add_argument("--ops", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    scales = {name: SCALES[name] for name in args.scales}
+    if args.rows and args.cols:
+        scales = {f"{args.rows}x{args.cols}": (args.rows, args.cols)}
+    report = run(scales, args.ops, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} operation(s) slower than x{args.tolerance} of the baseline", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+"""Reproducible synthetic datasets shaped like our real extracts."""
+import numpy as np
+import pandas as pd
+
+# Share of columns of each kind; the rest are normally distributed floats
+COLUMN_MIX = {
+    "skewed": 0.15,      # exponential floats
+    "int": 0.15,
+    "category": 0.15,    # a few dozen levels
+    "id": 0.05,          # high-cardinality strings
+    "dirty": 0.10,       # numbers stored as "1,234%"-style text
+    "date": 0.05,        # ISO date strings
+}
+NULL_SHARE = 0.05
+
+
+def _pool_choice(rng, pool, n):
+    # Sampling from a pool of distinct strings is much faster than formatting n values
+    return pool[rng.integers(0, len(pool), n)]
+
+
+def make_frame(n_rows, n_cols, seed=0, null_share=NULL_SHARE):
+    """Mixed-type frame with `n_rows` × `n_cols`; identical for the same arguments."""
+    rng = np.random.default_rng(seed)
+    counts = {kind: int(n_cols * share) for kind, share in COLUMN_MIX.items()}
+    counts["normal"] = n_cols - sum(counts.values())
+
+    dirty_pool = np.array([f"{v:,}%" for v in rng.integers(0, 1_000_000, 10_000)] + ["--", "nan", ""], dtype=object)
+    date_pool = pd.date_range("2000-01-01", periods=9_000, freq="D").strftime("%Y-%m-%d").to_numpy(dtype=object)
+    levels = np.array([f"level_{i}" for i in range(40)], dtype=object)
+
+    columns = {}
+    for kind, count in counts.items():
+        for i in range(count):
+            name = f"{kind}_{i}"
+            if kind == "normal":
+                values = rng.normal(100, 15, n_rows)
+            elif kind == "skewed":
+                values = rng.exponential(10, n_rows)
+            elif kind == "int":
+                values = rng.integers(0, 10_000, n_rows)
+            elif kind == "category":
+                values = _pool_choice(rng, levels, n_rows)
+            elif kind == "id":
+                values = pd.Series(rng.integers(0, n_rows * 10, n_rows)).astype(str).radd("id_").to_numpy(dtype=object)
+            elif kind == "dirty":
+                values = _pool_choice(rng, dirty_pool, n_rows)
+            else:
+                values = _pool_choice(rng, date_pool, n_rows)
+            columns[name] = values
+
+    df = pd.DataFrame(columns)
+    if null_share:
+        for name in df.columns:
+            if not name.startswith("int"):
+                df.loc[rng.random(n_rows) < null_share, name] = np.nan
+    return df
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+RENDER_WORKERS = 4
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_WIDTH, DEFAULT_HEIGHT = 700, 500  # plotly's own export defaults
+
+_image_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def figure_key(fig, scale):
+    # The JSON spec fully determines the image, so equal specs share one render
+    return hashlib.sha1(f"{scale}:{fig.to_json()}".encode()).hexdigest()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        png = _image_cache.get(key)
+        if png is not None:
+            _image_cache.move_to_end(key)
+        return png
+
+
+def _cache_put(key, png):
+    with _cache_lock:
+        _image_cache[key] = png
+        _image_cache.move_to_end(key)
+        total = sum(len(v) for v in _image_cache.values())
+        while total > IMAGE_CACHE_MAX_BYTES and len(_image_cache) > 1:
+            _, evicted = _image_cache.popitem(last=False)
+            total -= len(evicted)
+
+
+class _KaleidoRenderer:
+    """A single long-lived Kaleido browser with a pool of tabs.
+
+    Runs on its own event loop thread so Streamlit reruns and report
+    builds reuse the same Chrome process instead of starting one per image.
+    """
+
+    def __init__(self, workers=RENDER_WORKERS):
+        self.workers = workers
+        self._loop = None
+        self._kaleido = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._kaleido is not None:
+                return
+            import kaleido
+
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            try:
+                renderer = kaleido.Kaleido(n=self.workers)
+                asyncio.run_coroutine_threadsafe(renderer.open(), loop).result()
+            except BaseException:
+                loop.call_soon_threadsafe(loop.stop)
+                raise
+            self._loop, self._kaleido = loop, renderer
+
+    def render(self, figs, scale):
+        self._ensure_started()
+
+        async def render_all():
+            # Each calc_fig waits for a free tab, so up to `workers` run at once
+            return await asyncio.gather(
+                *(
+                    self._kaleido.calc_fig(
+                        fig.to_dict(),
+                        opts=dict(
+                            format="png",
+                            scale=scale,
+                            width=fig.layout.width or DEFAULT_WIDTH,
+                            height=fig.layout.height or DEFAULT_HEIGHT,
+                        ),
+                    )
+                    for fig in figs
+                ),
+                return_exceptions=True,
+            )
+
+        return asyncio.run_coroutine_threadsafe(render_all(), self._loop).result()
+
+
+_renderer = _KaleidoRenderer()
+
+
+def _render_serial(figs, scale):
+    results = []
+    for fig in figs:
+        try:
+            results.append(pio.to_image(fig, format="png", scale=scale))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def render_png(charts, scale=2):
+    """PNG bytes for each figure (or the Exception raised while rendering it).
+
+    Cached images are reused; the rest are rendered concurrently on the
+    persistent Kaleido browser, falling back to plotly's one-at-a-time
+    export when that is unavailable (e.g. legacy kaleido).
+    """
+    keys = [figure_key(fig, scale) for fig in charts]
+    results = [_cache_get(key) for key in keys]
+    missing = [i for i, png in enumerate(results) if png is None]
+    if not missing:
+        return results
+
+    figs = [charts[i] for i in missing]
+    try:
+        rendered = _renderer.render(figs, scale)
+    except Exception:
+        rendered = _render_serial(figs, scale)
+
+    for i, png in zip(missing, rendered):
+        results[i] = png
+        if isinstance(png, bytes):
+            _cache_put(keys[i], png)
+    return results
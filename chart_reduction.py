@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+# Upper bounds on what gets shipped to the browser per chart
+LINE_POINT_LIMIT = 5_000
+SCATTER_POINT_LIMIT = 20_000
+BAR_LIMIT = 1_000
+DENSITY_BINS = 200
+MAX_HISTOGRAM_BINS = 200
+
+
+def _as_float(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.astype("int64").to_numpy(dtype="float64")
+    return series.to_numpy(dtype="float64")
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of `n_out` points that keep the line's shape."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def minmax_indices(y, n_out):
+    # Keep the min and max of each positional bucket so spikes survive
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    n_buckets = max(n_out // 2, 1)
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    picked = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            bucket = y[start:end]
+            picked += [start + int(np.argmin(bucket)), start + int(np.argmax(bucket))]
+    return np.unique(picked)
+
+
+def _xy(df, x, y):
+    return df[list(dict.fromkeys([x, y]))].dropna()
+
+
+def line_chart(df, x, y, max_points=LINE_POINT_LIMIT):
+    """Returns (figure, points shown, total points)."""
+    data = _xy(df, x, y)
+    total = len(data)
+    if total > max_points:
+        if pd.api.types.is_numeric_dtype(data[x]) or pd.api.types.is_datetime64_any_dtype(data[x]):
+            data = data.sort_values(x, kind="stable")
+            keep = lttb_indices(_as_float(data[x]), _as_float(data[y]), max_points)
+        else:
+            keep = minmax_indices(_as_float(data[y]), max_points)
+        data = data.iloc[keep]
+    return px.line(data, x=x, y=y), len(data), total
+
+
+def bar_chart(df, x, y, max_bars=BAR_LIMIT, backend=None):
+    # Returns (figure, bars shown, distinct x values); plotly stacks one segment
+    # per row, so summing per x value draws the same bars
+    if backend is None:
+        sums = df.groupby(x, observed=True, sort=True)[y].sum()
+    else:
+        sums = backend.group_aggregate(df, x, y, "sum")
+    total = len(sums)
+    if len(sums) > max_bars:
+        sums = sums[sums.abs().nlargest(max_bars).index].sort_index()
+    return px.bar(x=sums.index, y=sums.to_numpy(), labels={"x": x, "y": y}), len(sums), total
+
+
+def scatter_chart(df, x, y, max_points=SCATTER_POINT_LIMIT, bins=DENSITY_BINS, random_state=0):
+    data = _xy(df, x, y)
+    total = len(data)
+    if total <= max_points:
+        return px.scatter(data, x=x, y=y), total, total
+
+    if pd.api.types.is_numeric_dtype(data[x]) and pd.api.types.is_numeric_dtype(data[y]):
+        # Binned 2D density instead of millions of markers
+        counts, x_edges, y_edges = np.histogram2d(_as_float(data[x]), _as_float(data[y]), bins=bins)
+        counts[counts == 0] = np.nan
+        fig = px.imshow(
+            counts.T,
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            origin="lower",
+            aspect="auto",
+            color_continuous_scale="Viridis",
+            labels={"x": x, "y": y, "color": "Count"},
+        )
+        return fig, int(np.count_nonzero(~np.isnan(counts))), total
+
+    sample = data.sample(n=max_points, random_state=random_state)
+    return px.scatter(sample, x=x, y=y), max_points, total
+
+
+def histogram_chart(df, col, max_bins=MAX_HISTOGRAM_BINS):
+    # Returns (figure, bins, values binned, infinite values left out)
+    values = _as_float(df[col].dropna())
+    finite = np.isfinite(values)
+    excluded = int(len(values) - finite.sum())
+    values = values[finite] if excluded else values
+    total = len(values)
+    if total == 0:
+        return px.histogram(df.iloc[:0], x=col), 0, 0, excluded
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) - 1 > max_bins:
+        edges = np.histogram_bin_edges(values, bins=max_bins)
+    counts, edges = np.histogram(values, bins=edges)
+    fig = px.bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, labels={"x": col, "y": "count"})
+    fig.update_traces(width=np.diff(edges))
+    fig.update_layout(bargap=0)
+    return fig, len(counts), total, excluded
@@ -0,0 +1,25 @@
+"""Pure computation behind the Streamlit tabs.
+
+Nothing here imports Streamlit: functions take a DataFrame (plus options)
+and return result objects, so the tab modules only render them and the
+same code runs in batch jobs (numerix_cli.py, pipeline.py) and benchmarks.
+Modifications return a ChangeResult carrying the new frame, the change-log
+message, the touched columns and the replayable pipeline step.
+"""
+from .cleaning import FILL_METHODS, drop_duplicate_rows, drop_missing_rows, fill_missing, fill_value
+from .dtypes import (DTYPE_OPTIONS, ColumnFix, auto_fix_types, convert_column, convert_dtype, infer_target_dtype,
+                     optimize_dtypes, parse_integers, parse_numeric)
+from .datetimes import DateParseResult, detect_formats, parse_dates
+from .encoding import (ENCODERS, HASH_BUCKETS, OneHotEstimate, decode_labels, densify, encode_labels, estimate_one_hot,
+                       fit_levels, hash_encode, hash_frame, label_codes, label_encode, map_by_text, one_hot_encode,
+                       one_hot_frame, target_encode)
+from .explore import FeatureOverview, correlated_pairs, feature_overview, pair_correlation
+from .insights import Insights, compute_insights
+from .outliers import (ACTIONS as OUTLIER_ACTIONS, DEFAULT_THRESHOLDS as OUTLIER_THRESHOLDS, METHODS as OUTLIER_METHODS,
+                       OutlierScan, apply_outlier_rule, detect_outliers, forest_outliers)
+from .results import ChangeResult
+from .sampling import (EXPLORE_SAMPLE_ROWS, Estimate, ExplorationSample, correlation_estimate, mean_estimate,
+                       reservoir_sample, skew_estimate, stratify_candidates)
+from .scaling import SCALE_DTYPES, SCALERS, apply_scaler, assign_block, fit_scaler, scale_columns
+from .transform import (AUTO as AUTO_TRANSFORM, TRANSFORMS, apply_transform, correct_skew, fit_transform_params,
+                        skewed_columns, transform_column)
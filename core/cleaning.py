@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from .results import ChangeResult
+
+FILL_METHODS = ["Mean", "Median", "Mode", "0", "Constant", "Interpolate"]
+
+
+def _drop_rows(df, mask):
+    positions = np.flatnonzero(mask)
+    return df.iloc[np.flatnonzero(~mask)] if len(positions) else df, positions
+
+
+def drop_missing_rows(df):
+    result, positions = _drop_rows(df, df.isna().any(axis=1).to_numpy())
+    dropped = len(positions)
+    return ChangeResult(result, f"Dropped {dropped} rows with missing values", step={"op": "dropna"}, changed=dropped,
+                        dropped=positions)
+
+
+def drop_duplicate_rows(df):
+    result, positions = _drop_rows(df, df.duplicated().to_numpy())
+    dropped = len(positions)
+    return ChangeResult(result, f"Dropped {dropped} duplicate rows", step={"op": "drop_duplicates"}, changed=dropped,
+                        dropped=positions)
+
+
+def fill_value(series, method, constant=None):
+    if method == "Mean":
+        return series.mean()
+    if method == "Median":
+        return series.median()
+    if method == "Mode":
+        return series.mode()[0]
+    if method == "0":
+        return 0
+    if method == "Constant":
+        return constant
+    raise ValueError(f"Unknown fill method: {method}")
+
+
+def fill_missing(df, column, method, constant=None):
+    """Fill nulls in one column; the fitted fill value is what the pipeline replays."""
+    filled = int(df[column].isna().sum())
+    if not filled:
+        return ChangeResult(df)
+
+    result = df.copy(deep=False)
+    if method == "Interpolate":
+        result[column] = result[column].interpolate(method='linear')
+        step = {"op": "interpolate", "column": column}
+    else:
+        value = fill_value(result[column], method, constant)
+        # Category columns (e.g. from the memory optimizer) only accept known levels
+        if isinstance(result[column].dtype, pd.CategoricalDtype) and value not in result[column].cat.categories:
+            result[column] = result[column].cat.add_categories([value])
+        result[column] = result[column].fillna(value)
+        step = {"op": "fill", "column": column, "value": value}
+    return ChangeResult(result, f"Filled {filled} nulls in '{column}' using {method}", [column], step, filled)
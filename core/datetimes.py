@@ -0,0 +1,103 @@
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from .text import clean_text
+
+FORMAT_SAMPLE = 50          # distinct values used to detect the column's format(s)
+DATE_CACHE_MAX = 200_000    # strings remembered across calls sharing a cache (e.g. CSV chunks)
+UNIT = "datetime64[us]"
+_YEAR_ONLY = r"^\d{4}(\.0)?$"
+
+
+@dataclass
+class DateParseResult:
+    values: pd.Series
+    formats: dict          # format -> distinct values it parsed ("mixed" = per-value fallback)
+    unparsable: pd.Series  # value -> occurrences for text that is not a date (nor a null placeholder)
+
+    @property
+    def n_unparsable(self):
+        return int(self.unparsable.sum())
+
+
+def detect_formats(text, sample=FORMAT_SAMPLE):
+    """strftime formats guessed from evenly spaced distinct values, most common first."""
+    if text.empty:
+        return []
+    picks = text.iloc[np.linspace(0, len(text) - 1, min(sample, len(text))).astype(int)]
+    with warnings.catch_warnings():
+        # Day-first guesses warn; each format is applied explicitly afterwards
+        warnings.simplefilter("ignore", UserWarning)
+        formats = picks.map(guess_datetime_format).value_counts()
+    return formats.index.tolist()
+
+
+def _to_array(parsed):
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_convert(None)
+    return parsed.to_numpy(dtype=UNIT)
+
+
+def parse_dates(series, cache=None, sample=FORMAT_SAMPLE):
+    """Parse text dates once per distinct string, one vectorized pass per detected format.
+
+    Values matching none of the detected formats go through garbage cleaning
+    (year-only "2021.0" becomes 2021-01-01) and per-value mixed parsing; what
+    still fails is reported in `unparsable` rather than silently dropped.
+    A dict passed as `cache` keeps parsed strings between calls.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return DateParseResult(series, {}, pd.Series(dtype="int64"))
+
+    codes, uniques = pd.factorize(series)
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    parsed = np.full(len(text), np.datetime64("NaT"), dtype=UNIT)
+    todo = np.ones(len(text), dtype=bool)
+    formats = {}
+
+    if cache:
+        hits = text.map(cache)
+        found = hits.notna().to_numpy()
+        parsed[found] = hits[found].to_numpy(dtype="int64").view(UNIT)
+        todo &= ~found
+        formats["cached"] = int(found.sum())
+
+    for fmt in detect_formats(text[todo], sample):
+        idx = np.flatnonzero(todo)
+        if not len(idx):
+            break
+        attempt = pd.to_datetime(text.iloc[idx], format=fmt, errors="coerce")
+        ok = attempt.notna().to_numpy()
+        if ok.any():
+            parsed[idx[ok]] = _to_array(attempt[ok])
+            todo[idx[ok]] = False
+            formats[fmt] = int(ok.sum())
+
+    placeholder = np.zeros(len(text), dtype=bool)
+    idx = np.flatnonzero(todo)
+    if len(idx):
+        cleaned = clean_text(text.iloc[idx])
+        year_only = cleaned.str.match(_YEAR_ONLY).fillna(False).astype(bool)
+        cleaned.loc[year_only] = cleaned.loc[year_only].str.slice(0, 4) + "-01-01"
+        attempt = pd.to_datetime(cleaned, format="mixed", errors="coerce")
+        ok = attempt.notna().to_numpy()
+        if ok.any():
+            parsed[idx[ok]] = _to_array(attempt[ok])
+            todo[idx[ok]] = False
+            formats["mixed"] = int(ok.sum())
+        placeholder[idx] = cleaned.isna().to_numpy()
+
+    if cache is not None and len(cache) < DATE_CACHE_MAX:
+        new = np.flatnonzero(~todo & ~np.isnat(parsed))
+        cache.update(zip(text.iloc[new], parsed[new].view("int64").tolist()))
+
+    bad = np.flatnonzero(todo & ~placeholder)
+    counts = np.bincount(codes[codes >= 0], minlength=len(text))
+    unparsable = pd.Series(counts[bad], index=text.iloc[bad].to_numpy(), dtype="int64").sort_values(ascending=False)
+
+    values = np.append(parsed, np.datetime64("NaT"))[codes]  # code -1 (null) picks the trailing NaT
+    return DateParseResult(pd.Series(values, index=series.index, name=series.name), formats, unparsable)
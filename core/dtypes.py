@@ -0,0 +1,216 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from memory_optimizer import CATEGORY_RATIO, changed_columns, optimize_memory
+from .datetimes import parse_dates
+from .results import ChangeResult
+from .text import NULL_TOKENS, clean_text
+
+DTYPE_OPTIONS = ["int", "float", "str", "datetime", "category"]
+AUTO_SAMPLE_ROWS = 1_000
+MIN_SUCCESS_RATE = 0.9    # share of non-null values that must parse for auto-fix to pick a type
+AUTO_FIX_WORKERS = 4
+FAST_PATH_PROBE = 100      # distinct values tried before choosing the fast or the cleaning path
+
+
+def _failed(parsed, series):
+    return parsed.isna().to_numpy() & series.notna().to_numpy()
+
+
+def parse_numeric(series):
+    """Float values of `series`; garbage-cleaning only runs for values that fail a plain parse.
+
+    Text is parsed once per distinct value (extracts repeat values heavily).
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype("float64")
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, dtype=object)
+    probe = uniques.head(FAST_PATH_PROBE)
+    if pd.to_numeric(probe, errors='coerce').notna().sum() >= len(probe) / 2:
+        parsed = pd.to_numeric(uniques, errors='coerce').astype("float64")
+        failed = _failed(parsed, uniques)
+        if failed.any():
+            parsed[failed] = pd.to_numeric(clean_text(uniques[failed]), errors='coerce').to_numpy(dtype="float64")
+    else:
+        # Mostly dirty: a failing plain parse per value would only cost time
+        parsed = pd.to_numeric(clean_text(uniques), errors='coerce').astype("float64")
+    values = np.append(parsed.to_numpy(), np.nan)[codes]  # code -1 (null) picks the trailing NaN
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def parse_integers(series):
+    """Nullable Int64 values of `series`; integral text is parsed exactly (never through
+    float64, so IDs past 2**53 survive), other numbers are cleaned and truncated."""
+    if pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series.astype("Int64")
+    if pd.api.types.is_numeric_dtype(series):
+        codes, uniques = np.arange(len(series)), pd.Series(series.to_numpy(), dtype=object)
+    else:
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Series(uniques, dtype=object)
+    cleaned = clean_text(uniques)
+    whole = cleaned.str.fullmatch(r"[+-]?\d+", na=False).to_numpy()
+    if whole.any():
+        exact = pd.to_numeric(cleaned[whole], errors="coerce")
+        if not pd.api.types.is_signed_integer_dtype(exact):  # beyond int64: parse as a float below
+            whole[:] = False
+    parsed = pd.array([pd.NA] * len(uniques), dtype="Int64")
+    if whole.any():
+        parsed[whole] = exact.to_numpy(dtype="int64")
+    rest = np.flatnonzero(~whole)
+    if len(rest):
+        floats = parse_numeric(uniques.iloc[rest]).to_numpy()
+        fits = np.isfinite(floats) & (np.abs(floats) < 2.0 ** 63)
+        parsed[rest[fits]] = np.trunc(floats[fits]).astype("int64")
+    return pd.Series(parsed.take(codes, allow_fill=True), index=series.index, name=series.name)
+
+
+def convert_column(series, target_dtype, date_cache=None):
+    """Clean garbage ("1,234%", "--", ...) and convert to int/float/str/datetime/category."""
+    if target_dtype == "datetime":
+        return parse_dates(series, cache=date_cache).values
+    if target_dtype == "category":
+        return clean_text(series).astype("category")
+    if target_dtype == "int":
+        return parse_integers(series).fillna(0).astype("int64")
+    if target_dtype == "float":
+        return parse_numeric(series).astype("float64")
+    if target_dtype == "str":
+        return series.astype(str)
+    raise ValueError(f"Unknown target dtype: {target_dtype}")
+
+
+def convert_dtype(df, column, target_dtype):
+    result = df.copy(deep=False)
+    details = {}
+    if target_dtype == "datetime":
+        # Keep the parse report: detected formats and the values that are not dates
+        parsed = parse_dates(df[column])
+        result[column] = parsed.values
+        details = {"formats": parsed.formats, "unparsable": parsed.unparsable}
+    else:
+        result[column] = convert_column(df[column], target_dtype)
+    return ChangeResult(
+        result, f"Converted '{column}' to {target_dtype}", [column],
+        {"op": "convert", "column": column, "dtype": target_dtype}, changed=1, details=details,
+    )
+
+
+def optimize_dtypes(df):
+    """Memory optimizer as a change; the per-column report is in `details["report"]`."""
+    result, report = optimize_memory(df)
+    changed = changed_columns(report)
+    saved_mb = (report["Bytes Before"].sum() - report["Bytes After"].sum()) / 1024 ** 2
+    return ChangeResult(
+        result, f"Optimized memory of {len(changed)} column(s), saving {saved_mb:.1f} MB", changed,
+        {"op": "astype", "dtypes": report.loc[changed, "Dtype After"].to_dict()}, len(changed),
+        details={"report": report, "saved_mb": saved_mb},
+    )
+
+
+@dataclass
+class ColumnFix:
+    column: str
+    source_dtype: str
+    target_dtype: str   # None when the column is left as is
+    non_null: int       # values that are not nulls or null placeholders
+    parsed: int         # of those, values that converted successfully
+    applied: bool = False
+
+    @property
+    def success_rate(self):
+        return self.parsed / self.non_null if self.non_null else 1.0
+
+
+def _non_null(series):
+    return int(series.notna().sum() - series.isin(NULL_TOKENS).sum())
+
+
+def _is_code(values, numbers):
+    # Zero-padded text ("00123") or integers past float64 precision are identifiers, not quantities
+    padded = values.astype(str).str.strip().str.match(r"[+-]?0\d")
+    return bool(padded.any() or (numbers.abs() >= 2 ** 53).any())
+
+
+def infer_target_dtype(series, sample=AUTO_SAMPLE_ROWS, min_success=MIN_SUCCESS_RATE, category_ratio=CATEGORY_RATIO):
+    """Guess int/float/datetime/category for a text column from a sample; None keeps it as is."""
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return None
+    values = series.dropna()
+    values = values.sample(min(sample, len(values)), random_state=0) if len(values) else values
+    non_null = _non_null(values)
+    if not non_null:
+        return None
+
+    numeric = parse_numeric(values)
+    if numeric.notna().sum() >= min_success * non_null:
+        whole = numeric.dropna()
+        integral = bool((whole == np.floor(whole)).all())
+        if integral and _is_code(values, whole):
+            # Zip codes, account numbers, ...: keep the text, which a number would alter
+            return "category" if values.nunique() <= category_ratio * non_null else None
+        # "int" fills nulls and unparsable values with 0, so only pick it when every value parses
+        complete = numeric.notna().sum() == len(values) and not series.hasnans
+        return "int" if integral and complete else "float"
+    if parse_dates(values).values.notna().sum() >= min_success * non_null:
+        return "datetime"
+    if values.nunique() <= category_ratio * non_null:
+        return "category"
+    return None
+
+
+def _fix_column(series, min_success):
+    target = infer_target_dtype(series, min_success=min_success)
+    if target is None:
+        return ColumnFix(series.name, str(series.dtype), None, int(series.count()), 0), None
+    fix = ColumnFix(series.name, str(series.dtype), target, _non_null(series), 0)
+    if target in ("int", "float"):
+        parsed = parse_integers(series) if target == "int" else parse_numeric(series)
+        if target == "int" and parsed.notna().sum() < series.notna().sum():
+            # The sample parsed fully but the column doesn't: keep the failures as NaN
+            fix.target_dtype = target = "float"
+            parsed = parse_numeric(series)
+        fix.parsed = int(parsed.notna().sum())
+        converted = parsed.fillna(0).astype("int64") if target == "int" else parsed.astype("float64")
+    else:
+        converted = convert_column(series, target)
+        fix.parsed = int(converted.notna().sum())
+    # The sample decided the type; the whole column still has to parse well enough
+    fix.applied = fix.success_rate >= min_success
+    return fix, converted if fix.applied else None
+
+
+def auto_fix_types(df, columns=None, min_success=MIN_SUCCESS_RATE, workers=AUTO_FIX_WORKERS):
+    """Infer and apply target types for many text columns at once.
+
+    Columns are parsed in parallel threads. `details["report"]` lists every
+    column with its inferred type and parse success rate.
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(lambda col: _fix_column(df[col], min_success), columns))
+
+    result = df.copy(deep=False)
+    dtypes = {}
+    for fix, converted in outcomes:
+        if converted is not None:
+            result[fix.column] = converted
+            dtypes[fix.column] = fix.target_dtype
+
+    report = pd.DataFrame({
+        "Dtype Before": [fix.source_dtype for fix, _ in outcomes],
+        "Inferred": [fix.target_dtype or "-" for fix, _ in outcomes],
+        "Parsed": [fix.parsed for fix, _ in outcomes],
+        "Non-null": [fix.non_null for fix, _ in outcomes],
+        "Success %": [round(100 * fix.success_rate, 1) if fix.target_dtype else None for fix, _ in outcomes],
+        "Applied": [fix.applied for fix, _ in outcomes],
+    }, index=pd.Index(columns, name="Column"))
+    return ChangeResult(
+        result, f"Auto-fixed types of {len(dtypes)} column(s)", list(dtypes),
+        {"op": "convert_columns", "dtypes": dtypes}, len(dtypes),
+        details={"report": report, "fixes": [fix for fix, _ in outcomes]},
+    )
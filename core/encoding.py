@@ -0,0 +1,247 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import sparse as sp
+
+from sketches import hash_values
+from .results import ChangeResult
+
+ENCODERS = ["One-Hot Encoding", "Label Encoding", "Target Encoding", "Hashing"]
+OTHER_LEVEL = "Other"
+ONE_HOT_MAX_COLUMNS = 2_000     # new columns one click may create, sparse or not
+ONE_HOT_DENSE_LIMIT_MB = 512    # above this, dense dummies are refused (use sparse or bucketing)
+SPARSE_BYTES_PER_VALUE = 5      # uint8 value + int32 row position per non-zero
+TARGET_SMOOTHING = 10           # pseudo-rows pulling rare categories towards the global mean
+HASH_BUCKETS = 32
+
+
+@dataclass
+class OneHotEstimate:
+    levels: dict        # column -> dummy columns it would create (including "Other")
+    n_rows: int
+    non_null: int       # ones in the output: non-null values over the encoded columns
+
+    @property
+    def new_columns(self):
+        return sum(self.levels.values())
+
+    @property
+    def dense_mb(self):
+        return self.n_rows * self.new_columns / 1024 ** 2
+
+    @property
+    def sparse_mb(self):
+        return self.non_null * SPARSE_BYTES_PER_VALUE / 1024 ** 2
+
+    def problem(self, sparse=False):
+        """Why this encoding should not be applied, or None."""
+        if self.new_columns > ONE_HOT_MAX_COLUMNS:
+            return (f"One-hot would add {self.new_columns:,} columns (limit {ONE_HOT_MAX_COLUMNS:,}); "
+                    f"keep only the top levels or use target/hashing encoding.")
+        if not sparse and self.dense_mb > ONE_HOT_DENSE_LIMIT_MB:
+            return (f"Dense dummies would take about {self.dense_mb:,.0f} MB; "
+                    f"use sparse output or keep fewer levels.")
+        return None
+
+
+def _sorted(levels):
+    try:
+        return sorted(levels)
+    except TypeError:  # mixed types in an object column
+        return sorted(levels, key=str)
+
+
+def map_by_text(series, mapping, default):
+    """Look each value up in `mapping` by its text form, once per distinct value.
+
+    Fitted maps are keyed by text so chunks read with another dtype
+    (e.g. "1" vs 1) still match; nulls and unknown values get `default`.
+    """
+    codes, uniques = pd.factorize(series)
+    lookup = np.array([mapping.get(str(value), default) for value in uniques] + [default])
+    return lookup[codes]  # code -1 (null) picks the trailing default
+
+
+def fit_levels(series, top_k=None, min_frequency=None, counts=None):
+    """Levels kept as dummy columns and whether the rest go to an "Other" column.
+
+    `top_k` keeps the most frequent levels, `min_frequency` those covering at
+    least that share of rows. `counts` can pass precomputed value counts.
+    """
+    if counts is None:
+        counts = series.value_counts()
+    kept = counts
+    if min_frequency:
+        kept = kept[kept >= min_frequency * len(series)]
+    if top_k:
+        kept = kept.head(top_k)
+    if isinstance(series.dtype, pd.CategoricalDtype) and len(kept) == len(counts):
+        return series.cat.categories.tolist(), False
+    return _sorted(kept.index.tolist()), len(kept) < len(counts)
+
+
+def _fit_one_hot(df, columns, top_k, min_frequency, counts):
+    counts = counts or {}
+    categories, other, non_null = {}, {}, 0
+    for col in columns:
+        col_counts = counts.get(col)
+        if col_counts is None:
+            col_counts = df[col].value_counts()
+        categories[col], other[col] = fit_levels(df[col], top_k, min_frequency, col_counts)
+        non_null += int(col_counts.sum())
+    estimate = OneHotEstimate({col: len(categories[col]) + other[col] for col in columns}, len(df), non_null)
+    return categories, other, estimate
+
+
+def estimate_one_hot(df, columns, top_k=None, min_frequency=None, counts=None):
+    """Output size of one_hot_encode with these options, without building it."""
+    return _fit_one_hot(df, columns, top_k, min_frequency, counts)[2]
+
+
+def _dummies(index, codes, names, sparse):
+    # codes: dummy position per row, -1 = all zeros
+    rows = np.flatnonzero(codes >= 0)
+    if sparse:
+        matrix = sp.csc_matrix((np.ones(len(rows), dtype=np.uint8), (rows, codes[rows])),
+                               shape=(len(index), len(names)))
+        return pd.DataFrame.sparse.from_spmatrix(matrix, index=index, columns=names)
+    dense = np.zeros((len(index), len(names)), dtype=np.uint8)
+    dense[rows, codes[rows]] = 1
+    return pd.DataFrame(dense, index=index, columns=names)
+
+
+def one_hot_frame(series, levels, other=False, sparse=False):
+    """uint8 (or sparse uint8) dummy columns of `series` for fitted `levels`."""
+    codes = map_by_text(series, {str(level): i for i, level in enumerate(levels)}, -1)
+    names = [f"{series.name}_{level}" for level in levels]
+    if other:
+        codes = np.where((codes == -1) & series.notna().to_numpy(), len(levels), codes)
+        names.append(f"{series.name}_{OTHER_LEVEL}")
+    return _dummies(series.index, codes, names, sparse)
+
+
+def hash_frame(series, n_buckets=HASH_BUCKETS, sparse=False):
+    """Hashing trick: one indicator column per hash bucket of the value's text form."""
+    codes, uniques = pd.factorize(series)
+    buckets = (hash_values(pd.Series(uniques).astype(str)) % np.uint64(n_buckets)).astype(np.int64)
+    codes = np.append(buckets, -1)[codes]
+    names = [f"{series.name}_hash_{i}" for i in range(n_buckets)]
+    return _dummies(series.index, codes, names, sparse)
+
+
+def densify(df):
+    """Copy with sparse columns made dense (Arrow, and so st.dataframe, rejects sparse data)."""
+    sparse = {col: dtype.subtype for col, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)}
+    return df.astype(sparse) if sparse else df
+
+
+def _attach(df, encoded, columns, replace):
+    base = df.drop(columns=columns) if replace else df
+    return pd.concat([base, *encoded], axis=1)
+
+
+def one_hot_encode(df, columns, replace=False, top_k=None, min_frequency=None, sparse=False, counts=None):
+    """uint8 dummy columns (sparse when `sparse`), levels outside the top-k /
+    minimum frequency going to one "Other" column per encoded column.
+
+    Raises ValueError when the output would be too large (see OneHotEstimate.problem).
+    """
+    categories, other, estimate = _fit_one_hot(df, columns, top_k, min_frequency, counts)
+    problem = estimate.problem(sparse)
+    if problem:
+        raise ValueError(problem)
+
+    encoded = [one_hot_frame(df[col], categories[col], other[col], sparse) for col in columns]
+    result = _attach(df, encoded, columns, replace)
+
+    new_columns = [name for frame in encoded for name in frame.columns]
+    touched = new_columns + (columns if replace else [])
+    mode = "Replace original columns" if replace else "Add new columns"
+    step = {"op": "one_hot", "columns": columns, "categories": categories, "other": other,
+            "replace": replace, "sparse": sparse}
+    return ChangeResult(result, f"Encoded columns {columns} using One-Hot Encoding ({mode}).", touched, step,
+                        len(new_columns), {"estimate": estimate})
+
+
+def target_encode(df, columns, target, replace=False, smoothing=TARGET_SMOOTHING):
+    """Replace each category by the smoothed mean of `target` over its rows.
+
+    Nulls and categories unseen at fit time get the global mean.
+    """
+    y = pd.to_numeric(df[target], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    prior = float(np.nanmean(y))
+    result = df.copy(deep=False)
+    suffix = None if replace else "_target"
+    maps = {}
+    for col in columns:
+        codes, uniques = pd.factorize(df[col])
+        valid = (codes >= 0) & ~np.isnan(y)
+        sums = np.bincount(codes[valid], weights=y[valid], minlength=len(uniques))
+        n = np.bincount(codes[valid], minlength=len(uniques))
+        means = (sums + smoothing * prior) / (n + smoothing)
+        result[col + (suffix or "")] = np.append(means, prior)[codes]
+        maps[col] = {str(value): float(mean) for value, mean in zip(uniques, means)}
+
+    touched = [col + (suffix or "") for col in columns]
+    mode = "Replace original columns" if replace else "Add new columns"
+    step = {"op": "target_encode", "columns": columns, "target": target, "maps": maps, "default": prior,
+            "suffix": suffix}
+    return ChangeResult(result, f"Encoded columns {columns} using Target Encoding on '{target}' ({mode}).",
+                        touched, step, len(columns))
+
+
+def hash_encode(df, columns, replace=False, n_buckets=HASH_BUCKETS, sparse=False):
+    encoded = [hash_frame(df[col], n_buckets, sparse) for col in columns]
+    result = _attach(df, encoded, columns, replace)
+    new_columns = [name for frame in encoded for name in frame.columns]
+    touched = new_columns + (columns if replace else [])
+    mode = "Replace original columns" if replace else "Add new columns"
+    step = {"op": "hash_encode", "columns": columns, "n_buckets": n_buckets, "replace": replace, "sparse": sparse}
+    return ChangeResult(result, f"Encoded columns {columns} using Hashing into {n_buckets} buckets ({mode}).",
+                        touched, step, len(new_columns))
+
+
+def _narrowest_int(n_classes):
+    # Signed so the null sentinel -1 fits: int8 up to 128 classes, then int16, ...
+    return np.min_scalar_type(-max(n_classes, 1))
+
+
+def label_codes(series):
+    """(codes, classes) in one factorize pass: classes sorted (categories keep
+    their order), nulls coded -1, codes in the narrowest signed integer dtype."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, classes = series.cat.codes.to_numpy(), series.cat.categories.tolist()
+    else:
+        try:
+            codes, uniques = pd.factorize(series, sort=True)
+        except TypeError:  # mixed types in an object column
+            codes, uniques = pd.factorize(series)
+        classes = uniques.tolist()
+    return codes.astype(_narrowest_int(len(classes))), classes
+
+
+def encode_labels(series, classes):
+    """Codes of `series` against fitted `classes`; nulls and unseen values become -1."""
+    codes = map_by_text(series, {str(value): i for i, value in enumerate(classes)}, -1)
+    return codes.astype(_narrowest_int(len(classes)))
+
+
+def decode_labels(codes, classes):
+    """Inverse of label encoding: original values, with NaN for the -1 sentinel."""
+    lookup = np.array(list(classes) + [np.nan], dtype=object)
+    values = lookup[np.asarray(codes, dtype=np.int64)]  # -1 picks the trailing NaN
+    return pd.Series(values, index=getattr(codes, "index", None), name=getattr(codes, "name", None))
+
+
+def label_encode(df, columns, replace=False):
+    suffix = None if replace else "_label"
+    encoded, classes = {}, {}
+    for col in columns:
+        encoded[col + (suffix or "")], classes[col] = label_codes(df[col])
+    result = df.assign(**encoded)
+
+    touched = list(encoded)
+    mode = "Replace original columns" if replace else "Add new columns"
+    step = {"op": "label_encode", "columns": columns, "classes": classes, "suffix": suffix, "null_code": -1}
+    return ChangeResult(result, f"Encoded columns {columns} using Label Encoding ({mode}).", touched, step, len(columns))
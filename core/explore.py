@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from correlation import high_correlation_pairs
+
+HIGH_NULL_SHARE = 0.5
+HIGH_CARDINALITY = 50
+CORRELATION_THRESHOLD = 0.7
+
+
+@dataclass
+class FeatureOverview:
+    numeric_columns: list
+    categorical_columns: list
+    date_columns: list
+    constant_columns: list
+    high_null_columns: list         # more than HIGH_NULL_SHARE missing
+    high_cardinality_columns: list  # categorical with more than HIGH_CARDINALITY levels
+
+
+def feature_overview(df, profile):
+    cat_cols = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
+    null_share = profile.null_counts() / max(profile.n_rows, 1)
+    return FeatureOverview(
+        numeric_columns=df.select_dtypes(include='number').columns.tolist(),
+        categorical_columns=cat_cols,
+        date_columns=df.select_dtypes(include='datetime64').columns.tolist(),
+        constant_columns=profile.constant_columns(),
+        high_null_columns=null_share[null_share > HIGH_NULL_SHARE].index.tolist(),
+        high_cardinality_columns=[col for col in cat_cols if profile.columns[col].distinct > HIGH_CARDINALITY],
+    )
+
+
+def pair_correlation(df, x, y):
+    return df[[x, y]].corr().iloc[0, 1]
+
+
+def correlated_pairs(corr, threshold=CORRELATION_THRESHOLD):
+    # Heatmap values are shown rounded, so the pairs are picked from the rounded matrix
+    return high_correlation_pairs(corr.round(2), threshold, inclusive=True)
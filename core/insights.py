@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+
+import pandas as pd
+
+from correlation import correlation_matrix, high_correlation_pairs
+from profiler import DatasetProfile, profile_dataset
+
+HIGH_CORRELATION = 0.85
+HIGH_CARDINALITY_RATIO = 0.9
+
+
+@dataclass
+class Insights:
+    profile: DatasetProfile
+    correlation: pd.DataFrame
+    high_correlations: list      # (col_a, col_b, r) with |r| above HIGH_CORRELATION
+    constant_columns: list
+    high_cardinality_columns: list
+
+    def numeric_nulls(self, top=5):
+        nulls = self.profile.null_counts()[self.profile.numeric_columns].sort_values(ascending=False)
+        return nulls[nulls > 0].head(top)
+
+    def to_dict(self):
+        # JSON-friendly summary, used by the headless CLI
+        nulls = self.profile.null_counts()
+        return {
+            "rows": self.profile.n_rows,
+            "columns": self.profile.n_cols,
+            "dtypes": self.profile.dtypes().astype(str).to_dict(),
+            "null_counts": {col: int(n) for col, n in nulls[nulls > 0].items()},
+            "constant_columns": self.constant_columns,
+            "high_correlations": [[a, b, round(float(r), 4)] for a, b, r in self.high_correlations],
+            "high_cardinality_columns": self.high_cardinality_columns,
+            "top_categories": {
+                col: {str(k): int(v) for k, v in self.profile.columns[col].top_values.head(5).items()}
+                for col in self.profile.categorical_columns
+            },
+            "correlation_sampled_rows": self.correlation.attrs.get("sampled_rows"),
+            "sketched_columns": {
+                col: {"distinct_error": p.distinct_error, "top_error": p.top_error, "quantile_error": p.quantile_error}
+                for col, p in self.profile.columns.items() if p.approximate
+            },
+        }
+
+
+def compute_insights(df, profile=None, corr=None):
+    """All statistics behind the Insights tab, without rendering anything."""
+    if profile is None:
+        profile = profile_dataset(df)
+    if corr is None:
+        corr = correlation_matrix(df, profile.numeric_columns)
+    return Insights(
+        profile=profile,
+        correlation=corr,
+        high_correlations=high_correlation_pairs(corr, HIGH_CORRELATION),
+        constant_columns=profile.constant_columns(),
+        high_cardinality_columns=profile.high_cardinality_columns(HIGH_CARDINALITY_RATIO),
+    )
@@ -0,0 +1,222 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .results import ChangeResult
+
+METHODS = ["IQR", "Z-score", "Modified Z-score (MAD)", "Isolation Forest"]
+DEFAULT_THRESHOLDS = {"IQR": 1.5, "Z-score": 3.0, "Modified Z-score (MAD)": 3.5, "Isolation Forest": 0.05}
+ACTIONS = ["Remove rows", "Clip to bounds", "Set to NaN"]
+BLOCK_COLUMNS = 32            # columns converted to one float block at a time
+FOREST_FIT_ROWS = 100_000     # Isolation Forest is fitted on at most this many rows
+FOREST_SCORE_ROWS = 65_536    # rows walked through the trees at a time (fits in cache)
+MAD_SCALE = 0.6745            # makes the MAD of a normal distribution comparable to its std
+
+
+@dataclass
+class OutlierScan:
+    """Outlier flags for many columns, stored as bit-packed masks (1 bit per row and column).
+
+    `bounds` holds the lower/upper limits of the univariate methods (None
+    for Isolation Forest, which flags whole rows in `rows_bitmap` and keeps
+    its fitted trees in `forest`).
+    """
+    method: str
+    threshold: float
+    columns: list
+    n_rows: int
+    bounds: pd.DataFrame = None
+    bitmaps: dict = field(default_factory=dict)
+    rows_bitmap: np.ndarray = None
+    forest: dict = None
+
+    def mask(self, column=None):
+        """Boolean mask of flagged rows for one column, or for any column when None."""
+        bits = self.rows_bitmap if column is None else self.bitmaps[column]
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
+
+    def positions(self, column=None):
+        return np.flatnonzero(self.mask(column))
+
+    def summary(self):
+        if not self.bitmaps:  # multivariate: one verdict per row
+            counts = {f"{len(self.columns)} columns combined": int(self.mask().sum())}
+        else:
+            counts = {col: int(np.unpackbits(bits, count=self.n_rows).sum()) for col, bits in self.bitmaps.items()}
+        summary = pd.DataFrame({"Outliers": pd.Series(counts, dtype="int64")}).rename_axis("Column")
+        summary["Share %"] = (100 * summary["Outliers"] / max(self.n_rows, 1)).round(2)
+        if self.bounds is not None:
+            summary = self.bounds.join(summary)
+        return summary.sort_values("Outliers", ascending=False)
+
+    def page(self, df, page, page_size=50, column=None):
+        """Flagged rows `page * page_size` onwards, with the columns that flagged each row."""
+        positions = self.positions(column)[page * page_size:(page + 1) * page_size]
+        rows = df.iloc[positions]
+        if self.bitmaps:
+            flags = np.column_stack([self.mask(col)[positions] for col in self.columns])
+            rows = rows.assign(**{"Flagged In": [", ".join(np.asarray(self.columns)[hit]) for hit in flags]})
+        return rows
+
+
+def _bounds(block, method, threshold, quartiles=None):
+    if method == "IQR":
+        if quartiles is None:
+            quartiles = np.nanpercentile(block, [25, 75], axis=0)
+        q1, q3 = quartiles
+        return q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+    if method == "Z-score":
+        mean, std = np.nanmean(block, axis=0), np.nanstd(block, axis=0, ddof=1)
+        return mean - threshold * std, mean + threshold * std
+    if method == "Modified Z-score (MAD)":
+        median = np.nanmedian(block, axis=0)
+        mad = np.nanmedian(np.abs(block - median), axis=0)
+        return median - threshold * mad / MAD_SCALE, median + threshold * mad / MAD_SCALE
+    raise ValueError(f"Unknown outlier method: {method}")
+
+
+def _average_path_length(n):
+    # Expected depth of an unsuccessful search in a binary tree of n samples (as in sklearn)
+    n = np.asarray(n, dtype="float64")
+    length = np.where(n == 2, 1.0, 0.0)
+    big = n > 2
+    length[big] = 2.0 * (np.log(n[big] - 1.0) + np.euler_gamma) - 2.0 * (n[big] - 1.0) / n[big]
+    return length
+
+
+def _fill_missing(values, fill):
+    values = np.where(np.isnan(values), fill, values)
+    return np.nan_to_num(values)  # all-null columns
+
+
+def _fit_forest(df, columns, contamination, random_state):
+    from sklearn.ensemble import IsolationForest
+
+    values = df[columns].to_numpy(dtype="float64", na_value=np.nan)
+    fill = np.nan_to_num(np.nanmedian(values, axis=0)) if len(values) else np.zeros(len(columns))
+    values = _fill_missing(values, fill)
+    rng = np.random.default_rng(random_state)
+    fit_rows = values[rng.choice(len(values), FOREST_FIT_ROWS, replace=False)] if len(values) > FOREST_FIT_ROWS else values
+    forest = IsolationForest(contamination=contamination, random_state=random_state, n_jobs=-1).fit(fit_rows)
+    # Fitted trees as plain lists, so the rule can be saved in a pipeline and replayed without sklearn
+    trees = [{"features": features.tolist(), "left": tree.tree_.children_left.tolist(),
+              "right": tree.tree_.children_right.tolist(), "feature": tree.tree_.feature.tolist(),
+              "threshold": tree.tree_.threshold.tolist(), "samples": tree.tree_.n_node_samples.tolist()}
+             for tree, features in zip(forest.estimators_, forest.estimators_features_)]
+    return {"columns": list(columns), "fill": fill.tolist(), "trees": trees, "max_samples": int(forest.max_samples_),
+            "offset": float(forest.offset_), "contamination": contamination, "random_state": random_state}
+
+
+def _flat_tree(tree):
+    # Node arrays of one tree; leaves point to themselves, so every row can take the same number of steps
+    left, right = np.asarray(tree["left"]), np.asarray(tree["right"])
+    leaf = left == -1
+    nodes = np.arange(len(left))
+    children = np.column_stack([np.where(leaf, nodes, left), np.where(leaf, nodes, right)]).ravel()
+    feature = np.asarray(tree["features"])[np.where(leaf, 0, tree["feature"])]
+    threshold = np.where(leaf, np.inf, tree["threshold"])
+    node_depth = np.zeros(len(left))
+    for parent in nodes[~leaf]:  # children are numbered after their parent
+        node_depth[left[parent]] = node_depth[right[parent]] = node_depth[parent] + 1
+    return children, feature, threshold, node_depth, node_depth + _average_path_length(tree["samples"])
+
+
+def forest_outliers(df, forest):
+    """Rows an Isolation Forest fitted by detect_outliers (`scan.forest`) flags as outliers."""
+    values = _fill_missing(df[forest["columns"]].to_numpy(dtype="float64", na_value=np.nan), forest["fill"])
+    values = values.astype(np.float32)  # sklearn's trees split float32 values
+    trees = [_flat_tree(tree) for tree in forest["trees"]]
+    depths = np.zeros(len(values))
+    for start in range(0, len(values), FOREST_SCORE_ROWS):
+        block = values[start:start + FOREST_SCORE_ROWS].ravel()
+        offsets = np.arange(0, len(block), values.shape[1])
+        total = depths[start:start + FOREST_SCORE_ROWS]
+        for children, feature, threshold, node_depth, path_length in trees:
+            node = np.zeros(len(offsets), dtype=np.intp)
+            for _ in range(int(node_depth.max())):
+                right = block.take(offsets + feature.take(node)) > threshold.take(node)
+                node = children.take(2 * node + right)
+            total += path_length.take(node)
+    scores = -(2 ** (-depths / (len(forest["trees"]) * _average_path_length([forest["max_samples"]])[0])))
+    return scores - forest["offset"] < 0
+
+
+def detect_outliers(df, columns=None, method="IQR", threshold=None, profile=None, random_state=0):
+    """Flag outliers in every numeric column in one vectorized pass per block of columns.
+
+    IQR quartiles come from `profile` when given. For Isolation Forest,
+    `threshold` is the expected share of outliers (contamination).
+    """
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns.tolist()
+    threshold = DEFAULT_THRESHOLDS[method] if threshold is None else threshold
+    scan = OutlierScan(method, threshold, list(columns), len(df))
+
+    if method == "Isolation Forest":
+        rows = np.zeros(len(df), bool)
+        if len(df) and columns:
+            scan.forest = _fit_forest(df, columns, threshold, random_state)
+            rows = forest_outliers(df, scan.forest)
+        scan.rows_bitmap = np.packbits(rows)
+        return scan
+
+    lower, upper = [], []
+    any_row = np.zeros(len(df), dtype=bool)
+    for start in range(0, len(columns), BLOCK_COLUMNS):
+        block_cols = columns[start:start + BLOCK_COLUMNS]
+        block = df[block_cols].to_numpy(dtype="float64", na_value=np.nan)
+        quartiles = None
+        if method == "IQR" and profile is not None:
+            quartiles = np.array([[profile.columns[c].q25 for c in block_cols], [profile.columns[c].q75 for c in block_cols]])
+        lo, hi = _bounds(block, method, threshold, quartiles)
+        flagged = (block < lo) | (block > hi)  # NaN compares False: never an outlier
+        any_row |= flagged.any(axis=1)
+        for i, col in enumerate(block_cols):
+            scan.bitmaps[col] = np.packbits(flagged[:, i])
+        lower.extend(lo.tolist())
+        upper.extend(hi.tolist())
+
+    scan.rows_bitmap = np.packbits(any_row)
+    scan.bounds = pd.DataFrame({"Lower": lower, "Upper": upper}, index=pd.Index(columns, name="Column"))
+    return scan
+
+
+def apply_outlier_rule(df, scan, action="Remove rows", keep=()):
+    """Bulk rule over every scanned column.
+
+    "Remove rows" drops rows flagged in any column (except row positions in
+    `keep`); "Clip to bounds" and "Set to NaN" only change the flagged values.
+    """
+    bounds = None if scan.bounds is None else {col: [lo, hi] for col, (lo, hi) in scan.bounds.iterrows()}
+    if action == "Remove rows":
+        flagged = scan.mask()
+        flagged[list(keep)] = False
+        dropped = np.flatnonzero(flagged)
+        result = df.iloc[np.flatnonzero(~flagged)]
+        changed = len(dropped)
+        # Replays as the bounds (or fitted forest) rule; rows kept by hand are specific to this file
+        if bounds is not None:
+            step = {"op": "filter_bounds", "bounds": bounds}
+        else:
+            step = {"op": "filter_forest", "forest": scan.forest} if scan.forest is not None else None
+        return ChangeResult(result, f"Removed {changed} outlier rows ({scan.method}, {len(scan.columns)} columns)",
+                            step=step, changed=changed, dropped=dropped)
+
+    if bounds is None:
+        raise ValueError(f"{action} needs per-column bounds; {scan.method} only flags rows")
+    result = df.copy(deep=False)
+    changed = 0
+    for col, (lo, hi) in bounds.items():
+        mask = scan.mask(col)
+        if not mask.any():
+            continue
+        changed += int(mask.sum())
+        if action == "Clip to bounds":
+            result[col] = df[col].clip(lo, hi)
+        else:
+            result[col] = df[col].mask(mask)
+    op = "clip_bounds" if action == "Clip to bounds" else "null_bounds"
+    verb = "Clipped" if action == "Clip to bounds" else "Set to NaN"
+    return ChangeResult(result, f"{verb} {changed} outlier values ({scan.method}, {len(scan.columns)} columns)",
+                        list(bounds), {"op": op, "bounds": bounds}, changed)
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ChangeResult:
+    """Outcome of a dataset modification.
+
+    `df` is the new version (the input is never mutated), `message` the
+    change-log entry, `columns` the touched columns (None = rows changed)
+    and `step` the replayable pipeline step with its fitted parameters.
+    """
+    df: pd.DataFrame
+    message: str = None
+    columns: list = None
+    step: dict = None
+    changed: int = 0                          # rows dropped / values filled / columns created
+    details: dict = field(default_factory=dict)
+    dropped: np.ndarray = None                # row positions removed, for changes that drop rows
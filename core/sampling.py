@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+EXPLORE_SAMPLE_ROWS = 50_000   # rows behind interactive charts and previews
+MAX_STRATA = 100               # most distinct values of a column offered for stratification
+Z_95 = 1.959964
+
+
+@dataclass
+class ExplorationSample:
+    df: pd.DataFrame
+    n_total: int
+    stratify: str = None
+
+    @property
+    def is_sample(self):
+        return len(self.df) < self.n_total
+
+    @property
+    def fraction(self):
+        return len(self.df) / max(self.n_total, 1)
+
+
+@dataclass
+class Estimate:
+    """Point estimate with a 95% confidence interval (lo == hi == value when exact)."""
+    value: float
+    lo: float
+    hi: float
+    n: int
+
+    def __format__(self, spec):
+        spec = spec or ".2f"
+        if self.lo == self.hi or np.isnan(self.lo):
+            return format(self.value, spec)
+        return f"{self.value:{spec}} (95% CI {self.lo:{spec}} to {self.hi:{spec}})"
+
+
+def reservoir_sample(df, size=EXPLORE_SAMPLE_ROWS, stratify=None, random_state=0):
+    """Uniform sample without replacement, or stratified with proportional allocation.
+
+    Like the streaming reservoir, every row draws a uniform random key and
+    the smallest keys win (per stratum when `stratify` is given, with at
+    least one row per stratum so rare categories stay visible).
+    Row order and index labels are preserved.
+    """
+    n = len(df)
+    if n <= size:
+        return ExplorationSample(df, n, stratify)
+    keys = np.random.default_rng(random_state).random(n)
+
+    if stratify is None:
+        keep = np.sort(np.argpartition(keys, size)[:size])
+    else:
+        codes, _ = pd.factorize(df[stratify], use_na_sentinel=False)
+        counts = np.bincount(codes)
+        quota = np.maximum(np.round(counts * size / n), 1)
+        rank = pd.Series(keys).groupby(codes).rank(method="first").to_numpy()
+        keep = np.flatnonzero(rank <= quota[codes])
+    return ExplorationSample(df.iloc[keep], n, stratify)
+
+
+def _finite(n, n_total):
+    # Finite population correction: the interval shrinks to nothing as the sample covers the data
+    return np.sqrt(max(n_total - n, 0) / max(n_total - 1, 1)) if n_total else 1.0
+
+
+def mean_estimate(series, n_total=None):
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    values = values[~np.isnan(values)]
+    n = values.size
+    if n < 2:
+        return Estimate(np.nan, np.nan, np.nan, n)
+    mean = float(values.mean())
+    half = Z_95 * values.std(ddof=1) / np.sqrt(n) * (_finite(n, n_total) if n_total else 1.0)
+    return Estimate(mean, mean - half, mean + half, n)
+
+
+def skew_estimate(series, exact=False):
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    values = values[~np.isnan(values)]
+    n = values.size
+    skew = float(pd.Series(values).skew()) if n else np.nan
+    if exact or n < 4:
+        return Estimate(skew, skew, skew, n)
+    # Standard error of the sample skewness under normality
+    se = np.sqrt(6.0 * n * (n - 1) / ((n - 2) * (n + 1) * (n + 3)))
+    return Estimate(skew, skew - Z_95 * se, skew + Z_95 * se, n)
+
+
+def correlation_estimate(df, x, y, exact=False):
+    pair = df[[x, y]].dropna()
+    n = len(pair)
+    r = pair[x].corr(pair[y]) if n > 1 else np.nan
+    if exact or n < 4 or np.isnan(r) or abs(r) >= 1:
+        return Estimate(r, r, r, n)
+    # Fisher z-transform
+    z, se = np.arctanh(r), 1 / np.sqrt(n - 3)
+    return Estimate(r, float(np.tanh(z - Z_95 * se)), float(np.tanh(z + Z_95 * se)), n)
+
+
+def stratify_candidates(df, profile):
+    cat_cols = df.select_dtypes(include=['object', 'category', 'string', 'bool']).columns
+    return [col for col in cat_cols if 1 < profile.columns[col].distinct <= MAX_STRATA]
@@ -0,0 +1,64 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .results import ChangeResult
+
+SCALERS = ["StandardScaler", "MinMaxScaler", "RobustScaler"]
+SCALE_DTYPES = ["float64", "float32"]
+
+
+def fit_scaler(block, method):
+    """Per-column (center, scale) of a 2-D float array, ignoring NaNs.
+
+    Every scaler reduces to (x - center) / scale; constant or all-null
+    columns get scale 1 (as sklearn does) so they map to 0 / stay NaN.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-null columns
+        if method == "StandardScaler":
+            center = np.nanmean(block, axis=0, dtype=np.float64)
+            scale = np.nanstd(block, axis=0, dtype=np.float64)
+        elif method == "MinMaxScaler":
+            center = np.nanmin(block, axis=0).astype(np.float64)
+            scale = np.nanmax(block, axis=0) - center
+        elif method == "RobustScaler":
+            q1, center, q3 = np.nanpercentile(block, [25, 50, 75], axis=0).astype(np.float64)
+            scale = q3 - q1
+        else:
+            raise ValueError(f"Unknown scaler: {method}")
+    scale = np.where((scale == 0) | np.isnan(scale), 1.0, scale)
+    return np.nan_to_num(center), scale
+
+
+def apply_scaler(block, center, scale):
+    # In place on the (already copied) float block
+    block -= np.asarray(center, dtype=block.dtype)
+    block /= np.asarray(scale, dtype=block.dtype)
+    return block
+
+
+def assign_block(df, block, columns):
+    """`df` with `columns` (existing or new) set from the 2-D `block`, without copying it."""
+    scaled = pd.DataFrame(block, index=df.index, columns=columns, copy=False)
+    order = list(df.columns) + [col for col in columns if col not in df.columns]
+    return pd.concat([df.drop(columns=[col for col in columns if col in df.columns]), scaled], axis=1)[order]
+
+
+def scale_columns(df, columns, method, suffix=None, dtype="float64"):
+    """Fit `method` on `columns`; replaces them, or adds `<col><suffix>` columns when a suffix is given.
+
+    Works on one float block (`dtype` float64 or float32) taken from the
+    frame, so the index is kept and NaNs pass through unscaled.
+    """
+    block = df[columns].to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+    center, scale = fit_scaler(block, method)
+    apply_scaler(block, center, scale)
+
+    touched = [col + (suffix or "") for col in columns]
+    result = assign_block(df, block, touched)
+
+    mode = "Replace original columns" if suffix is None else f"Add new columns (suffix: {suffix})"
+    step = {"op": "scale", "columns": columns, "center": center, "scale": scale, "suffix": suffix, "dtype": dtype}
+    return ChangeResult(result, f"Scaled columns {columns} using {method} ({mode}).", touched, step, len(columns))
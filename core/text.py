@@ -0,0 +1,11 @@
+import numpy as np
+
+NULL_TOKENS = ["", " ", "NaN", "nan", "None", "null", "--"]
+
+
+def clean_text(series):
+    """Strip whitespace, "%" and thousands separators; null placeholders become NaN."""
+    cleaned = series.astype(str).str.strip()
+    cleaned = cleaned.str.replace('%', '', regex=False)
+    cleaned = cleaned.str.replace(',', '', regex=False)
+    return cleaned.replace(NULL_TOKENS, np.nan)
@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import special
+from scipy.stats import boxcox, yeojohnson
+
+from .results import ChangeResult
+
+SKEW_THRESHOLD = 0.7
+TRANSFORMS = ["Log", "Square Root", "Box-Cox", "Yeo-Johnson"]
+AUTO = "Auto (lowest skew)"
+SUFFIXES = {"Log": "_log", "Square Root": "_sqrt", "Box-Cox": "_boxcox", "Yeo-Johnson": "_yeojohnson"}
+FIT_SAMPLE_ROWS = 100_000   # lambdas and skews are fitted on at most this many non-null values
+TRANSFORM_WORKERS = 4
+
+
+def skewed_columns(profile, columns, threshold=SKEW_THRESHOLD):
+    """Skewness of `columns` above |threshold|, most right-skewed first."""
+    skew = pd.Series({c: profile.columns[c].skew for c in columns}, dtype=float).sort_values(ascending=False)
+    return skew[abs(skew) > threshold]
+
+
+def fit_transform_params(values, method):
+    """Parameters of `method` fitted on non-null float `values`.
+
+    Log, square root and Box-Cox need a minimum of 0 (Box-Cox: 1), so
+    negative data is shifted up first; values below the fitted minimum
+    are later clipped to it instead of turning into NaN.
+    """
+    low = float(values.min())
+    if method == "Yeo-Johnson":
+        return {"lmbda": float(yeojohnson(values)[1])}
+    if method == "Box-Cox":
+        shift = 1.0 - low if low <= 0 else 0.0
+        return {"shift": shift, "lower": low + shift, "lmbda": float(boxcox(values + shift)[1])}
+    if method in ("Log", "Square Root"):
+        shift = -low if low < 0 else 0.0
+        return {"shift": shift, "lower": low + shift}
+    raise ValueError(f"Unknown transformation: {method}")
+
+
+def apply_transform(values, method, params):
+    """Transform a float array with fitted `params`; NaNs stay NaN."""
+    if method == "Yeo-Johnson":
+        out = np.full(values.shape, np.nan)
+        valid = ~np.isnan(values)
+        out[valid] = yeojohnson(values[valid], lmbda=params["lmbda"])
+        return out
+    x = values + params.get("shift", 0.0)
+    if params.get("lower") is not None:
+        x = np.maximum(x, params["lower"])  # NaN propagates through maximum
+    if method == "Log":
+        return np.log1p(x)
+    if method == "Square Root":
+        return np.sqrt(x)
+    if method == "Box-Cox":
+        return special.boxcox(x, params["lmbda"])
+    raise ValueError(f"Unknown transformation: {method}")
+
+
+def _skew(values):
+    return float(pd.Series(values).skew())
+
+
+def _fit_column(series, methods, sample_rows, random_state):
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    valid = values[~np.isnan(values)]
+    if len(valid) > sample_rows:
+        valid = np.random.default_rng(random_state).choice(valid, sample_rows, replace=False)
+    if len(valid) < 3:
+        return None
+    candidates = {}
+    for method in methods:
+        try:
+            params = fit_transform_params(valid, method)
+        except ValueError:  # e.g. Box-Cox on constant data
+            continue
+        candidates[method] = (params, _skew(apply_transform(valid, method, params)))
+    if not candidates:
+        return None
+    best = min(candidates, key=lambda m: abs(candidates[m][1]) if np.isfinite(candidates[m][1]) else np.inf)
+    params = candidates[best][0]
+    row = {"Column": series.name, "Skew Before": _skew(valid),
+           **{f"Skew ({m})": skew for m, (_, skew) in candidates.items()},
+           "Chosen": best, "Skew After": candidates[best][1]}
+    return best, params, apply_transform(values, best, params), row
+
+
+def correct_skew(df, columns, method=AUTO, replace=False, sample_rows=FIT_SAMPLE_ROWS,
+                 workers=TRANSFORM_WORKERS, random_state=0):
+    """Transform many skewed columns at once.
+
+    Every candidate transform (all of TRANSFORMS for AUTO) is fitted on the
+    column's non-null values - a sample of `sample_rows` for large data -
+    and the one leaving the smallest |skew| is applied to the whole column.
+    Columns run in parallel threads. `details["report"]` lists the skew
+    before and after each candidate.
+    """
+    methods = TRANSFORMS if method == AUTO else [method]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(lambda col: _fit_column(df[col], methods, sample_rows, random_state), columns))
+
+    transforms, new_values, rows = {}, {}, []
+    for col, outcome in zip(columns, outcomes):
+        if outcome is None:
+            continue
+        chosen, params, values, row = outcome
+        target = col if replace else col + SUFFIXES[chosen]
+        transforms[col] = {"method": chosen, "target": target, **params}
+        new_values[target] = values
+        rows.append(row)
+    result = df.assign(**new_values)
+
+    report = pd.DataFrame(rows)
+    touched = list(new_values)
+    mode = "Replace original" if replace else "Add as new column"
+    label = ", ".join(f"{col} ({t['method']})" for col, t in transforms.items())
+    step = {"op": "transform_columns", "transforms": transforms}
+    return ChangeResult(result, f"Transformed {label} to reduce skew ({mode}).", touched, step, len(touched),
+                        {"report": report})
+
+
+def transform_column(df, column, method, replace=False):
+    return correct_skew(df, [column], method, replace)
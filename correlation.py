@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+# Rough budget (rows x columns^2 multiply-adds) above which approximate mode samples rows
+APPROX_CELL_BUDGET = 2e9
+
+
+def approximate_row_budget(n_rows, n_cols, budget=APPROX_CELL_BUDGET):
+    if n_cols < 2:
+        return None
+    max_rows = int(budget // (n_cols * n_cols))
+    return max(max_rows, 1_000) if max_rows < n_rows else None
+
+
+class CorrelationAccumulator:
+    """Pairwise-complete sufficient statistics, updatable one block of rows at a time.
+
+    Values are centered in float64 and the per-block products run in float32;
+    totals are kept in float64 so that chunked (streamed) input gives the
+    same matrix as a single block.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.shift = None
+        self.n = np.zeros((k, k))
+        self.sx = np.zeros((k, k))
+        self.sxx = np.zeros((k, k))
+        self.sxy = np.zeros((k, k))
+
+    def update(self, block):
+        x = block[self.columns].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        present = ~np.isnan(x)
+        m = present.astype(np.float32)
+        x[~present] = 0
+
+        # Centering before the float32 cast keeps large offsets (epoch timestamps,
+        # IDs) from eating the digits; the pairwise formulas are shift-invariant,
+        # so the first block's means serve every block.
+        if self.shift is None:
+            self.shift = x.sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+        x -= self.shift
+        x[~present] = 0
+        x = x.astype(np.float32)
+
+        self.n += m.T @ m            # rows where both columns are present
+        self.sx += x.T @ m           # sx[i, j] = sum of x_i over those rows
+        self.sxx += (x * x).T @ m
+        self.sxy += x.T @ x
+
+    def matrix(self):
+        n, sx = self.n, self.sx
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = self.sxy - sx * sx.T / n
+            var = self.sxx - sx * sx / n
+            corr = cov / np.sqrt(var * var.T)
+        corr[n < 2] = np.nan
+        np.clip(corr, -1, 1, out=corr)
+        return pd.DataFrame(corr.astype(np.float32), index=self.columns, columns=self.columns)
+
+
+def correlation_matrix(df, columns=None, max_rows=None, approximate=False, random_state=0):
+    """Pairwise-complete Pearson correlation computed with float32 matrix products.
+
+    Matches df.corr() (NaNs are excluded pair by pair) without the per-pair
+    Python loop. `max_rows` (or `approximate=True` for very wide frames)
+    correlates a uniform row sample instead; the sample size is kept in
+    `result.attrs["sampled_rows"]`.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns.tolist()
+    data = df[columns]
+
+    if approximate and max_rows is None:
+        max_rows = approximate_row_budget(len(data), len(columns))
+    sampled_rows = None
+    if max_rows is not None and len(data) > max_rows:
+        data = data.sample(n=max_rows, random_state=random_state)
+        sampled_rows = max_rows
+
+    accumulator = CorrelationAccumulator(columns)
+    accumulator.update(data)
+    result = accumulator.matrix()
+    result.attrs["sampled_rows"] = sampled_rows
+    return result
+
+
+def high_correlation_pairs(corr, threshold, top_k=None, inclusive=False):
+    """(col_a, col_b, r) for |r| above `threshold`, one entry per column pair.
+
+    Pairs come in the same order as walking the lower triangle row by row,
+    or sorted by |r| descending when `top_k` is given.
+    """
+    values = corr.to_numpy()
+    rows, cols = np.tril_indices(len(values), k=-1)
+    pair_values = values[rows, cols]
+    strength = np.abs(pair_values)
+    with np.errstate(invalid="ignore"):
+        keep = np.nonzero(strength >= threshold if inclusive else strength > threshold)[0]
+
+    if top_k is not None:
+        keep = keep[np.argsort(-strength[keep], kind="stable")[:top_k]]
+
+    names = corr.columns
+    return [(names[rows[k]], names[cols[k]], float(pair_values[k])) for k in keep]
@@ -0,0 +1,73 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core import densify
+
+EXPORT_CHUNK_ROWS = 100_000
+# label -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "CSV (zstd)": (".csv.zst", "application/zstd"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+    "Feather": (".feather", "application/vnd.apache.arrow.file"),
+}
+_CSV_CODECS = {"CSV (gzip)": "gzip", "CSV (zstd)": "zstd"}
+
+
+def _chunks(df, chunksize):
+    for start in range(0, max(len(df), 1), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def _arrow_ready(chunk):
+    # Mixed-type object columns can't be typed by Arrow: store them as strings (as the spill store does)
+    objects = chunk.select_dtypes(include="object").columns
+    return chunk.astype({col: "string" for col in objects}) if len(objects) else chunk
+
+
+def write_export(df, fmt, sink, chunksize=EXPORT_CHUNK_ROWS):
+    """Serialize `df` in chunks of `chunksize` rows, so only one chunk's
+    text/Arrow copy exists at a time.
+
+    `sink` is a path or a pyarrow output stream; it is closed when done.
+    """
+    write_chunks(_chunks(df, chunksize), fmt, sink)
+
+
+def write_chunks(chunks, fmt, sink):
+    # Same as write_export for frames that arrive chunk by chunk (e.g. a pipeline replayed over the spill store)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if isinstance(sink, str):
+        sink = pa.OSFile(sink, "wb")
+
+    if fmt.startswith("CSV"):
+        codec = _CSV_CODECS.get(fmt)
+        with pa.CompressedOutputStream(sink, codec) if codec else sink as stream:
+            for i, chunk in enumerate(chunks):
+                stream.write(densify(chunk).to_csv(index=False, header=i == 0).encode("utf-8"))
+        return
+
+    chunks = iter(chunks)
+    first = _arrow_ready(densify(next(chunks)))
+    schema = pa.Schema.from_pandas(first.head(0), preserve_index=False)
+    if fmt == "Parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(sink, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+    with sink, writer:
+        writer.write_table(pa.Table.from_pandas(first, schema=schema, preserve_index=False))
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_arrow_ready(densify(chunk)), schema=schema, preserve_index=False)
+            writer.write_table(table)
+
+
+def export_bytes(df, fmt, chunksize=EXPORT_CHUNK_ROWS):
+    return export_chunks_bytes(_chunks(df, chunksize), fmt)
+
+
+def export_chunks_bytes(chunks, fmt):
+    buffer = pa.BufferOutputStream()
+    write_chunks(chunks, fmt, buffer)
+    return buffer.getvalue().to_pybytes()
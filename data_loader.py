@@ -0,0 +1,119 @@
+import hashlib
+import os
+import shutil
+
+import pandas as pd
+
+from readers import READERS, parse_csv, read_table
+
+# Parsed uploads are kept as Parquet files named after the hash of the raw bytes,
+# so a Reset or a re-upload of the same file skips CSV tokenizing entirely.
+CACHE_DIR = os.environ.get(
+    "NUMERIX_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numerix_cache"),
+)
+CACHE_MAX_BYTES = int(os.environ.get("NUMERIX_CACHE_MAX_MB", "1024")) * 1024 * 1024
+
+
+def fingerprint_bytes(data, options=None):
+    # `options` (e.g. the selected columns and row range) are part of the identity of a parsed frame
+    digest = hashlib.blake2b(data, digest_size=16)
+    if options:
+        digest.update(repr(options).encode())
+    return digest.hexdigest()
+
+
+def _cache_path(fingerprint):
+    return os.path.join(CACHE_DIR, f"{fingerprint}.parquet")
+
+
+def cached_path(fingerprint):
+    # Parquet copy of a parsed upload, for engines that scan files (see backends.py)
+    path = _cache_path(fingerprint)
+    return path if os.path.exists(path) else None
+
+
+def load_cached(fingerprint):
+    path = _cache_path(fingerprint)
+    if not os.path.exists(path):
+        return None
+    try:
+        df = pd.read_parquet(path)
+    except Exception:
+        return None
+    os.utime(path)  # mark as recently used for LRU eviction
+    return df
+
+
+def store_cached(fingerprint, df):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(fingerprint)
+    tmp_path = path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        # Mixed-type object columns cannot always be written to Parquet;
+        # the dataset still loads, it just won't be cached.
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return False
+    evict_cache(keep={path})
+    return True
+
+
+def evict_cache(max_bytes=None, keep=()):
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    if not os.path.isdir(CACHE_DIR):
+        return
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if path in keep:
+            continue
+        if name.endswith(".parquet"):
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        elif name.endswith(".parts") and os.path.isdir(path):
+            # Chunked spill directories written by streaming ingestion
+            size = sum(entry.stat().st_size for entry in os.scandir(path))
+            entries.append((os.stat(path).st_mtime, size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.unlink(path)
+        total -= size
+
+
+def load_dataset(data, fmt="csv", columns=None, rows=None):
+    """Parse uploaded bytes once; returns (df, fingerprint).
+
+    Text formats (CSV, Excel) are cached as Parquet after the first parse;
+    Parquet and Feather are read directly, which is already fast.
+    """
+    options = (fmt, tuple(columns or ()), tuple(rows or ())) if (fmt != "csv" or columns or rows) else None
+    fingerprint = fingerprint_bytes(data, options)
+    if READERS[fmt].columnar:
+        return read_table(data, fmt, columns, rows), fingerprint
+    df = load_cached(fingerprint)
+    if df is None:
+        df = read_table(data, fmt, columns, rows)
+        if store_cached(fingerprint, df):
+            # Serve the Parquet round-trip so first load and Reset see identical dtypes
+            cached = load_cached(fingerprint)
+            if cached is not None:  # may already be evicted by a concurrent session
+                df = cached
+    return df, fingerprint
+
+
+def load_pristine(fingerprint, data, fmt="csv", columns=None, rows=None):
+    # Fresh copy of the original dataset for Reset; only re-parses on a cache miss.
+    df = None if READERS[fmt].columnar else load_cached(fingerprint)
+    if df is None:
+        df, _ = load_dataset(data, fmt, columns, rows)
+    return df
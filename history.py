@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+HISTORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class HistoryStep:
+    """Column-level delta between two consecutive versions of the dataset.
+
+    Only touched columns and dropped rows are stored. `nbytes` counts both
+    sides of the touched columns: `after` shares the newer version's
+    buffers, but keeps them alive once later changes replace them.
+    """
+    description: str
+    columns_before: list
+    columns_after: list
+    before: dict = field(default_factory=dict)    # column -> Series (None if the column was added)
+    after: dict = field(default_factory=dict)     # column -> Series (None if the column was removed)
+    dropped_positions: np.ndarray = None          # row positions (in the older version) removed by the step
+    dropped_rows: pd.DataFrame = None
+    nbytes: int = 0
+    spec: dict = None                             # replayable pipeline step, if any
+
+
+def _series_bytes(series):
+    return int(series.memory_usage(index=True, deep=True)) if series is not None else 0
+
+
+def diff_versions(before, after, description, columns=None, dropped=None):
+    # `dropped`: row positions of `before` that the change removed; only
+    # derived from index labels when not given (ambiguous for duplicate labels)
+    step = HistoryStep(description, list(before.columns), list(after.columns))
+
+    kept = None
+    if dropped is None and (len(before) != len(after) or not before.index.equals(after.index)):
+        dropped = np.flatnonzero(~before.index.isin(after.index))
+    if dropped is not None:
+        step.dropped_positions = np.asarray(dropped, dtype="int64")
+        step.dropped_rows = before.iloc[step.dropped_positions]
+        step.nbytes += int(step.dropped_rows.memory_usage(index=True, deep=True).sum())
+        kept = np.setdiff1d(np.arange(len(before)), step.dropped_positions, assume_unique=True)
+
+    def old_values(col):
+        # Rows were dropped: only the surviving rows are compared and stored
+        return before[col] if kept is None else before[col].iloc[kept]
+
+    if columns is None:
+        columns = [col for col in after.columns if col not in before.columns or not old_values(col).equals(after[col])]
+        columns += [col for col in before.columns if col not in after.columns]
+
+    for col in columns:
+        old = old_values(col) if col in before.columns else None
+        new = after[col] if col in after.columns else None
+        step.before[col] = old
+        step.after[col] = new
+        step.nbytes += _series_bytes(old) + _series_bytes(new)
+    return step
+
+
+def _apply_columns(df, values, order):
+    df = df.copy(deep=False)
+    for col, series in values.items():
+        if series is None:
+            if col in df.columns:
+                df = df.drop(columns=col)
+        else:
+            df[col] = series
+    return df[order]
+
+
+class DatasetHistory:
+    """Undo/redo stacks of HistoryStep deltas with a memory budget.
+
+    When the stored deltas exceed `budget_bytes`, the oldest steps are
+    evicted (they can no longer be undone).
+    """
+
+    def __init__(self, budget_bytes=HISTORY_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.undo_stack = []
+        self.redo_stack = []
+        self.evicted = 0
+
+    @property
+    def nbytes(self):
+        return sum(step.nbytes for step in self.undo_stack)
+
+    def record(self, before, after, description, columns=None, spec=None, dropped=None):
+        step = diff_versions(before, after, description, columns, dropped)
+        step.spec = spec
+        self.undo_stack.append(step)
+        self.redo_stack.clear()
+        while len(self.undo_stack) > 1 and self.nbytes > self.budget_bytes:
+            self.undo_stack.pop(0)
+            self.evicted += 1
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self, df):
+        step = self.undo_stack.pop()
+        df = _apply_columns(df, step.before, step.columns_before)
+        if step.dropped_positions is not None:
+            # Re-insert dropped rows at their original positions
+            restored = pd.concat([df, step.dropped_rows])
+            kept_positions = np.setdiff1d(np.arange(len(restored)), step.dropped_positions, assume_unique=True)
+            order = np.argsort(np.concatenate([kept_positions, step.dropped_positions]), kind="stable")
+            df = restored.iloc[order]
+        self.redo_stack.append(step)
+        return df, step
+
+    def redo(self, df):
+        step = self.redo_stack.pop()
+        if step.dropped_positions is not None:
+            keep = np.ones(len(df), dtype=bool)
+            keep[step.dropped_positions] = False
+            df = df.iloc[np.flatnonzero(keep)]
+        df = _apply_columns(df, step.after, step.columns_after)
+        self.undo_stack.append(step)
+        return df, step
@@ -1,34 +1,46 @@
-import streamlit as st
 import pandas as pd
+import streamlit as st
+from core import compute_insights
 
-def generate_insights(df):
+
+def generate_insights(df, profile=None, corr=None):
     st.subheader("Dataset Insights")
 
+    insights = compute_insights(df, profile, corr)
+    profile = insights.profile
+
     # 1. Shape
     st.markdown("#### Shape of Dataset")
-    st.write(f"Rows: {df.shape[0]} | Columns: {df.shape[1]}")
+    st.write(f"Rows: {profile.n_rows} | Columns: {profile.n_cols}")
+    sketched = profile.approximate_columns()
+    if sketched:
+        error = max(profile.columns[col].distinct_error for col in sketched)
+        st.caption(f"Sketched columns ({', '.join(map(str, sketched))}): distinct counts are HyperLogLog estimates "
+                   f"(±{error:.1%} standard error) and top-value counts may overcount by the amount shown below.")
 
     # 2. Descriptive Statistics
     st.markdown("#### Descriptive Statistics")
-    st.dataframe(df.describe().T)
+    st.dataframe(profile.describe())
+    quantile_error = max((p.quantile_error for p in profile.columns.values()), default=0.0)
+    if quantile_error:
+        st.caption(f"Quartiles are t-digest estimates, within about {quantile_error:.2%} of the rows of the exact rank.")
 
     # 3. Data Types
     st.markdown("#### Data Types")
-    st.dataframe(df.dtypes.astype(str))
+    st.dataframe(profile.dtypes())
 
     # 4. Null Values
     st.markdown("#### Null Values")
-    null_counts = df.isnull().sum()
+    null_counts = profile.null_counts()
     st.dataframe(null_counts[null_counts > 0])
 
     # 5. Top Null Columns (numeric only)
     st.markdown("#### Top Missing Value Columns (Numeric)")
-    numeric_nulls = df.select_dtypes(include=['float64', 'int64']).isnull().sum().sort_values(ascending=False)
-    st.dataframe(numeric_nulls[numeric_nulls > 0].head(5))
+    st.dataframe(insights.numeric_nulls(5))
 
     # 6. Low-Variance Columns (useless features)
     st.markdown("#### Low-Variance Columns (Constant or Near-Constant)")
-    low_var_cols = [col for col in df.columns if df[col].nunique() <= 1]
+    low_var_cols = insights.constant_columns
     if low_var_cols:
         st.write(low_var_cols)
     else:
@@ -36,12 +48,9 @@ def generate_insights(df):
 
     # 7. High Correlation Pairs
     st.markdown("#### Highly Correlated Numeric Columns (> 0.85)")
-    corr = df.select_dtypes(include=['float64', 'int64']).corr()
-    high_corr = []
-    for i in range(len(corr.columns)):
-        for j in range(i):
-            if abs(corr.iloc[i, j]) > 0.85:
-                high_corr.append((corr.columns[i], corr.columns[j], corr.iloc[i, j]))
+    if insights.correlation.attrs.get("sampled_rows"):
+        st.caption(f"Estimated on a sample of {insights.correlation.attrs['sampled_rows']} rows.")
+    high_corr = insights.high_correlations
     if high_corr:
         for col1, col2, val in high_corr:
             st.write(f" {col1} ↔ {col2} → Correlation: {val:.2f}")
@@ -50,18 +59,25 @@ def generate_insights(df):
 
     # 8. Top 5 Categories in Object Columns
     st.markdown("#### Top Categories in Categorical Columns")
-    cat_cols = df.select_dtypes(include=['object', 'category']).columns
+    cat_cols = profile.categorical_columns
     if len(cat_cols) == 0:
         st.info("No categorical columns.")
     else:
         for col in cat_cols:
             st.write(f"**{col}**")
-            st.write(df[col].value_counts().head(5))
+            st.write(profile.columns[col].top_values.head(5))
+            if profile.columns[col].top_error:
+                st.caption(f"Counts may overcount by up to {profile.columns[col].top_error:,}.")
 
     # 9. High Cardinality Columns
     st.markdown("#### High Cardinality Columns (Many Unique Values)")
-    high_card_cols = [col for col in df.columns if df[col].nunique() > df.shape[0] * 0.9]
+    high_card_cols = insights.high_cardinality_columns
     if high_card_cols:
         st.warning(f"High cardinality columns: {', '.join(high_card_cols)}")
+        st.dataframe(pd.DataFrame({
+            "Distinct": [profile.columns[col].distinct for col in high_card_cols],
+            "± (std. error)": [round(profile.columns[col].distinct * profile.columns[col].distinct_error)
+                               for col in high_card_cols],
+        }, index=high_card_cols))
     else:
         st.success("No high-cardinality columns found.")
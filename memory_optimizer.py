@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+# Strings with fewer distinct values than this share of rows become `category`
+CATEGORY_RATIO = 0.5
+
+
+def _arrow_strings_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _optimize_column(series, category_ratio, lossy_floats):
+    if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(series):
+        unsigned = series.min() >= 0 if len(series) else False
+        return pd.to_numeric(series, downcast="unsigned" if unsigned else "integer")
+
+    if pd.api.types.is_float_dtype(series):
+        narrow = series.astype("float32")
+        # float32 only when every value survives the round trip, unless asked otherwise
+        if lossy_floats or np.array_equal(narrow.to_numpy(dtype="float64"), series.to_numpy(dtype="float64"), equal_nan=True):
+            return narrow
+        return series
+
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+            return series  # mixed Python objects: leave untouched
+        non_null = series.count()
+        if non_null and series.nunique() <= non_null * category_ratio:
+            return series.astype("category")
+        if pd.api.types.is_object_dtype(series) and _arrow_strings_available():
+            return series.astype("string[pyarrow]")
+
+    return series
+
+
+def optimize_memory(df, category_ratio=CATEGORY_RATIO, lossy_floats=False):
+    """Downcast numerics and compact string columns.
+
+    Returns the optimized frame and a per-column report of dtypes and bytes
+    before/after. Integers shrink to the narrowest (unsigned) width, floats
+    to float32 when lossless (or always with `lossy_floats`), low-cardinality
+    strings to `category` and other strings to Arrow-backed strings.
+    """
+    before = df.memory_usage(index=False, deep=True)
+    optimized = df.copy(deep=False)
+    for col in df.columns:
+        optimized[col] = _optimize_column(df[col], category_ratio, lossy_floats)
+    after = optimized.memory_usage(index=False, deep=True)
+
+    report = pd.DataFrame({
+        "Dtype Before": df.dtypes.astype(str),
+        "Dtype After": optimized.dtypes.astype(str),
+        "Bytes Before": before,
+        "Bytes After": after,
+    })
+    report["Saved %"] = (100 * (1 - report["Bytes After"] / report["Bytes Before"].where(report["Bytes Before"] > 0))).round(1).fillna(0)
+    return optimized, report
+
+
+def changed_columns(report):
+    return report.index[report["Dtype Before"] != report["Dtype After"]].tolist()
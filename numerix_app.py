@@ -3,6 +3,13 @@ import pandas as pd
 from insights import generate_insights
 from visualizer import generate_visualizations
 from report_generator import generate_pdf_report
+from data_loader import load_dataset, load_pristine, fingerprint_bytes
+from backends import available_backends
+from readers import detect_format, read_columns, supported_extensions
+from streaming import STREAMING_THRESHOLD_MB, stream_csv, spill_dir
+from memory_optimizer import optimize_memory
+from core import densify
+from session import reset_session, current_profile, current_correlation, history, undo_change, redo_change
 
 from phase2_cleaning import clean_data_tab
 from phase2_dtypes import fix_data_types_tab
@@ -19,7 +26,8 @@ st.set_page_config(page_title="Sam's", layout="wide")
 st.title("Become a Data Analyst")
 
 #--------------------------------------------------------------File Upload
-uploaded_file = st.file_uploader("Upload your CSV file", type=["csv"])
+uploaded_file = st.file_uploader("Upload your dataset", type=supported_extensions(),
+                                 help="CSV, gzipped CSV, Parquet, Feather or Excel")
 
 #--------------------------------------------------------------Show instructions only when file not uploaded
 if not uploaded_file:
@@ -27,8 +35,9 @@ if not uploaded_file:
         st.markdown("""
 ### File Upload Rules
 
-**A) Supported File Format**
-- Only `.csv` files allowed.
+**A) Supported File Formats**
+- `.csv`, gzipped `.csv.gz`, `.parquet`, `.feather` / `.arrow` and Excel `.xlsx` / `.xls`.
+- Under *Load options* you can pick the columns and row range to read, so wide files only load what you analyse.
 
 **B) File Requirements**
 - First row must contain column headers.
@@ -58,30 +67,115 @@ if not uploaded_file:
 
 #--------------------------------------------------------Proceed when file is uploaded
 if uploaded_file:
-    # Initialize session state once
-    if 'df' not in st.session_state:
-        st.session_state.df = pd.read_csv(uploaded_file)
-        st.session_state.change_log = []
+    try:
+        file_format = detect_format(uploaded_file.name)
+        all_columns = read_columns(uploaded_file.getvalue(), file_format)
+    except (ValueError, ImportError) as e:
+        st.error(f"Cannot read `{uploaded_file.name}`: {e}")
+        st.stop()
+
+    with st.expander("Load options (columns and rows to read)"):
+        load_columns = st.multiselect("Columns to load (empty = all)", all_columns, key="load_columns")
+        c1, c2 = st.columns(2)
+        with c1:
+            first_row = st.number_input("First row", min_value=0, value=0, step=1000, key="load_first_row")
+        with c2:
+            n_rows = st.number_input("Number of rows (0 = all)", min_value=0, value=0, step=1000, key="load_n_rows")
+    load_rows = (int(first_row), int(first_row + n_rows) if n_rows else None) if first_row or n_rows else None
+    load_options = (file_format, load_columns or None, load_rows)
+
+    # Chunked streaming is CSV-only; projected or partial loads are already small
+    large_file_mode = file_format == "csv" and not load_columns and not load_rows and st.toggle(
+        "Large file mode (profile in chunks with bounded memory)",
+        value=uploaded_file.size > STREAMING_THRESHOLD_MB * 1024 * 1024,
+    )
+    optimize_on_load = st.checkbox("Optimize memory on load (downcast numbers, categorize repetitive text)")
+    st.selectbox("Compute engine", available_backends(), key="compute_backend",
+                 help="Runs profiles, correlations, value counts and group sums. DuckDB and Polars are "
+                      "multi-threaded and appear here once installed; pandas is the fallback.")
+
+    # Initialize session state once per uploaded file (parsed bytes are cached by hash)
+    upload_id = (getattr(uploaded_file, "file_id", uploaded_file.name), large_file_mode, optimize_on_load,
+                 file_format, tuple(load_columns), load_rows)
+    if st.session_state.get("upload_id") != upload_id or 'df' not in st.session_state:
+        if large_file_mode:
+            fingerprint = fingerprint_bytes(uploaded_file.getvalue())
+            progress_bar = st.progress(0.0, text="Streaming dataset...")
+            stream_result = stream_csv(
+                uploaded_file,
+                store_dir=spill_dir(fingerprint),
+                progress=lambda done, rows: progress_bar.progress(done, text=f"Profiled {rows:,} rows"),
+            )
+            progress_bar.empty()
+            df = stream_result.sample.copy()
+        else:
+            df, fingerprint = load_dataset(uploaded_file.getvalue(), *load_options)
+            stream_result = None
+        st.session_state.memory_report = None
+        if optimize_on_load:
+            df, st.session_state.memory_report = optimize_memory(df)
+        st.session_state.dataset_fingerprint = fingerprint
+        st.session_state.stream_result = stream_result
+        st.session_state.upload_id = upload_id
+        reset_session(df)
 
     df = st.session_state.df
     dataset_name = uploaded_file.name
+    stream_result = st.session_state.get("stream_result")
 
     #----------------------------------------------------Reset button
     if st.button("Reset Dataset"):
-        st.session_state.df = pd.read_csv(uploaded_file)
-        st.session_state.change_log = []
+        if stream_result is not None:
+            df = stream_result.sample.copy()
+        else:
+            df = load_pristine(st.session_state.dataset_fingerprint, uploaded_file.getvalue(), *load_options)
+        reset_session(optimize_memory(df)[0] if optimize_on_load else df)
         st.success("Dataset reset to original.")
         df = st.session_state.df
 
+    #----------------------------------------------------Undo / Redo
+    undo_col, redo_col, _ = st.columns([1, 1, 6])
+    with undo_col:
+        if st.button("Undo", disabled=not history().can_undo()):
+            step = undo_change()
+            st.info(f"Undone: {step.description}")
+            df = st.session_state.df
+    with redo_col:
+        if st.button("Redo", disabled=not history().can_redo()):
+            step = redo_change()
+            st.info(f"Redone: {step.description}")
+            df = st.session_state.df
+
+    memory_report = st.session_state.get("memory_report")
+    if memory_report is not None:
+        before_mb = memory_report["Bytes Before"].sum() / 1024 ** 2
+        after_mb = memory_report["Bytes After"].sum() / 1024 ** 2
+        with st.expander(f"Memory optimized on load: {before_mb:.1f} MB → {after_mb:.1f} MB"):
+            st.dataframe(memory_report)
+
     #-----------------------------------------------------Preview
     st.subheader("Data Preview")
-    st.dataframe(df.head())
+    st.dataframe(densify(df.head()))
 
     # Phase 1 Tabs
     tab1, tab2 = st.tabs(["Insights", "Visualizations"])
 
+    # Column statistics are memoized per session and only recomputed for
+    # columns touched since the last rerun (see session.record_change)
+    # In large file mode, Insights and the PDF report use the statistics streamed
+    # over the whole file; everything else works on the in-memory sample.
+    if stream_result is not None:
+        profile, corr = stream_result.profile, stream_result.correlation
+    else:
+        profile, corr = current_profile(df), current_correlation(df)
+
     with tab1:
-        generate_insights(df)
+        if stream_result is not None:
+            st.caption(
+                f"Large file mode: statistics cover all {profile.n_rows:,} rows; charts and the "
+                f"Phase 2/3 tabs work on a uniform sample of {len(stream_result.sample):,} rows."
+            )
+        generate_insights(df, profile, corr)
 
     with tab2:
         charts = generate_visualizations(df)
@@ -89,7 +183,7 @@ if uploaded_file:
     #-----------------------------------------------------Download report
     if st.button("Download Full Report (PDF)"):
         if charts:
-            pdf_path = generate_pdf_report(df, charts, dataset_name=dataset_name)
+            pdf_path = generate_pdf_report(df, charts, dataset_name=dataset_name, profile=profile, corr=corr)
             with open(pdf_path, "rb") as f:
                 st.download_button("⬇️ Download Full Report", f, file_name="numerix_report.pdf", mime="application/pdf")
         else:
@@ -115,11 +209,11 @@ if uploaded_file:
         st.session_state.df = df
 
     with tab_outliers:
-        df = detect_outliers_tab(df)
+        df = detect_outliers_tab(df, current_profile(df))
         st.session_state.df = df
 
     with tab_eda:
-        explore_features_tab(df)
+        explore_features_tab(df, current_profile(df), current_correlation(df))
 
     st.markdown("---")
     st.subheader("Phase 3: Feature Transformation & Scaling")
@@ -139,7 +233,7 @@ if uploaded_file:
         df = encode_categories_tab(df)
 
     with tab_transform:
-        df = transform_skew_tab(df)    
+        df = transform_skew_tab(df, current_profile(df))    
 
     with tab_export:
         export_final_tab(df)
@@ -150,6 +244,9 @@ if uploaded_file:
         st.subheader("Dataset Modification Summary")
         for entry in st.session_state.change_log:
             st.markdown(f"- {entry}")
+        steps = history()
+        note = f" ({steps.evicted} oldest step(s) dropped to stay within the memory budget)" if steps.evicted else ""
+        st.caption(f"Undo history: {len(steps.undo_stack)} step(s), {steps.nbytes / 1024 ** 2:.1f} MB{note}")
 
 else:
-    st.info("Please upload a CSV file to proceed.")
+    st.info("Please upload a dataset (CSV, Parquet, Feather or Excel) to proceed.")
@@ -0,0 +1,130 @@
+"""Headless entry point: batch insights/PDF reports and pipeline replay.
+
+    python numerix_cli.py report extracts/ "more/*.csv" --out-dir reports --workers 8
+    python numerix_cli.py pipeline numerix_pipeline.json extracts/*.csv --out-dir processed
+
+`report` writes `<name>.pdf` and `<name>.insights.json` per input file and
+prints per-stage timings as each file finishes.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from core import compute_insights
+from correlation import correlation_matrix
+from pipeline import main as pipeline_main
+from profiler import profile_dataset
+from readers import READERS, detect_format, read_table
+from report_generator import generate_pdf_report
+from streaming import STREAMING_THRESHOLD_MB, stream_csv
+
+
+def expand_inputs(patterns):
+    # Directories contribute their readable files (CSV, Parquet, ...); anything else is a path or glob
+    extensions = [ext for reader in READERS.values() for ext in reader.extensions]
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.update(path for path in glob.glob(os.path.join(pattern, "*"))
+                         if path.lower().endswith(tuple(extensions)))
+        else:
+            paths.update(glob.glob(pattern) or [pattern])
+    return sorted(paths)
+
+
+def report_file(path, out_dir, streaming_threshold_mb=STREAMING_THRESHOLD_MB):
+    """Profile one dataset file and write its PDF report and insights JSON; returns timings."""
+    timings = {}
+    start = last = time.perf_counter()
+
+    def lap(stage):
+        nonlocal last
+        now = time.perf_counter()
+        timings[stage] = round(now - last, 3)
+        last = now
+
+    fmt = detect_format(path)
+    if fmt == "csv" and os.path.getsize(path) > streaming_threshold_mb * 1024 * 1024:
+        # Same bounded-memory path as the app's large file mode
+        result = stream_csv(path)
+        df, profile, corr = result.sample, result.profile, result.correlation
+        lap("load+profile")
+    else:
+        df = read_table(path, fmt)
+        lap("load")
+        profile = profile_dataset(df)
+        lap("profile")
+        corr = correlation_matrix(df, profile.numeric_columns, approximate=True)
+        lap("correlation")
+
+    insights = compute_insights(df, profile, corr)
+    stem = os.path.splitext(os.path.basename(path).removesuffix(".gz"))[0]
+    json_path = os.path.join(out_dir, f"{stem}.insights.json")
+    with open(json_path, "w") as f:
+        json.dump(insights.to_dict(), f, indent=2, default=str)
+    lap("insights")
+
+    pdf_path = generate_pdf_report(df, [], dataset_name=os.path.basename(path), profile=profile, corr=corr,
+                                   output_path=os.path.join(out_dir, f"{stem}.pdf"))
+    lap("report")
+    return {"source": path, "pdf": pdf_path, "insights": json_path, "rows": profile.n_rows,
+            "timings": timings, "seconds": round(time.perf_counter() - start, 3)}
+
+
+def run_reports(paths, out_dir, workers=None, streaming_threshold_mb=STREAMING_THRESHOLD_MB):
+    """Fan `report_file` out over a process pool, yielding results as files finish."""
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(report_file, path, out_dir, streaming_threshold_mb): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield {"source": futures[future], "error": str(e)}
+
+
+def _format_result(result):
+    if "error" in result:
+        return f"FAILED {result['source']}: {result['error']}"
+    stages = "  ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result["timings"].items())
+    return f"{result['source']}  rows={result['rows']:,}  {stages}  total {result['seconds']:.2f}s"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NumeriX headless tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="profile CSVs and build PDF reports")
+    report.add_argument("inputs", nargs="+", help="Data files (CSV, Parquet, Feather, Excel), directories or glob patterns")
+    report.add_argument("--out-dir", default="reports")
+    report.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    report.add_argument("--streaming-threshold-mb", type=float, default=STREAMING_THRESHOLD_MB,
+                        help="files above this size are profiled in chunks")
+
+    replay = commands.add_parser("pipeline", help="apply a recorded pipeline to CSVs (see pipeline.py)")
+    replay.add_argument("args", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args(argv)
+    if args.command == "pipeline":
+        return pipeline_main(args.args)
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        parser.error("no input files found")
+
+    start = time.perf_counter()
+    failed = 0
+    for result in run_reports(paths, args.out_dir, args.workers, args.streaming_threshold_mb):
+        failed += "error" in result
+        print(_format_result(result), flush=True)
+    print(f"{len(paths) - failed}/{len(paths)} reports written to {args.out_dir} "
+          f"in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,6 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
+from core import drop_duplicate_rows, drop_missing_rows, fill_missing
+from session import record_change
 
 def clean_data_tab(df):
     st.subheader("Clean Your Dataset")
@@ -10,31 +10,27 @@ def clean_data_tab(df):
 
     # --- Drop rows with null values ---
     if st.button("Drop Rows with Null Values"):
-        before = df.shape[0]
-        df.dropna(inplace=True)
-        after = df.shape[0]
-        dropped = before - after
-        st.success(f"Dropped `{dropped}` rows with missing values.")
-        st.markdown(f"**New shape:** `{df.shape[0]}` rows × `{df.shape[1]}` columns")
-        if dropped > 0:
-            st.session_state.change_log.append(f"Dropped {dropped} rows with missing values")
+        result = drop_missing_rows(df)
+        st.success(f"Dropped `{result.changed}` rows with missing values.")
+        st.markdown(f"**New shape:** `{result.df.shape[0]}` rows × `{result.df.shape[1]}` columns")
+        if result.changed > 0:
+            record_change(result.message, before=df, after=result.df, step=result.step, dropped=result.dropped)
+        df = result.df
 
     # --- Drop duplicates ---
     if st.button("Drop Duplicate Rows"):
-        before = df.shape[0]
-        df.drop_duplicates(inplace=True)
-        after = df.shape[0]
-        dropped = before - after
-        st.success(f"Dropped `{dropped}` duplicate rows.")
-        st.markdown(f"**New shape:** `{df.shape[0]}` rows × `{df.shape[1]}` columns")
-        if dropped > 0:
-            st.session_state.change_log.append(f"Dropped {dropped} duplicate rows")
+        result = drop_duplicate_rows(df)
+        st.success(f"Dropped `{result.changed}` duplicate rows.")
+        st.markdown(f"**New shape:** `{result.df.shape[0]}` rows × `{result.df.shape[1]}` columns")
+        if result.changed > 0:
+            record_change(result.message, before=df, after=result.df, step=result.step, dropped=result.dropped)
+        df = result.df
 
     st.markdown("---")
     st.subheader("Fill Missing Values (Advanced Options)")
 
     num_cols = df.select_dtypes(include=['number']).columns.tolist()
-    cat_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    cat_cols = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
 
     # --- Fill numeric ---
     with st.expander("Fill Numeric Column"):
@@ -46,23 +42,11 @@ def clean_data_tab(df):
             const_num = st.number_input("Enter constant value to fill with", value=0.0)
 
         if st.button("Apply Numeric Fill"):
-            filled_count = df[num_col].isna().sum()
-            if filled_count > 0:
-                if num_method == "Mean":
-                    df[num_col].fillna(df[num_col].mean(), inplace=True)
-                elif num_method == "Median":
-                    df[num_col].fillna(df[num_col].median(), inplace=True)
-                elif num_method == "Mode":
-                    df[num_col].fillna(df[num_col].mode()[0], inplace=True)
-                elif num_method == "0":
-                    df[num_col].fillna(0, inplace=True)
-                elif num_method == "Constant":
-                    df[num_col].fillna(const_num, inplace=True)
-                elif num_method == "Interpolate":
-                    df[num_col].interpolate(method='linear', inplace=True)
-
-                st.success(f"Filled {filled_count} nulls in `{num_col}` using `{num_method}` method.")
-                st.session_state.change_log.append(f"Filled {filled_count} nulls in '{num_col}' using {num_method}")
+            result = fill_missing(df, num_col, num_method, const_num)
+            if result.changed > 0:
+                st.success(f"Filled {result.changed} nulls in `{num_col}` using `{num_method}` method.")
+                record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+                df = result.df
             else:
                 st.info(f"No missing values found in `{num_col}`.")
 
@@ -76,15 +60,11 @@ def clean_data_tab(df):
             const_cat = st.text_input("Enter text to fill with", value="missing")
 
         if st.button("Apply Categorical Fill"):
-            filled_count = df[cat_col].isna().sum()
-            if filled_count > 0:
-                if cat_method == "Mode":
-                    df[cat_col].fillna(df[cat_col].mode()[0], inplace=True)
-                elif cat_method == "Constant":
-                    df[cat_col].fillna(const_cat, inplace=True)
-
-                st.success(f"Filled {filled_count} nulls in `{cat_col}` using `{cat_method}` method.")
-                st.session_state.change_log.append(f"Filled {filled_count} nulls in '{cat_col}' using {cat_method}")
+            result = fill_missing(df, cat_col, cat_method, const_cat)
+            if result.changed > 0:
+                st.success(f"Filled {result.changed} nulls in `{cat_col}` using `{cat_method}` method.")
+                record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+                df = result.df
             else:
                 st.info(f"No missing values found in `{cat_col}`.")
 
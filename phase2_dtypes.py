@@ -1,13 +1,39 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
+from core import DTYPE_OPTIONS, auto_fix_types, convert_dtype, optimize_dtypes
+from session import record_change
 
 def fix_data_types_tab(df):
     st.subheader("Convert Data Types")
 
+    # --- Memory optimizer ---
+    with st.expander("Optimize Memory Usage"):
+        st.caption("Downcast numeric columns and store repetitive text as categories.")
+        if st.button("Optimize Memory"):
+            result = optimize_dtypes(df)
+            st.success(f"Saved {result.details['saved_mb']:.1f} MB across {result.changed} column(s).")
+            st.dataframe(result.details["report"])
+            if result.changed:
+                record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+                df = result.df
+                st.session_state.df = df
+
+    # --- Bulk auto-fix ---
+    with st.expander("Auto-fix All Types"):
+        st.caption("Infer int/float/datetime/category for every text column and convert them in one pass.")
+        min_success = st.slider("Minimum share of values that must parse", 0.5, 1.0, 0.9, 0.05)
+        if st.button("Auto-fix Types"):
+            result = auto_fix_types(df, min_success=min_success)
+            st.dataframe(result.details["report"])
+            if result.changed:
+                st.success(f"Converted {result.changed} column(s).")
+                record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+                df = result.df
+                st.session_state.df = df
+            else:
+                st.info("No column needed a type change.")
+
     column = st.selectbox("Select column to convert", df.columns)
-    dtype_options = ["int", "float", "str", "datetime", "category"]
-    target_dtype = st.selectbox("Convert to", dtype_options)
+    target_dtype = st.selectbox("Convert to", DTYPE_OPTIONS)
 
     # Skip conversion if already that type
     if str(df[column].dtypes) == target_dtype:
@@ -16,44 +42,27 @@ def fix_data_types_tab(df):
 
     if st.button("Convert Data Type"):
         try:
-            original_series = df[column].copy()
-
-            # Step 1: Clean garbage
-            cleaned = original_series.astype(str).str.strip()
-            cleaned = cleaned.str.replace('%', '', regex=False)
-            cleaned = cleaned.str.replace(',', '', regex=False)
-            cleaned = cleaned.replace(["", " ", "NaN", "nan", "None", "null", "--"], np.nan)
+            # Clean garbage ("1,234%", "--", ...) and convert
+            result = convert_dtype(df, column, target_dtype)
+            record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+            df = result.df
 
-            # Step 2: Conversion
             if target_dtype == "datetime":
-                year_only = cleaned.str.match(r"^\d{4}(\.0)?$")
-                cleaned.loc[year_only] = cleaned.loc[year_only].str.extract(r"(\d{4})")[0] + "-01-01"
-                df[column] = pd.to_datetime(cleaned, errors='coerce', infer_datetime_format=True)
-
+                unparsable = result.details["unparsable"]
                 if df[column].isna().all():
                     st.warning(f"⚠️ All values in `{column}` failed to convert to datetime.")
+                elif len(unparsable):
+                    st.warning(f"⚠️ {unparsable.sum()} value(s) ({len(unparsable)} distinct) are not dates and were set to NaT.")
+                if len(unparsable):
+                    st.dataframe(unparsable.head(20).rename_axis("Value").reset_index(name="Rows"))
+                st.caption("Formats detected: " + ", ".join(f"`{fmt}` ({n})" for fmt, n in result.details["formats"].items()))
 
-            elif target_dtype == "category":
-                df[column] = cleaned.astype("category")
-
-            elif target_dtype == "int":
-                df[column] = pd.to_numeric(cleaned, errors='coerce').fillna(0).astype(int)
-
-            elif target_dtype == "float":
-                df[column] = pd.to_numeric(cleaned, errors='coerce')
-
-            elif target_dtype == "str":
-                df[column] = original_series.astype(str)
-
-            # Step 3: Success output
+            # Success output
             st.success(f" `{column}` converted to `{target_dtype}`.")
             st.code(f"New dtype: {df[column].dtypes}")
             st.markdown("**Sample values after conversion:**")
             st.dataframe(df[[column]].dropna().head(10))
 
-            # Log the change
-            st.session_state.change_log.append(f"Converted '{column}' to {target_dtype}")
-
         except Exception as e:
             st.error(f"❌ Conversion failed: {e}")
             return df
@@ -1,39 +1,61 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
-import plotly.figure_factory as ff
+import plotly.express as px
+from core import (EXPLORE_SAMPLE_ROWS, correlated_pairs, correlation_estimate, feature_overview, mean_estimate, skew_estimate,
+                  stratify_candidates)
+from profiler import profile_dataset
+from correlation import correlation_matrix
+from session import column_quantiles, exploration_sample
+
+PERCENTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
 
 
-def explore_features_tab(df):
+def explore_features_tab(df, profile=None, corr=None):
     st.subheader("Feature Exploration Dashboard")
 
+    if profile is None:
+        profile = profile_dataset(df)
+
     st.markdown("### 🔹 Dataset Overview")
     st.markdown(f"- Rows: `{df.shape[0]}`  | Columns: `{df.shape[1]}`")
 
-    num_cols = df.select_dtypes(include='number').columns.tolist()
-    cat_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-    date_cols = df.select_dtypes(include='datetime64').columns.tolist()
+    overview = feature_overview(df, profile)
+    num_cols, cat_cols = overview.numeric_columns, overview.categorical_columns
 
-    st.markdown(f"- Numeric Columns: `{len(num_cols)}` | Categorical: `{len(cat_cols)}` | Date: `{len(date_cols)}`")
+    st.markdown(f"- Numeric Columns: `{len(num_cols)}` | Categorical: `{len(cat_cols)}` | Date: `{len(overview.date_columns)}`")
 
     # Constant Columns
-    constant_cols = [col for col in df.columns if df[col].nunique() <= 1]
-    if constant_cols:
-        st.warning(f"⚠️ Constant columns (only 1 unique value): {constant_cols}")
+    if overview.constant_columns:
+        st.warning(f"⚠️ Constant columns (only 1 unique value): {overview.constant_columns}")
 
     # High Nulls
-    high_nulls = df.isnull().mean()
-    high_null_cols = high_nulls[high_nulls > 0.5].index.tolist()
-    if high_null_cols:
-        st.warning(f"⚠️ Columns with >50% nulls: {high_null_cols}")
+    if overview.high_null_columns:
+        st.warning(f"⚠️ Columns with >50% nulls: {overview.high_null_columns}")
 
     # High Cardinality
-    high_card_cols = [col for col in cat_cols if df[col].nunique() > 50]
-    if high_card_cols:
-        st.warning(f"⚠️ High-cardinality categorical columns (>50 unique): {high_card_cols}")
+    if overview.high_cardinality_columns:
+        st.warning(f"⚠️ High-cardinality categorical columns (>50 unique): {overview.high_cardinality_columns}")
+        sketched = [col for col in overview.high_cardinality_columns if profile.columns[col].approximate]
+        if sketched:
+            st.caption(f"Distinct counts of {sketched} are HyperLogLog estimates "
+                       f"(±{profile.columns[sketched[0]].distinct_error:.1%}).")
+
+    # --- Exploration sample: charts and previews below use it unless exact mode is on ---
+    exact = True
+    if len(df) > EXPLORE_SAMPLE_ROWS:
+        st.markdown("---")
+        c1, c2 = st.columns([1, 2])
+        with c1:
+            exact = st.toggle("Exact (use all rows)", value=False, key="explore_exact")
+        with c2:
+            stratify = st.selectbox("Stratify sample by", [None] + stratify_candidates(df, profile),
+                                    format_func=lambda c: "Uniform sample" if c is None else c,
+                                    disabled=exact, key="explore_stratify")
+        if not exact:
+            sample = exploration_sample(df, stratify)
+            st.caption(f"Previewing a {'stratified' if stratify else 'uniform'} sample of {len(sample.df):,} of "
+                       f"{sample.n_total:,} rows; estimates show 95% confidence intervals.")
+    data = df if exact else sample.df
 
     st.markdown("---")
     st.subheader("Univariate Analysis")
@@ -41,17 +63,33 @@ def explore_features_tab(df):
 
     if feature in num_cols:
         st.markdown("**Histogram & Distribution:**")
-        fig = px.histogram(df, x=feature, marginal="box", nbins=30)
+        mean = mean_estimate(data[feature], len(df))
+        fig = px.histogram(data, x=feature, marginal="box", nbins=30)
+        if not np.isnan(mean.value):
+            fig.add_vline(x=mean.value, line_dash="dash", annotation_text=f"mean {mean.value:.3g}")
+            if not exact:
+                fig.add_vrect(x0=mean.lo, x1=mean.hi, opacity=0.15, line_width=0)
         st.plotly_chart(fig, use_container_width=True)
 
-        skew = df[feature].skew()
+        skew = skew_estimate(data[feature], exact)
         st.info(f"Skewness: `{skew:.2f}`")
 
+        percentiles = column_quantiles(df, feature, PERCENTILES)
+        st.markdown("**Percentiles (all rows):**")
+        st.dataframe(percentiles.rename(lambda q: f"{q:.0%}").to_frame(feature).T)
+
     elif feature in cat_cols:
         st.markdown("**Top Categories:**")
-        vc = df[feature].value_counts().head(10)
+        top = profile.columns[feature]
+        vc = top.top_values.head(10)
         fig = px.bar(x=vc.index, y=vc.values, labels={'x': feature, 'y': 'Count'})
+        if top.top_error:
+            # Sketched counts only overcount: the true count lies in [count - error, count]
+            fig.update_traces(error_y=dict(type="data", symmetric=False, array=[0] * len(vc),
+                                           arrayminus=[top.top_error] * len(vc)))
         st.plotly_chart(fig, use_container_width=True)
+        if top.top_error:
+            st.caption(f"Approximate counts (Space-Saving sketch): each may overcount by up to {top.top_error:,}.")
 
     st.markdown("---")
     st.subheader("Bivariate Analysis")
@@ -59,31 +97,26 @@ def explore_features_tab(df):
     col2 = st.selectbox("Y-axis column:", df.columns, key="bivar_y")
 
     if col1 != col2:
-        if df[col1].dtype in ['int64', 'float64'] and df[col2].dtype in ['int64', 'float64']:
+        if col1 in num_cols and col2 in num_cols:
             st.markdown("**Scatter Plot + Correlation:**")
-            fig = px.scatter(df, x=col1, y=col2)
+            fig = px.scatter(data, x=col1, y=col2)
             st.plotly_chart(fig, use_container_width=True)
-            corr = df[[col1, col2]].corr().iloc[0, 1]
-            st.info(f"Correlation: `{corr:.2f}`")
+            st.info(f"Correlation: `{correlation_estimate(data, col1, col2, exact):.2f}`")
 
         elif col1 in cat_cols and col2 in num_cols:
             st.markdown("**Box Plot:**")
-            fig = px.box(df, x=col1, y=col2)
+            fig = px.box(data, x=col1, y=col2)
             st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
     st.subheader("Correlation Matrix (Numeric Features Only)")
     if len(num_cols) >= 2:
-        corr_matrix = df[num_cols].corr().round(2)
-        fig = px.imshow(corr_matrix, text_auto=True, aspect="auto", color_continuous_scale='RdBu_r')
+        if corr is None:
+            corr = correlation_matrix(df, num_cols)
+        fig = px.imshow(corr.round(2), text_auto=True, aspect="auto", color_continuous_scale='RdBu_r')
         st.plotly_chart(fig, use_container_width=True)
 
-        high_corrs = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i):
-                val = corr_matrix.iloc[i, j]
-                if abs(val) >= 0.7:
-                    high_corrs.append(f"{corr_matrix.columns[i]} ↔ {corr_matrix.columns[j]}: {val:.2f}")
+        high_corrs = [f"{a} ↔ {b}: {val:.2f}" for a, b, val in correlated_pairs(corr)]
 
         if high_corrs:
             st.markdown("**Highly Correlated Pairs (|corr| > 0.7):**")
@@ -1,95 +1,83 @@
+import math
+
+import numpy as np
 import streamlit as st
 import plotly.express as px
-import pandas as pd
+from core import OUTLIER_ACTIONS, OUTLIER_METHODS, OUTLIER_THRESHOLDS, apply_outlier_rule, densify, detect_outliers
+from session import record_change, stats_cache
+
+PAGE_SIZE = 50
 
-def detect_outliers_tab(df):
-    st.subheader("Outlier Detection with Box Plot")
+def detect_outliers_tab(df, profile=None):
+    st.subheader("Outlier Detection")
 
-    # --- Step 1: Select numeric column ---
     num_cols = df.select_dtypes(include=['number']).columns.tolist()
     if not num_cols:
         st.warning("No numeric columns available.")
         return df
 
-    col = st.selectbox("Select numeric column", num_cols)
-
-    # --- Step 2: Clean and plot ---
-    clean_data = df[col].dropna()
-    fig = px.box(clean_data, y=col, points="outliers", title=f"Box Plot of '{col}'")
-    st.plotly_chart(fig, use_container_width=True)
-
-    # --- Step 3: IQR calculation ---
-    Q1 = clean_data.quantile(0.25)
-    Q3 = clean_data.quantile(0.75)
-    IQR = Q3 - Q1
-    lower = Q1 - 1.5 * IQR
-    upper = Q3 + 1.5 * IQR
-    outlier_rows = df[(df[col] < lower) | (df[col] > upper)]
-
-    st.markdown("### Outlier Summary (IQR Method)")
-    st.code(f"""
-Q1  = {Q1:.2f}
-Q3  = {Q3:.2f}
-IQR = {IQR:.2f}
-
-Lower Bound = {lower:.2f}
-Upper Bound = {upper:.2f}
-
-Outliers Detected = {outlier_rows.shape[0]}
-    """)
-
-    if outlier_rows.empty:
-        st.success("No outliers detected.")
+    # --- Step 1: Method and columns ---
+    c1, c2 = st.columns([1, 1])
+    with c1:
+        method = st.selectbox("Detection method", OUTLIER_METHODS)
+    with c2:
+        label = "Expected outlier share" if method == "Isolation Forest" else "Threshold"
+        threshold = st.number_input(label, value=OUTLIER_THRESHOLDS[method], min_value=0.0,
+                                    max_value=0.5 if method == "Isolation Forest" else None,
+                                    key=f"outlier_threshold_{method}")
+    columns = st.multiselect("Columns to scan", num_cols, default=num_cols, key="outlier_columns")
+    if not columns:
+        st.info("Select at least one column.")
         return df
 
-    # --- Step 4: Manage selection state ---
-    outlier_indices = outlier_rows.index.tolist()
-    key = f"selected_outliers_{col}"
-
-    if key not in st.session_state:
-        st.session_state[key] = outlier_indices  # default: all selected
-
-    # 🛡 Ensure default values are valid
-    valid_defaults = [i for i in st.session_state[key] if i in outlier_indices]
-
-    # Buttons to update session state
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("Select All Outliers"):
-            st.session_state[key] = outlier_indices
-            valid_defaults = outlier_indices
-    with col2:
-        if st.button("❌ Clear All Selection"):
-            st.session_state[key] = []
-            valid_defaults = []
-
-    # --- Step 5: Multiselect UI ---
-    selected_to_keep = st.multiselect(
-        "Choose rows to keep (based on index):",
-        options=outlier_indices,
-        default=valid_defaults,
-        key=f"multiselect_{col}"
+    # --- Step 2: Scan every selected column (cached until one of them changes) ---
+    scan = stats_cache().dataset_stat(
+        "outliers", columns,
+        lambda: detect_outliers(df, columns, method, threshold, profile),
+        key=(method, threshold, tuple(columns), len(df)),
     )
+    n_flagged = int(scan.mask().sum())
 
-    st.dataframe(outlier_rows)
+    st.markdown(f"### Outlier Summary ({method})")
+    st.dataframe(scan.summary())
+    st.caption(f"{n_flagged} of {len(df)} rows flagged in at least one column")
 
-    # --- Step 6: Apply removal ---
-    if st.button(f"Remove Unselected Outliers from `{col}`"):
-        to_remove = outlier_rows[~outlier_rows.index.isin(selected_to_keep)].index
-        before = df.shape[0]
-        df = df.drop(index=to_remove)
-        after = df.shape[0]
-        removed = before - after
-        st.success(f"Removed {removed} outlier rows from `{col}`.")
-        st.markdown(f"**New shape:** `{after} rows × {df.shape[1]} columns`")
+    # --- Step 3: Box plot of one column ---
+    col = st.selectbox("Box plot column", columns)
+    fig = px.box(df[col].dropna(), y=col, points="outliers", title=f"Box Plot of '{col}'")
+    st.plotly_chart(fig, use_container_width=True)
 
-        # Log the change
-        if removed > 0 and "change_log" in st.session_state:
-            st.session_state.change_log.append(f"Removed {removed} outliers from '{col}'")
+    if n_flagged == 0:
+        st.success("No outliers detected.")
+        return df
 
-        # Clear state
-        del st.session_state[key]
+    # --- Step 4: Review flagged rows page by page ---
+    # Rows to keep are row positions in the scanned frame, so they start over with every new scan
+    if st.session_state.get("outlier_keep_scan") is not scan:
+        st.session_state.outlier_keep_scan = scan
+        st.session_state.outlier_keep = set()
+    kept = st.session_state.outlier_keep
+    pages = math.ceil(n_flagged / PAGE_SIZE)
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key="outlier_page") - 1
+    positions = scan.positions()[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+    rows = densify(scan.page(df, page, PAGE_SIZE))
+    rows.insert(0, "Keep", np.isin(positions, list(kept)))
+    edited = st.data_editor(rows, disabled=[c for c in rows.columns if c != "Keep"], key=f"outlier_editor_{page}")
+    kept.difference_update(positions.tolist())
+    kept.update(positions[edited["Keep"].to_numpy(dtype=bool)].tolist())
+    st.caption(f"{len(kept)} flagged rows marked to keep")
+
+    # --- Step 5: Bulk rule ---
+    actions = OUTLIER_ACTIONS if scan.bounds is not None else OUTLIER_ACTIONS[:1]
+    action = st.radio("Apply to all flagged values", actions, horizontal=True)
+    if st.button(f"{action} ({len(scan.columns)} columns)"):
+        result = apply_outlier_rule(df, scan, action, keep=kept)
+        st.success(result.message)
+        st.markdown(f"**New shape:** `{result.df.shape[0]} rows × {result.df.shape[1]} columns`")
+        if result.changed > 0:
+            record_change(result.message, result.columns, before=df, after=result.df, step=result.step,
+                          dropped=result.dropped)
+        df = result.df
+        kept.clear()
 
     return df
-
-
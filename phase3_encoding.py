@@ -1,47 +1,102 @@
 import streamlit as st
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
+from core import ENCODERS, HASH_BUCKETS, densify, estimate_one_hot, hash_encode, label_encode, one_hot_encode, target_encode
+from pipeline import apply_step, dumps_pipeline, loads_pipeline, make_pipeline
+from session import record_change, value_counts
+
+ENCODING_OPS = {"one_hot", "label_encode", "target_encode", "hash_encode"}
+
+def _value_counts(df, columns):
+    return {col: value_counts(df, col) for col in columns}
 
 def encode_categories_tab(df):
     st.subheader("Encode Categorical Variables")
 
-    cat_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+    cat_cols = df.select_dtypes(include=["object", "category", "string"]).columns.tolist()
     if not cat_cols:
         st.info("No categorical columns found.")
         return df
 
     selected_cols = st.multiselect("Select columns to encode", cat_cols)
-    method = st.radio("Encoding method", ["One-Hot Encoding", "Label Encoding"])
+    method = st.radio("Encoding method", ENCODERS, horizontal=True)
     mode = st.radio("How to apply encoding?", ["Add new columns", "Replace original columns"])
+    replace = mode == "Replace original columns"
 
-    if st.button("Apply Encoding"):
-        if not selected_cols:
-            st.warning("Please select at least one column.")
+    # --- Method options ---
+    options = {}
+    problem = None
+    if method == "One-Hot Encoding":
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            top_k = st.number_input("Keep top-k levels (0 = all)", min_value=0, value=0, step=10)
+        with c2:
+            min_share = st.number_input("Min level share % (rest → Other)", min_value=0.0, max_value=100.0, value=0.0)
+        with c3:
+            sparse = st.toggle("Sparse output", value=False)
+        options = {"top_k": top_k or None, "min_frequency": min_share / 100 or None, "sparse": sparse}
+        if selected_cols:
+            counts = _value_counts(df, selected_cols)
+            options["counts"] = counts
+            estimate = estimate_one_hot(df, selected_cols, options["top_k"], options["min_frequency"], counts)
+            st.caption(f"Will add {estimate.new_columns:,} columns: about {estimate.dense_mb:,.1f} MB dense (uint8) "
+                       f"or {estimate.sparse_mb:,.1f} MB sparse.")
+            problem = estimate.problem(sparse)
+    elif method == "Target Encoding":
+        num_cols = [c for c in df.select_dtypes(include="number").columns if c not in selected_cols]
+        if not num_cols:
+            st.warning("Target encoding needs a numeric target column.")
             return df
+        options = {"target": st.selectbox("Target column", num_cols)}
+    elif method == "Hashing":
+        options = {"n_buckets": st.number_input("Hash buckets per column", min_value=2, value=HASH_BUCKETS),
+                   "sparse": st.toggle("Sparse output", value=False)}
 
-        if method == "One-Hot Encoding":
-            encoded_df = pd.get_dummies(df[selected_cols], prefix=selected_cols, drop_first=False)
+    if problem:
+        st.error(problem)
 
-            if mode == "Add new columns":
-                df = pd.concat([df, encoded_df], axis=1)
-            else:  # replace
-                df.drop(columns=selected_cols, inplace=True)
-                df = pd.concat([df, encoded_df], axis=1)
+    if st.button("Apply Encoding", disabled=problem is not None):
+        if not selected_cols:
+            st.warning("Please select at least one column.")
+            return df
 
-        elif method == "Label Encoding":
-            for col in selected_cols:
-                le = LabelEncoder()
-                encoded = le.fit_transform(df[col].astype(str))
-                if mode == "Add new columns":
-                    df[col + "_label"] = encoded
-                else:
-                    df[col] = encoded
+        encode = {"One-Hot Encoding": one_hot_encode, "Label Encoding": label_encode,
+                  "Target Encoding": target_encode, "Hashing": hash_encode}[method]
+        result = encode(df, selected_cols, replace=replace, **options)
+        record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+        df = result.df
 
         st.success(f"Applied {method} to {len(selected_cols)} column(s).")
-        st.dataframe(df.head())
+        st.dataframe(densify(df.head()))
+        if method == "Label Encoding":
+            with st.expander("Label mapping (nulls and unseen values → -1)"):
+                for col, classes in result.step["classes"].items():
+                    st.markdown(f"**{col}** → `{df[col + (result.step['suffix'] or '')].dtype}`, {len(classes)} classes")
+                    st.dataframe(pd.DataFrame({"Value": [str(c) for c in classes[:50]], "Code": range(min(len(classes), 50))}))
+        st.download_button("⬇️ Download fitted encoding (JSON)", dumps_pipeline(make_pipeline([result.step])),
+                           file_name="numerix_encoding.json", mime="application/json")
 
         # Save back to memory
         st.session_state.df = df
-        st.session_state.change_log.append(f"Encoded columns {selected_cols} using {method} ({mode}).")
+
+    # --- Reuse an encoding fitted earlier (same category maps on new data) ---
+    with st.expander("Apply a saved encoding"):
+        saved = st.file_uploader("Encoding or pipeline JSON", type=["json"], key="saved_encoding")
+        if saved is not None and st.button("Apply Saved Encoding"):
+            try:
+                steps = [step for step in loads_pipeline(saved.getvalue())["steps"] if step["op"] in ENCODING_OPS]
+                for step in steps:
+                    missing = set(step["columns"]) - set(df.columns)
+                    if missing:
+                        raise ValueError(f"columns not in the dataset: {sorted(missing)}")
+            except ValueError as e:
+                st.error(f"Cannot apply this encoding: {e}")
+                return df
+            for step in steps:
+                after = apply_step(df, step)
+                record_change(f"Applied saved {step['op']} encoding to {step['columns']}", None,
+                              before=df, after=after, step=step)
+                df = after
+            st.success(f"Applied {len(steps)} saved encoding step(s).")
+            st.session_state.df = df
 
     return df
@@ -1,17 +1,90 @@
+import os
+
 import streamlit as st
+from core import densify
+from data_export import EXPORT_FORMATS, export_bytes, export_chunks_bytes
+from pipeline import dumps_pipeline, replay_chunks
+from session import current_pipeline, stats_cache
+from streaming import iter_store
 
 def export_final_tab(df):
     st.subheader("Export Final Dataset")
 
     st.markdown("You can now download the updated dataset after all preprocessing steps.")
 
-    st.dataframe(df.head())
+    st.dataframe(densify(df.head()))
+
+    fmt = st.selectbox("Format", list(EXPORT_FORMATS),
+                       help="Compressed CSV, Parquet and Feather files are much smaller; Parquet and Feather keep dtypes")
+    extension, mime = EXPORT_FORMATS[fmt]
+
+    # Serialized only when the button is clicked, then kept until the data changes
+    cache = stats_cache()
+    stream_result = st.session_state.get("stream_result")
+    if stream_result is None:
+        st.download_button(
+            label=f"⬇️ Download Final {fmt}",
+            data=lambda: cache.dataset_stat(f"export:{fmt}", df.columns, lambda: export_bytes(df, fmt), key=len(df)),
+            file_name=f"numerix_processed{extension}",
+            mime=mime,
+            on_click="ignore",
+        )
+    else:
+        large_file_export(df, fmt, stream_result, cache)
+
+    # --- Replayable pipeline ---
+    st.markdown("---")
+    st.subheader("Export Pipeline")
+    spec = current_pipeline()
+    if not spec["steps"]:
+        st.info("No replayable steps recorded yet.")
+        return
+
+    st.markdown(f"`{len(spec['steps'])}` step(s) recorded with their fitted parameters.")
+    st.download_button(
+        label="⬇️ Download Pipeline (JSON)",
+        data=dumps_pipeline(spec),
+        file_name="numerix_pipeline.json",
+        mime="application/json"
+    )
+    st.caption("Apply it to new files without the app: "
+               "`python pipeline.py numerix_pipeline.json data/*.csv --out-dir processed`")
+
 
-    csv = df.to_csv(index=False).encode('utf-8')
+def large_file_export(df, fmt, stream_result, cache):
+    # The tabs edited a sample: replay the recorded steps over the spilled chunks of the whole file
+    extension, mime = EXPORT_FORMATS[fmt]
+    steps = st.session_state.get("pipeline_steps", [])
+    n_rows = stream_result.profile.n_rows
+    store_dir = stream_result.store_dir
+    if None not in steps and store_dir and os.path.isdir(store_dir):
+        spec = current_pipeline()
+        if st.button(f"Prepare {fmt} of all {n_rows:,} rows"):
+            with st.spinner("Replaying the recorded steps over the whole file..."):
+                try:
+                    data = cache.dataset_stat(f"export-full:{fmt}", df.columns,
+                                              lambda: export_chunks_bytes(replay_chunks(spec, iter_store(store_dir)), fmt),
+                                              key=len(spec["steps"]))
+                except ValueError as e:
+                    st.error(f"Could not replay the steps over the whole file: {e}")
+                    return
+            st.download_button(
+                label=f"⬇️ Download Final {fmt} (all {n_rows:,} rows)",
+                data=data,
+                file_name=f"numerix_processed{extension}",
+                mime=mime,
+                on_click="ignore",
+            )
+        return
 
+    reason = ("some steps can't be replayed on other data" if None in steps
+              else "the spilled copy of the file is no longer cached")
+    st.warning(f"Large file mode: {reason}, so this download holds only the "
+               f"{len(df):,}-row sample the tabs worked on, not all {n_rows:,} rows.")
     st.download_button(
-        label="⬇️ Download Final CSV",
-        data=csv,
-        file_name="numerix_processed.csv",
-        mime="text/csv"
+        label=f"⬇️ Download Sample {fmt} ({len(df):,} of {n_rows:,} rows)",
+        data=lambda: cache.dataset_stat(f"export:{fmt}", df.columns, lambda: export_bytes(df, fmt), key=len(df)),
+        file_name=f"numerix_processed_sample{extension}",
+        mime=mime,
+        on_click="ignore",
     )
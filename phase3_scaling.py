@@ -1,6 +1,6 @@
 import streamlit as st
-import pandas as pd
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
+from core import SCALE_DTYPES, SCALERS, scale_columns
+from session import record_change
 
 def scale_features_tab(df):
     st.subheader("Feature Scaling")
@@ -11,7 +11,9 @@ def scale_features_tab(df):
         return df
 
     selected_cols = st.multiselect("Select columns to scale", numeric_cols)
-    method = st.selectbox("Select scaling method", ["StandardScaler", "MinMaxScaler", "RobustScaler"])
+    method = st.selectbox("Select scaling method", SCALERS)
+    dtype = st.radio("Output precision", SCALE_DTYPES, horizontal=True,
+                     help="float32 halves the memory of the scaled columns")
     mode = st.radio("How to apply scaling?", ["Replace original columns", "Add new columns (suffix: _scaled)"])
 
     if st.button("Apply Scaling"):
@@ -19,30 +21,16 @@ def scale_features_tab(df):
             st.warning("Please select at least one column.")
             return df
 
-        scaler = None
-        if method == "StandardScaler":
-            scaler = StandardScaler()
-        elif method == "MinMaxScaler":
-            scaler = MinMaxScaler()
-        elif method == "RobustScaler":
-            scaler = RobustScaler()
-
-        scaled_data = scaler.fit_transform(df[selected_cols])
-        scaled_df = pd.DataFrame(scaled_data, columns=selected_cols)
-
-        if mode == "Add new columns (suffix: _scaled)":
-            for col in selected_cols:
-                df[col + "_scaled"] = scaled_df[col]
-        else:
-            for col in selected_cols:
-                df[col] = scaled_df[col]
+        result = scale_columns(df, selected_cols, method, suffix=None if mode == "Replace original columns" else "_scaled",
+                              dtype=dtype)
+        record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+        df = result.df
 
         st.success(f"Applied {method} to {len(selected_cols)} column(s).")
-        st.dataframe(df[selected_cols if mode == 'Replace original columns' else [col + "_scaled" for col in selected_cols]].head())
+        st.dataframe(df[result.columns].head())
 
         # Update global state
         st.session_state.df = df
-        st.session_state.change_log.append(f"Scaled columns {selected_cols} using {method} ({mode}).")
 
     return df
 
@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.express as px
-from scipy.stats import yeojohnson
+from core import AUTO_TRANSFORM, TRANSFORMS, correct_skew, skewed_columns
+from profiler import profile_dataset
+from session import record_change
 
-def transform_skew_tab(df):
+def transform_skew_tab(df, profile=None):
     st.subheader("🔃 Transform Skewed Numeric Features")
 
     num_cols = df.select_dtypes(include=['number']).columns.tolist()
@@ -12,42 +12,39 @@ def transform_skew_tab(df):
         st.info("No numeric columns found.")
         return df
 
-    skew_df = df[num_cols].skew().sort_values(ascending=False)
-    skewed_cols = skew_df[abs(skew_df) > 0.7].index.tolist()
+    if profile is None:
+        profile = profile_dataset(df[num_cols])
+    skewed = skewed_columns(profile, num_cols)
 
-    if not skewed_cols:
+    if skewed.empty:
         st.success("No significantly skewed columns found.")
         return df
 
     st.markdown(f"**Detected Skewed Columns (|skew| > 0.7):**")
-    st.dataframe(skew_df[abs(skew_df) > 0.7].round(2))
+    st.dataframe(skewed.round(2))
 
-    col = st.selectbox("Select a column to transform", skewed_cols)
-    method = st.selectbox("Select transformation", ["Log", "Square Root", "Yeo-Johnson"])
+    cols = st.multiselect("Columns to transform", skewed.index.tolist(), default=skewed.index.tolist())
+    method = st.selectbox("Select transformation", [AUTO_TRANSFORM] + TRANSFORMS,
+                          help="Auto tries every transformation and keeps the one leaving the lowest skew")
     mode = st.radio("How to apply?", ["Add as new column", "Replace original"])
 
     if st.button("Apply Transformation"):
-        transformed = df[col].copy()
-
+        if not cols:
+            st.warning("Please select at least one column.")
+            return df
         try:
-            if method == "Log":
-                transformed = np.log1p(transformed)
-            elif method == "Square Root":
-                transformed = np.sqrt(transformed)
-            elif method == "Yeo-Johnson":
-                transformed, _ = yeojohnson(transformed.fillna(0))  # Replace NaN temporarily
-
-            if mode == "Add as new column":
-                df[col + f"_{method.lower()}"] = transformed
-            else:
-                df[col] = transformed
+            result = correct_skew(df, cols, method, replace=mode == "Replace original")
+            record_change(result.message, result.columns, before=df, after=result.df, step=result.step)
+            df = result.df
 
-            st.success(f"Applied {method} transformation to `{col}`.")
-            st.plotly_chart(px.histogram(transformed, nbins=30, title=f"{col} after {method} transformation"))
+            st.success(f"Transformed {result.changed} column(s).")
+            st.dataframe(result.details["report"].set_index("Column").round(2))
+            if result.columns:
+                target = result.columns[0]
+                st.plotly_chart(px.histogram(df[target], nbins=30, title=f"{target} after transformation"))
 
             # Save to session state
             st.session_state.df = df
-            st.session_state.change_log.append(f"Transformed `{col}` using `{method}` ({mode}).")
 
         except Exception as e:
             st.error(f"❌ Transformation failed: {e}")
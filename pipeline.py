@@ -0,0 +1,347 @@
+# Replays recorded cleaning/preprocessing steps with their fitted parameters on new files:
+#   python pipeline.py numerix_pipeline.json extracts/*.csv --out-dir processed --workers 4
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from core import (apply_scaler, apply_transform, assign_block, convert_column, encode_labels, forest_outliers, hash_frame,
+                  map_by_text, one_hot_frame)
+from streaming import CHUNK_ROWS
+
+PIPELINE_VERSION = 1
+
+
+# ----------------------------------------------------------------- step application
+# Each op takes (chunk, step, state); `state` is a per-step dict that persists
+# across the chunks of one file for ops that need to see earlier rows.
+
+def _dropna(chunk, step, state):
+    return chunk.dropna()
+
+
+def _drop_duplicates(chunk, step, state):
+    # Sorted uint64 hashes of the rows kept so far: 8 bytes per distinct row, growing with the file
+    seen = state.get("seen", np.empty(0, dtype=np.uint64))
+    hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+    at = np.minimum(np.searchsorted(seen, hashes), max(len(seen) - 1, 0))
+    keep = ~pd.Series(hashes).duplicated().to_numpy()
+    if len(seen):
+        keep &= seen[at] != hashes
+    # Two sorted runs: the stable sort (timsort) merges them in linear time
+    state["seen"] = np.sort(np.concatenate([seen, np.sort(hashes[keep])]), kind="stable")
+    return chunk[keep]
+
+
+def _fill(chunk, step, state):
+    col, value = step["column"], step["value"]
+    chunk = chunk.copy(deep=False)
+    if isinstance(chunk[col].dtype, pd.CategoricalDtype) and value not in chunk[col].cat.categories:
+        chunk[col] = chunk[col].cat.add_categories([value])
+    chunk[col] = chunk[col].fillna(value)
+    return chunk
+
+
+def _interpolate(chunk, step, state):
+    # Linear interpolation continues from the last value of the previous chunk;
+    # a gap that straddles a chunk boundary is filled with that last value,
+    # the same way pandas treats trailing gaps.
+    col = step["column"]
+    values = chunk[col].to_numpy(dtype="float64", na_value=np.nan)
+    last = state.get("last")
+    if last is not None:
+        values = np.concatenate([[last], values])
+    filled = pd.Series(values).interpolate(method="linear").to_numpy()
+    if last is not None:
+        filled = filled[1:]
+    valid = filled[~np.isnan(filled)]
+    if len(valid):
+        state["last"] = valid[-1]
+    chunk = chunk.copy(deep=False)
+    chunk[col] = filled
+    return chunk
+
+
+def _convert(chunk, step, state):
+    chunk = chunk.copy(deep=False)
+    # Dates repeat across chunks, so parsed strings are kept in the step state
+    chunk[step["column"]] = convert_column(chunk[step["column"]], step["dtype"], state.setdefault("dates", {}))
+    return chunk
+
+
+def _convert_columns(chunk, step, state):
+    chunk = chunk.copy(deep=False)
+    for col, dtype in step["dtypes"].items():
+        chunk[col] = convert_column(chunk[col], dtype, state.setdefault(col, {}))
+    return chunk
+
+
+def _check_fits(series, dtype):
+    # Downcast widths were fitted to the recorded file; values of a new file may not fit them
+    dtype = pd.api.types.pandas_dtype(dtype)
+    if not pd.api.types.is_numeric_dtype(series) or dtype.kind not in "iuf":
+        return
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if dtype.kind == "f":
+        bad = np.isfinite(values) & (np.abs(values) > np.finfo(dtype).max)
+    else:
+        info = np.iinfo(dtype)
+        bad = (values < info.min) | (values > info.max) | (values != np.floor(values))
+    if bad.any():
+        raise ValueError(f"Column '{series.name}' has values that do not fit {dtype} "
+                         f"(e.g. {values[bad][0]!r}); re-run the memory optimizer on this file")
+
+
+def _astype(chunk, step, state):
+    for col, dtype in step["dtypes"].items():
+        _check_fits(chunk[col], dtype)
+    return chunk.astype(step["dtypes"])
+
+
+def _filter_range(chunk, step, state):
+    values = chunk[step["column"]]
+    return chunk[~((values < step["lower"]) | (values > step["upper"]))]
+
+
+def _outside(chunk, bounds):
+    return {col: ((chunk[col] < lo) | (chunk[col] > hi)).to_numpy() for col, (lo, hi) in bounds.items()}
+
+
+def _filter_bounds(chunk, step, state):
+    flagged = np.logical_or.reduce(list(_outside(chunk, step["bounds"]).values()) or [np.zeros(len(chunk), bool)])
+    return chunk[~flagged]
+
+
+def _filter_forest(chunk, step, state):
+    return chunk[~forest_outliers(chunk, step["forest"])]
+
+
+def _clip_bounds(chunk, step, state):
+    chunk = chunk.copy(deep=False)
+    for col, (lo, hi) in step["bounds"].items():
+        chunk[col] = chunk[col].clip(lo, hi)
+    return chunk
+
+
+def _null_bounds(chunk, step, state):
+    chunk = chunk.copy(deep=False)
+    for col, outside in _outside(chunk, step["bounds"]).items():
+        chunk[col] = chunk[col].mask(outside)
+    return chunk
+
+
+def _scale(chunk, step, state):
+    suffix = step.get("suffix") or ""
+    block = chunk[step["columns"]].to_numpy(dtype=step.get("dtype", "float64"), na_value=np.nan, copy=True)
+    return assign_block(chunk, apply_scaler(block, step["center"], step["scale"]), [col + suffix for col in step["columns"]])
+
+
+def _one_hot(chunk, step, state):
+    other, sparse = step.get("other", {}), step.get("sparse", False)
+    dummies = [one_hot_frame(chunk[col], step["categories"][col], other.get(col, False), sparse)
+               for col in step["columns"]]
+    if step.get("replace"):
+        chunk = chunk.drop(columns=step["columns"])
+    return pd.concat([chunk, *dummies], axis=1)
+
+
+def _target_encode(chunk, step, state):
+    chunk = chunk.copy(deep=False)
+    suffix = step.get("suffix") or ""
+    for col in step["columns"]:
+        chunk[col + suffix] = map_by_text(chunk[col], step["maps"][col], step["default"])
+    return chunk
+
+
+def _hash_encode(chunk, step, state):
+    hashed = [hash_frame(chunk[col], step["n_buckets"], step.get("sparse", False)) for col in step["columns"]]
+    if step.get("replace"):
+        chunk = chunk.drop(columns=step["columns"])
+    return pd.concat([chunk, *hashed], axis=1)
+
+
+def _label_encode(chunk, step, state):
+    suffix = step.get("suffix") or ""
+    # Values unseen when the pipeline was recorded (and nulls) become -1
+    return chunk.assign(**{col + suffix: encode_labels(chunk[col], step["classes"][col]) for col in step["columns"]})
+
+
+def _transform(chunk, step, state):
+    # Single-column steps recorded before transform_columns existed
+    params = {"lmbda": step.get("lmbda")}
+    values = chunk[step["column"]].to_numpy(dtype="float64", na_value=np.nan)
+    return chunk.assign(**{step["target"]: apply_transform(values, step["method"], params)})
+
+
+def _transform_columns(chunk, step, state):
+    return chunk.assign(**{
+        t["target"]: apply_transform(chunk[col].to_numpy(dtype="float64", na_value=np.nan), t["method"], t)
+        for col, t in step["transforms"].items()
+    })
+
+
+OPS = {
+    "dropna": _dropna,
+    "drop_duplicates": _drop_duplicates,
+    "fill": _fill,
+    "interpolate": _interpolate,
+    "convert": _convert,
+    "convert_columns": _convert_columns,
+    "astype": _astype,
+    "filter_range": _filter_range,
+    "filter_bounds": _filter_bounds,
+    "filter_forest": _filter_forest,
+    "clip_bounds": _clip_bounds,
+    "null_bounds": _null_bounds,
+    "scale": _scale,
+    "one_hot": _one_hot,
+    "label_encode": _label_encode,
+    "target_encode": _target_encode,
+    "hash_encode": _hash_encode,
+    "transform": _transform,
+    "transform_columns": _transform_columns,
+}
+
+
+def apply_step(chunk, step, state=None):
+    return OPS[step["op"]](chunk, step, {} if state is None else state)
+
+
+def apply_pipeline(df, spec):
+    """Apply every step of `spec` to an in-memory frame."""
+    for step in spec["steps"]:
+        df = apply_step(df, step)
+    return df
+
+
+def replay_chunks(spec, chunks):
+    # Chunks of one file, in order; steps keep state across them (e.g. rows already seen by drop_duplicates)
+    states = [{} for _ in spec["steps"]]
+    for chunk in chunks:
+        for step, state in zip(spec["steps"], states):
+            chunk = apply_step(chunk, step, state)
+        yield chunk
+
+
+# ----------------------------------------------------------------- (de)serialization
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} in a pipeline step")
+
+
+def make_pipeline(steps):
+    return {"version": PIPELINE_VERSION, "steps": list(steps)}
+
+
+def dumps_pipeline(spec):
+    return json.dumps(spec, indent=2, default=_json_default)
+
+
+def save_pipeline(spec, path):
+    with open(path, "w") as f:
+        f.write(dumps_pipeline(spec))
+
+
+def loads_pipeline(text):
+    spec = json.loads(text)
+    unknown = {step["op"] for step in spec["steps"]} - set(OPS)
+    if unknown:
+        raise ValueError(f"Unknown pipeline step(s): {sorted(unknown)}")
+    return spec
+
+
+def load_pipeline(path):
+    with open(path) as f:
+        return loads_pipeline(f.read())
+
+
+# ----------------------------------------------------------------- headless runner
+
+def run_pipeline(spec, source, dest, chunksize=CHUNK_ROWS):
+    """Stream `source` through the pipeline in chunks, writing CSV to `dest`."""
+    start = time.perf_counter()
+    rows_in = rows_out = 0
+
+    def counted(reader):
+        nonlocal rows_in
+        for chunk in reader:
+            rows_in += len(chunk)
+            yield chunk
+
+    with pd.read_csv(source, chunksize=chunksize, low_memory=False) as reader:
+        for i, chunk in enumerate(replay_chunks(spec, counted(reader))):
+            chunk.to_csv(dest, mode="w" if i == 0 else "a", header=i == 0, index=False)
+            rows_out += len(chunk)
+    return {"source": source, "dest": dest, "rows_in": rows_in, "rows_out": rows_out,
+            "seconds": round(time.perf_counter() - start, 3)}
+
+
+def destinations(sources, out_dir):
+    # Outputs mirror the inputs' paths below their common directory, so
+    # 2023/sales.csv and 2024/sales.csv don't overwrite each other
+    paths = [os.path.abspath(source) for source in sources]
+    if not paths:
+        return {}
+    base = os.path.commonpath([os.path.dirname(path) for path in paths])
+    return {source: os.path.join(out_dir, os.path.relpath(path, base)) for source, path in zip(sources, paths)}
+
+
+def run_batch(spec, sources, out_dir, workers=None, chunksize=CHUNK_ROWS):
+    """Run the pipeline over many files in a process pool.
+
+    Yields one result dict per file as it finishes; failures carry an
+    "error" message instead of row counts.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    dests = destinations(sources, out_dir)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for source, dest in dests.items():
+            if os.path.realpath(dest) == os.path.realpath(source):
+                yield {"source": source, "error": f"output {dest} would overwrite the input; pick another --out-dir"}
+                continue
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            futures[pool.submit(run_pipeline, spec, source, dest, chunksize)] = source
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield {"source": futures[future], "error": str(e)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a recorded Numerix pipeline to CSV files.")
+    parser.add_argument("pipeline", help="pipeline JSON downloaded from the Export tab")
+    parser.add_argument("inputs", nargs="+", help="CSV files or glob patterns")
+    parser.add_argument("--out-dir", default="processed")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    spec = load_pipeline(args.pipeline)
+    sources = sorted({path for pattern in args.inputs for path in (glob.glob(pattern) or [pattern])})
+    failed = 0
+    for result in run_batch(spec, sources, args.out_dir, args.workers, args.chunksize):
+        if "error" in result:
+            failed += 1
+            print(f"FAILED {result['source']}: {result['error']}")
+        else:
+            print(f"{result['source']} -> {result['dest']}: {result['rows_in']} -> {result['rows_out']} rows "
+                  f"in {result['seconds']}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
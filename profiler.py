@@ -0,0 +1,182 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from sketches import SKETCH_CHUNK_ROWS, SKETCH_ROWS, HyperLogLog, SpaceSaving, sketch_hashes
+
+TOP_K = 10
+# A long column is sketched when its first chunk is mostly distinct values (ID-like);
+# repetitive columns are cheaper to count exactly
+SKETCH_DISTINCT_SHARE = 0.5
+
+
+@dataclass
+class ColumnProfile:
+    name: str
+    dtype: str
+    count: int
+    nulls: int
+    distinct: int
+    is_numeric: bool = False
+    is_categorical: bool = False
+    min: float = np.nan
+    max: float = np.nan
+    mean: float = np.nan
+    std: float = np.nan
+    skew: float = np.nan
+    q25: float = np.nan
+    q50: float = np.nan
+    q75: float = np.nan
+    top_values: pd.Series = field(default_factory=lambda: pd.Series(dtype="int64"))
+    # Set when distinct/top values (and quartiles, when streamed) come from sketches
+    approximate: bool = False
+    distinct_error: float = 0.0   # relative standard error of `distinct`
+    top_error: int = 0            # top_values counts overcount by at most this much
+    quantile_error: float = 0.0   # quartiles are off by at most this share of rows
+
+
+@dataclass
+class DatasetProfile:
+    n_rows: int
+    columns: dict
+
+    @property
+    def n_cols(self):
+        return len(self.columns)
+
+    @property
+    def numeric_columns(self):
+        return [name for name, p in self.columns.items() if p.is_numeric]
+
+    @property
+    def categorical_columns(self):
+        return [name for name, p in self.columns.items() if p.is_categorical]
+
+    def dtypes(self):
+        return pd.Series({name: p.dtype for name, p in self.columns.items()}, dtype=object)
+
+    def null_counts(self):
+        return pd.Series({name: p.nulls for name, p in self.columns.items()}, dtype="int64")
+
+    def constant_columns(self):
+        return [name for name, p in self.columns.items() if p.distinct <= 1]
+
+    def approximate_columns(self):
+        return [name for name, p in self.columns.items() if p.approximate]
+
+    def high_cardinality_columns(self, ratio=0.9):
+        return [name for name, p in self.columns.items() if p.distinct > self.n_rows * ratio]
+
+    def describe(self):
+        # Same layout as df.describe().T: numeric summary, or object summary
+        # when the frame has no numeric columns.
+        if self.numeric_columns:
+            rows = {
+                name: {
+                    "count": float(p.count), "mean": p.mean, "std": p.std, "min": p.min,
+                    "25%": p.q25, "50%": p.q50, "75%": p.q75, "max": p.max,
+                }
+                for name, p in self.columns.items() if p.is_numeric
+            }
+        else:
+            rows = {
+                name: {
+                    "count": p.count, "unique": p.distinct,
+                    "top": p.top_values.index[0] if len(p.top_values) else np.nan,
+                    "freq": p.top_values.iloc[0] if len(p.top_values) else np.nan,
+                }
+                for name, p in self.columns.items()
+            }
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def is_numeric_column(series):
+    # Matches select_dtypes(include='number'): booleans are not numeric here.
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def is_categorical_column(series):
+    return (
+        pd.api.types.is_object_dtype(series)
+        or pd.api.types.is_string_dtype(series)
+        or isinstance(series.dtype, pd.CategoricalDtype)
+    )
+
+
+def _skew(valid, mean):
+    # Adjusted Fisher-Pearson coefficient, as returned by Series.skew()
+    n = valid.size
+    if n < 3:
+        return np.nan
+    dev = valid - mean
+    m2 = np.mean(dev ** 2)
+    if m2 == 0:
+        return 0.0
+    m3 = np.mean(dev ** 3)
+    return float(np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5)
+
+
+def sketch_counts(series, top_k=TOP_K):
+    """(distinct, top values, distinct error, top error) from HyperLogLog and
+    Space-Saving sketches, fed a chunk at a time so no full value_counts is built."""
+    distinct, top = HyperLogLog(), SpaceSaving()
+    for start in range(0, len(series), SKETCH_CHUNK_ROWS):
+        chunk = series.iloc[start:start + SKETCH_CHUNK_ROWS].dropna()
+        hashes = sketch_hashes(chunk)
+        distinct.update_hashes(hashes)
+        top.update(chunk, hashes)
+    counts, errors = top.top(top_k)
+    counts.index.name = series.name
+    return distinct.estimate(), counts, distinct.relative_error, int(errors.max()) if len(errors) else 0
+
+
+def _is_id_like(series):
+    head = series.iloc[:SKETCH_CHUNK_ROWS]
+    return head.nunique() > SKETCH_DISTINCT_SHARE * len(head)
+
+
+def profile_column(series, top_k=TOP_K, approximate=None):
+    """Column statistics; `approximate` (default: long ID-like columns, see SKETCH_ROWS)
+    takes the distinct count and top values from sketches."""
+    nulls = int(series.isna().sum())
+    count = len(series) - nulls
+    if approximate is None:
+        approximate = len(series) > SKETCH_ROWS and _is_id_like(series)
+    if approximate:
+        distinct, top_values, distinct_error, top_error = sketch_counts(series, top_k)
+        distinct = min(distinct, count)
+    else:
+        # value_counts is the single hash pass that yields both distinct count and top-k
+        counts = series.value_counts(dropna=True)
+        distinct, top_values, distinct_error, top_error = len(counts), counts.head(top_k), 0.0, 0
+    profile = ColumnProfile(
+        name=series.name,
+        dtype=str(series.dtype),
+        count=count,
+        nulls=nulls,
+        distinct=distinct,
+        is_numeric=is_numeric_column(series),
+        is_categorical=is_categorical_column(series),
+        top_values=top_values,
+        approximate=approximate,
+        distinct_error=distinct_error,
+        top_error=top_error,
+    )
+
+    if profile.is_numeric and profile.count:
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        valid = values[~np.isnan(values)]
+        profile.min = float(valid.min())
+        profile.max = float(valid.max())
+        profile.mean = float(valid.mean())
+        profile.std = float(valid.std(ddof=1)) if valid.size > 1 else np.nan
+        profile.skew = _skew(valid, profile.mean)
+        profile.q25, profile.q50, profile.q75 = (float(q) for q in np.percentile(valid, [25, 50, 75]))
+
+    return profile
+
+
+def profile_dataset(df, top_k=TOP_K):
+    columns = {col: profile_column(df[col], top_k=top_k) for col in df.columns}
+    return DatasetProfile(n_rows=df.shape[0], columns=columns)
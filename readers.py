@@ -0,0 +1,173 @@
+"""Pluggable file readers with column projection and row ranges.
+
+Each reader takes a source (raw bytes of an upload, or a file path) and
+can list the columns without reading the data, so wide files only
+materialize the selected columns. Parquet and Feather go through Arrow
+zero-copy: paths are memory-mapped, uploaded bytes are wrapped without
+copying, and only the row groups / record batches overlapping the
+requested row range are read.
+
+New formats are added with `register_reader`.
+"""
+import io
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+@dataclass
+class Reader:
+    name: str
+    extensions: tuple
+    columns: callable     # source -> list of column names
+    read: callable        # (source, columns, rows) -> DataFrame
+    columnar: bool = False
+
+
+READERS = {}
+
+
+def register_reader(reader):
+    READERS[reader.name] = reader
+
+
+def detect_format(filename):
+    name = filename.lower()
+    # Longest extension first so ".csv.gz" wins over ".gz"
+    for reader, ext in sorted(((r, e) for r in READERS.values() for e in r.extensions), key=lambda p: -len(p[1])):
+        if name.endswith(ext):
+            return reader.name
+    raise ValueError(f"Unsupported file type: {filename}")
+
+
+def supported_extensions():
+    return sorted({ext.rsplit(".", 1)[-1] for reader in READERS.values() for ext in reader.extensions})
+
+
+def _arrow_source(source):
+    return pa.memory_map(source) if isinstance(source, (str, os.PathLike)) else pa.BufferReader(source)
+
+
+def _text_source(source):
+    return source if isinstance(source, (str, os.PathLike)) else io.BytesIO(source)
+
+
+def _row_window(rows):
+    start, stop = rows if rows else (0, None)
+    return start or 0, stop
+
+
+def _slice_pieces(sizes, start, stop):
+    """Indices of the pieces (row groups / batches) overlapping [start, stop), and the offset of the first."""
+    picked, offset, first = [], 0, None
+    for i, size in enumerate(sizes):
+        if offset + size > start and (stop is None or offset < stop):
+            picked.append(i)
+            first = offset if first is None else first
+        offset += size
+    return picked, first or 0
+
+
+def _finish(table, start, stop, first):
+    length = None if stop is None else stop - start
+    return table.slice(start - first, length).to_pandas()
+
+
+# ----------------------------------------------------------------- CSV
+
+def parse_csv(data, usecols=None, compression=None):
+    # The pyarrow engine is multi-threaded and infers dtypes (incl. timestamps);
+    # fall back to the C parser for inputs it rejects or when pyarrow is missing.
+    try:
+        return pd.read_csv(_text_source(data), engine="pyarrow", usecols=usecols, compression=compression)
+    except Exception:
+        return pd.read_csv(_text_source(data), usecols=usecols, compression=compression, low_memory=False)
+
+
+def _csv_columns(source, compression=None):
+    return pd.read_csv(_text_source(source), nrows=0, compression=compression).columns.tolist()
+
+
+def _read_csv(source, columns=None, rows=None, compression=None):
+    start, stop = _row_window(rows)
+    if not rows:
+        return parse_csv(source, columns, compression)  # full read: multi-threaded pyarrow engine
+    # The C parser skips unselected columns and rows while tokenizing
+    return pd.read_csv(_text_source(source), usecols=columns, compression=compression, low_memory=False,
+                       skiprows=range(1, start + 1) if start else None,
+                       nrows=None if stop is None else stop - start)
+
+
+register_reader(Reader("csv", (".csv",), _csv_columns, _read_csv))
+register_reader(Reader(
+    "csv.gz", (".csv.gz", ".gz"),
+    lambda source: _csv_columns(source, "gzip"),
+    lambda source, columns=None, rows=None: _read_csv(source, columns, rows, "gzip"),
+))
+
+
+# ----------------------------------------------------------------- Parquet
+
+def _parquet_columns(source):
+    return pq.ParquetFile(_arrow_source(source)).schema_arrow.names
+
+
+def _read_parquet(source, columns=None, rows=None):
+    pf = pq.ParquetFile(_arrow_source(source))
+    start, stop = _row_window(rows)
+    sizes = [pf.metadata.row_group(i).num_rows for i in range(pf.num_row_groups)]
+    groups, first = _slice_pieces(sizes, start, stop)
+    return _finish(pf.read_row_groups(groups, columns=columns, use_pandas_metadata=True), start, stop, first)
+
+
+register_reader(Reader("parquet", (".parquet", ".pq"), _parquet_columns, _read_parquet, columnar=True))
+
+
+# ----------------------------------------------------------------- Feather (Arrow IPC)
+
+def _feather_columns(source):
+    return pa.ipc.open_file(_arrow_source(source)).schema.names
+
+
+def _read_feather(source, columns=None, rows=None):
+    reader = pa.ipc.open_file(_arrow_source(source))
+    start, stop = _row_window(rows)
+    # Batch lengths come from the footer; get_batch maps the buffers without copying
+    batches = [reader.get_batch(i) for i in range(reader.num_record_batches)]
+    picked, first = _slice_pieces([len(b) for b in batches], start, stop)
+    table = pa.Table.from_batches([batches[i] for i in picked], schema=reader.schema)
+    if columns:
+        table = table.select(columns)
+    return _finish(table, start, stop, first)
+
+
+register_reader(Reader("feather", (".feather", ".arrow", ".ipc"), _feather_columns, _read_feather, columnar=True))
+
+
+# ----------------------------------------------------------------- Excel (needs openpyxl)
+
+def _excel_columns(source):
+    return pd.read_excel(_text_source(source), nrows=0).columns.tolist()
+
+
+def _read_excel(source, columns=None, rows=None):
+    start, stop = _row_window(rows)
+    return pd.read_excel(_text_source(source), usecols=columns,
+                         skiprows=range(1, start + 1) if start else None,
+                         nrows=None if stop is None else stop - start)
+
+
+register_reader(Reader("excel", (".xlsx", ".xlsm", ".xls"), _excel_columns, _read_excel))
+
+
+def read_columns(source, fmt):
+    return READERS[fmt].columns(source)
+
+
+def read_table(source, fmt, columns=None, rows=None):
+    """Read `source` as a DataFrame; `columns` limits the columns and
+    `rows=(start, stop)` the data rows (stop exclusive, None = to the end)."""
+    return READERS[fmt].read(source, columns or None, rows)
@@ -1,9 +1,10 @@
 from fpdf import FPDF
 import tempfile
 import pandas as pd
-import plotly.io as pio
-import os
-import time
+import io
+from chart_export import render_png
+from profiler import profile_dataset
+from correlation import correlation_matrix, high_correlation_pairs
 
 class PDFReport(FPDF):
     def header(self):
@@ -25,7 +26,10 @@ class PDFReport(FPDF):
         self.multi_cell(0, 6, text)
         self.ln()
 
-def generate_pdf_report(df, charts: list, dataset_name="Unnamed Dataset"):
+def generate_pdf_report(df, charts: list, dataset_name="Unnamed Dataset", profile=None, corr=None, output_path=None):
+    if profile is None:
+        profile = profile_dataset(df)
+
     pdf = PDFReport()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
@@ -36,20 +40,20 @@ def generate_pdf_report(df, charts: list, dataset_name="Unnamed Dataset"):
 
     # Dataset Info
     pdf.section_title("Dataset Info")
-    shape_info = f"Rows: {df.shape[0]}\nColumns: {df.shape[1]}"
+    shape_info = f"Rows: {profile.n_rows}\nColumns: {profile.n_cols}"
     pdf.section_body(shape_info)
 
     # Data Types
     pdf.section_title("Data Types")
     try:
-        dtypes_str = df.dtypes.astype(str).to_string()
+        dtypes_str = profile.dtypes().to_string()
         pdf.section_body(dtypes_str)
     except Exception as e:
         pdf.section_body(f"Could not extract data types: {e}")
 
     # Null Values
     pdf.section_title("Null Values")
-    nulls = df.isnull().sum()
+    nulls = profile.null_counts()
     nulls_present = nulls[nulls > 0]
     if not nulls_present.empty:
         pdf.section_body(nulls_present.to_string())
@@ -60,7 +64,7 @@ def generate_pdf_report(df, charts: list, dataset_name="Unnamed Dataset"):
     pdf.add_page()
     pdf.section_title("Descriptive Statistics")
     try:
-        desc_stats = df.describe().T.round(2).to_string()
+        desc_stats = profile.describe().round(2).to_string()
         pdf.section_body(desc_stats)
     except Exception as e:
         pdf.section_body(f"Could not compute statistics: {e}")
@@ -68,13 +72,9 @@ def generate_pdf_report(df, charts: list, dataset_name="Unnamed Dataset"):
     # Correlation Matrix
     pdf.section_title("Correlation Matrix (|corr| > 0.85)")
     try:
-        corr = df.select_dtypes(include='number').corr()
-        pairs = []
-        for i in range(len(corr.columns)):
-            for j in range(i):
-                val = corr.iloc[i, j]
-                if abs(val) > 0.85:
-                    pairs.append(f"{corr.columns[i]} <-> {corr.columns[j]}: {val:.2f}")
+        if corr is None:
+            corr = correlation_matrix(df, profile.numeric_columns)
+        pairs = [f"{a} <-> {b}: {val:.2f}" for a, b, val in high_correlation_pairs(corr, 0.85)]
         corr_text = "\n".join(pairs) if pairs else "No strong correlations."
         pdf.section_body(corr_text)
     except Exception as e:
@@ -84,17 +84,19 @@ def generate_pdf_report(df, charts: list, dataset_name="Unnamed Dataset"):
     if charts:
         pdf.add_page()
         pdf.section_title("Visualizations")
-        for fig in charts:
+        # Rendered concurrently and cached by figure spec; PNGs stay in memory
+        for png in render_png(charts, scale=2):
             try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmpfile:
-                    tmpfile_path = tmpfile.name
-                fig.write_image(tmpfile_path, format="png", scale=2)
-                pdf.image(tmpfile_path, w=180)
-                time.sleep(0.1)
-                os.unlink(tmpfile_path)
+                if isinstance(png, Exception):
+                    raise png
+                pdf.image(io.BytesIO(png), w=180)
             except Exception as e:
                 pdf.section_body(f"[Error rendering chart: {e}]")
 
+    if output_path is not None:
+        pdf.output(output_path)
+        return output_path
+
     # Save final PDF to temp location
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as f:
         pdf.output(f.name)
@@ -0,0 +1,120 @@
+import streamlit as st
+
+from backends import make_backend
+from core import reservoir_sample
+from data_loader import cached_path
+from history import DatasetHistory
+from pipeline import make_pipeline
+from stats_cache import StatsCache, cached_profile
+
+
+def reset_session(df):
+    st.session_state.df = df
+    st.session_state.change_log = []
+    st.session_state.pipeline_steps = []
+    st.session_state.stats_cache = StatsCache()
+    st.session_state.history = DatasetHistory()
+    st.session_state.backends = {}
+    exploration_sample(df)
+
+
+def stats_cache():
+    if "stats_cache" not in st.session_state:
+        st.session_state.stats_cache = StatsCache()
+    return st.session_state.stats_cache
+
+
+def history():
+    if "history" not in st.session_state:
+        st.session_state.history = DatasetHistory()
+    return st.session_state.history
+
+
+def compute_backend():
+    # Engine picked for this session; while the data is still the parsed upload,
+    # DuckDB/Polars scan its Parquet cache file instead of the in-memory frame
+    pristine = (not st.session_state.get("change_log") and st.session_state.get("memory_report") is None
+                and st.session_state.get("stream_result") is None)
+    fingerprint = st.session_state.get("dataset_fingerprint")
+    path = cached_path(fingerprint) if pristine and fingerprint else None
+    # One instance per engine and source, so DuckDB keeps its connection and registered view
+    key = (st.session_state.get("compute_backend", "pandas"), path)
+    backends = st.session_state.setdefault("backends", {})
+    if key not in backends:
+        backends[key] = make_backend(*key)
+    return backends[key]
+
+
+def current_profile(df):
+    return cached_profile(df, stats_cache(), compute_backend())
+
+
+def current_correlation(df):
+    # Computed once per data version and backend, shared by Insights, Explore and the PDF report;
+    # with pandas very wide/tall frames fall back to a row sample (see correlation.approximate_row_budget)
+    columns = df.select_dtypes(include="number").columns.tolist()
+    backend = compute_backend()
+    return stats_cache().dataset_stat(
+        "correlation", columns,
+        lambda: backend.correlation(df, columns),
+        key=(tuple(columns), len(df), backend.name),
+    )
+
+
+def value_counts(df, column):
+    return stats_cache().column_stat(df[column], "value_counts", lambda _: compute_backend().value_counts(df, column))
+
+
+def column_quantiles(df, column, qs):
+    return stats_cache().column_stat(df[column], f"quantiles{tuple(qs)}",
+                                     lambda _: compute_backend().quantiles(df, [column], list(qs))[column])
+
+
+def exploration_sample(df, stratify=None):
+    # Row sample behind the interactive Explore charts; drawn at load time and
+    # redrawn only when the data changes or another stratification is picked
+    return stats_cache().dataset_stat(
+        "exploration_sample", df.columns,
+        lambda: reservoir_sample(df, stratify=stratify),
+        key=(len(df), stratify),
+    )
+
+
+def current_pipeline():
+    # Replayable steps recorded so far (see pipeline.py)
+    return make_pipeline(step for step in st.session_state.get("pipeline_steps", []) if step is not None)
+
+
+def record_change(message, columns=None, before=None, after=None, step=None, dropped=None):
+    # Single entry point for dataset mutations: logs the step, invalidates
+    # cached statistics of the touched columns (None = every column),
+    # given the versions before/after stores an undoable delta, and keeps
+    # the fitted pipeline `step` (aligned with the change log) for replay.
+    # `dropped` are the row positions removed by row-dropping changes.
+    st.session_state.setdefault("change_log", []).append(message)
+    st.session_state.setdefault("pipeline_steps", []).append(step)
+    stats_cache().invalidate(columns)
+    if before is not None and after is not None:
+        history().record(before, after, message, columns, spec=step, dropped=dropped)
+
+
+def _touched(step):
+    return None if step.dropped_positions is not None else list(step.before)
+
+
+def undo_change():
+    df, step = history().undo(st.session_state.df)
+    st.session_state.df = df
+    st.session_state.change_log.pop()
+    st.session_state.pipeline_steps.pop()
+    stats_cache().invalidate(_touched(step))
+    return step
+
+
+def redo_change():
+    df, step = history().redo(st.session_state.df)
+    st.session_state.df = df
+    st.session_state.change_log.append(step.description)
+    st.session_state.pipeline_steps.append(step.spec)
+    stats_cache().invalidate(_touched(step))
+    return step
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+SKETCH_ROWS = 1_000_000       # longer columns get sketched distinct counts and top values
+SKETCH_CHUNK_ROWS = 100_000   # rows hashed and counted at a time
+TOP_CAPACITY = 1_000          # candidate values kept per column for top-k
+
+_FNV_PRIME = np.uint64(0x100000001B3)
+_MIX1, _MIX2 = np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB)
+
+
+def hash_values(series):
+    # 64-bit hashes, vectorized; equal values hash equally across chunks.
+    # Stable across runs: the hashing encoder stores buckets derived from them.
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _mix(h):
+    # splitmix64 finalizer: spreads the polynomial hash over all 64 bits
+    h = (h ^ (h >> np.uint64(30))) * _MIX1
+    h = (h ^ (h >> np.uint64(27))) * _MIX2
+    return h ^ (h >> np.uint64(31))
+
+
+def _hash_strings(array):
+    # Polynomial hash of each string over the Arrow byte buffer (uint64 arithmetic wraps)
+    array = array.combine_chunks() if isinstance(array, pa.ChunkedArray) else array
+    array = array.cast(pa.large_string())
+    n = len(array)
+    offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)[array.offset:array.offset + n + 1]
+    lengths = np.diff(offsets)
+    h = np.zeros(n, dtype=np.uint64)
+    if n and offsets[-1] > offsets[0]:
+        data = np.frombuffer(array.buffers()[2], dtype=np.uint8)[offsets[0]:offsets[-1]]
+        starts = offsets[:-1] - offsets[0]
+        powers = np.ones(int(lengths.max()), dtype=np.uint64)
+        powers[1:] = np.cumprod(np.full(len(powers) - 1, _FNV_PRIME, dtype=np.uint64))
+        terms = data.astype(np.uint64) * powers[np.arange(data.size) - np.repeat(starts, lengths)]
+        nonempty = lengths > 0
+        h[nonempty] = np.add.reduceat(terms, starts[nonempty])
+    return _mix(h + lengths.astype(np.uint64) + _FNV_PRIME)
+
+
+def sketch_hashes(series):
+    """64-bit hashes for sketches; text is hashed straight from its Arrow buffer.
+
+    Several times faster than hash_values on strings, but the values are
+    only meant for in-memory sketches, not for anything stored.
+    """
+    if pd.api.types.is_string_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+        try:
+            return _hash_strings(pa.array(series, from_pandas=True))
+        except (pa.ArrowException, TypeError):
+            pass  # mixed-type object column
+    return hash_values(series)
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch; relative error is about 1.04 / sqrt(2 ** p)."""
+
+    def __init__(self, p=14):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, series):
+        self.update_hashes(sketch_hashes(series.dropna()))
+
+    def update_hashes(self, hashes):
+        if not len(hashes):
+            return
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        # rank = position of the leftmost 1-bit in the remaining (64 - p) bits;
+        # frexp's exponent is the bit length (exact, the values fit in 53 bits)
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (64 - self.p) - bit_length + 1
+        np.maximum.at(self.registers, idx, rank.astype(np.uint8))
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros:
+            raw = m * np.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(raw))
+
+
+class CountMinSketch:
+    """Frequency table of `depth` rows of `width` counters.
+
+    Estimates never undercount; they overcount by at most `epsilon * total`
+    with probability 1 - `delta` (epsilon = e / width, delta = e ** -depth).
+    """
+
+    def __init__(self, width=1 << 14, depth=4):
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    @property
+    def epsilon(self):
+        return np.e / self.table.shape[1]
+
+    @property
+    def delta(self):
+        return np.exp(-self.table.shape[0])
+
+    def _cells(self, hashes):
+        # Double hashing: row i uses h1 + i * h2
+        h1, h2 = hashes & np.uint64(0xFFFFFFFF), (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.table.shape[0], dtype=np.uint64)[:, None]
+        return ((h1 + rows * h2) % np.uint64(self.table.shape[1])).astype(np.int64)
+
+    def update_hashes(self, hashes, counts=None):
+        width = self.table.shape[1]
+        for row, cells in enumerate(self._cells(hashes)):
+            self.table[row] += np.bincount(cells, weights=counts, minlength=width).astype(np.int64)
+        self.total += len(hashes) if counts is None else int(np.sum(counts))
+
+    def estimate_hashes(self, hashes):
+        cells = self._cells(hashes)
+        return self.table[np.arange(len(cells))[:, None], cells].min(axis=0)
+
+
+class SpaceSaving:
+    """The `capacity` most frequent values, for top-k on high-cardinality columns.
+
+    Fed a chunk at a time: each chunk is counted exactly and merged, and
+    values pushed out raise the error `floor` charged to values arriving
+    later. Counts never undercount; a Count-Min sketch caps them from
+    above, and `top` reports the largest possible overcount of each.
+    """
+
+    def __init__(self, capacity=TOP_CAPACITY):
+        self.capacity = capacity
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.errors = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=object)
+        self.floor = 0
+        self.count_min = CountMinSketch()
+
+    def update(self, series, hashes=None):
+        """Add a chunk; `hashes` are its sketch_hashes when already computed (nulls dropped)."""
+        if hashes is None:
+            series = series.dropna()
+            hashes = sketch_hashes(series)
+        if not len(hashes):
+            return
+        uniq, first, counts = np.unique(hashes, return_index=True, return_counts=True)
+        self.count_min.update_hashes(uniq, counts)
+        # Values not tracked may have been dropped earlier with up to `floor` occurrences
+        charged = np.where(np.isin(uniq, self.hashes), 0, self.floor)
+        keys, source, inverse = np.unique(np.concatenate([self.hashes, uniq]), return_index=True,
+                                          return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate([self.counts, counts + charged])).astype(np.int64)
+        errors = np.bincount(inverse, weights=np.concatenate([self.errors, charged])).astype(np.int64)
+
+        keep = slice(None)
+        if len(keys) > self.capacity:
+            order = np.argsort(-counts, kind="stable")
+            self.floor = max(self.floor, int(counts[order[self.capacity]]))
+            keep = np.sort(order[:self.capacity])
+        keys, counts, errors, source = keys[keep], counts[keep], errors[keep], source[keep]
+
+        # Only the values that stay tracked are materialized as Python objects
+        tracked = source < len(self.hashes)
+        values = np.empty(len(keys), dtype=object)
+        values[tracked] = self.values[source[tracked]]
+        values[~tracked] = series.iloc[first[source[~tracked] - len(self.hashes)]].to_numpy(dtype=object)
+        self.hashes, self.counts, self.errors, self.values = keys, counts, errors, values
+
+    def top(self, k):
+        """(counts, overcount bounds) of the `k` most frequent values, as Series indexed by value."""
+        upper = np.minimum(self.counts, self.count_min.estimate_hashes(self.hashes))
+        lower = self.counts - self.errors
+        order = np.argsort(-upper, kind="stable")[:k]
+        index = pd.Index(self.values[order])
+        return (pd.Series(upper[order], index=index, name="count"),
+                pd.Series(upper[order] - lower[order], index=index, name="error"))
+
+
+class TDigest:
+    """Mergeable quantile sketch (merging t-digest with the k1 scale function).
+
+    Keeps about `compression / 2` centroids, smallest near the tails, so
+    extreme quantiles are the most accurate; `rank_error` estimates the
+    uncertainty of a quantile as a fraction of the rows.
+    """
+
+    def __init__(self, compression=200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def total(self):
+        return float(self.weights.sum())
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, np.ones(values.size)]))
+
+    def merge(self, other):
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights]))
+
+    def _compress(self, means, weights):
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        q_left = (np.cumsum(weights) - weights) / weights.sum()
+        # k1 scale: one centroid per unit of k, so centroids shrink towards q = 0 and 1
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)
+        cluster = np.floor(k + self.compression / 4).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, cluster[1:] != cluster[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q):
+        if not self.weights.size:
+            return np.nan
+        total = self.total
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(q * total, np.r_[0.0, centers, total], np.r_[self.min, self.means, self.max]))
+
+    def rank_error(self, q):
+        # Half the weight of the centroid holding rank q * total
+        if not self.weights.size:
+            return np.nan
+        idx = min(int(np.searchsorted(np.cumsum(self.weights), q * self.total)), self.weights.size - 1)
+        return float(self.weights[idx] / 2 / self.total)
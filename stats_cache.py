@@ -0,0 +1,63 @@
+from profiler import DatasetProfile, profile_column
+
+
+# Per-session memo of statistics; each mutation bumps `version` and drops only the touched columns' entries
+class StatsCache:
+    def __init__(self):
+        self.version = 0
+        self.touched = []  # (version, columns) per mutation
+        self._column_stats = {}
+        self._dataset_stats = {}
+
+    def invalidate(self, columns=None):
+        self.version += 1
+        self.touched.append((self.version, None if columns is None else list(columns)))
+        if columns is None:
+            self._column_stats.clear()
+            self._dataset_stats.clear()
+            return
+        columns = set(columns)
+        for col in columns:
+            self._column_stats.pop(col, None)
+        for name in [name for name, (cols, _, _) in self._dataset_stats.items() if cols & columns]:
+            del self._dataset_stats[name]
+
+    def _entry(self, series):
+        # Entries remember dtype and length so an unrecorded change can't serve stale values
+        key = (str(series.dtype), len(series))
+        stats = self._column_stats.get(series.name)
+        if stats is None or stats["_key"] != key:
+            stats = self._column_stats[series.name] = {"_key": key}
+        return stats
+
+    def column_stat(self, series, name, compute):
+        stats = self._entry(series)
+        if name not in stats:
+            stats[name] = compute(series)
+        return stats[name]
+
+    def column_stats(self, df, name, compute):
+        # column_stat for every column of `df`; the stale ones are computed in one
+        # `compute(df, columns) -> {column: value}` call (e.g. one engine query)
+        entries = {col: self._entry(df[col]) for col in df.columns}
+        stale = [col for col, stats in entries.items() if name not in stats]
+        if stale:
+            for col, value in compute(df, stale).items():
+                entries[col][name] = value
+        return {col: stats[name] for col, stats in entries.items()}
+
+    def dataset_stat(self, name, columns, compute, key=None):
+        # Stats spanning several columns (e.g. correlations), dropped when any of them changes
+        columns = frozenset(columns)
+        entry = self._dataset_stats.get(name)
+        if entry is None or entry[0] != columns or entry[1] != key:
+            entry = self._dataset_stats[name] = (columns, key, compute())
+        return entry[2]
+
+
+def cached_profile(df, cache, backend=None):
+    if backend is None:
+        columns = {col: cache.column_stat(df[col], "profile", profile_column) for col in df.columns}
+    else:
+        columns = cache.column_stats(df, "profile", backend.profile)
+    return DatasetProfile(n_rows=df.shape[0], columns=columns)
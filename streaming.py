@@ -0,0 +1,204 @@
+import os
+import shutil
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from correlation import CorrelationAccumulator
+from data_loader import CACHE_DIR, evict_cache
+from profiler import TOP_K, ColumnProfile, DatasetProfile, is_categorical_column, is_numeric_column
+from sketches import HyperLogLog, SpaceSaving, TDigest, sketch_hashes
+
+CHUNK_ROWS = 200_000
+SAMPLE_ROWS = 100_000
+STREAMING_THRESHOLD_MB = 100  # files above this default to chunked ingestion
+
+
+def _combine_dtype(a, b):
+    if a is None or a == b:
+        return b
+    if is_numeric_column(a) and is_numeric_column(b):
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+class ColumnAccumulator:
+    """Incremental column profile: nulls, moments, distinct (HyperLogLog), top-k (Space-Saving) and quantile (t-digest) sketches."""
+
+    def __init__(self, name):
+        self.name = name
+        self.dtype = None
+        self.count = 0
+        self.nulls = 0
+        self.is_numeric = True
+        self.is_categorical = False
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.distinct = HyperLogLog()
+        self.digest = TDigest()
+        self.top = SpaceSaving()
+
+    def update(self, series):
+        self.dtype = _combine_dtype(self.dtype, series.dtype)
+        nulls = int(series.isna().sum())
+        self.nulls += nulls
+        self.count += len(series) - nulls
+        self.is_categorical |= is_categorical_column(series)
+
+        values = series.dropna()
+        hashes = sketch_hashes(values)
+        self.distinct.update_hashes(hashes)
+        self.top.update(values, hashes)
+
+        # A column stays numeric only if every chunk parsed as numeric,
+        # which is what a full read_csv would have inferred too.
+        if self.is_numeric and is_numeric_column(series):
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            self._update_moments(values[~np.isnan(values)])
+        else:
+            self.is_numeric = False
+
+    def _update_moments(self, values):
+        if values.size == 0:
+            return
+        n_b = values.size
+        mean_b = values.mean()
+        dev = values - mean_b
+        m2_b = np.sum(dev ** 2)
+        m3_b = np.sum(dev ** 3)
+
+        # Pairwise combination of central moments (Chan et al. / Pebay)
+        n_a, n = self.n, self.n + n_b
+        delta = mean_b - self.mean
+        self.m3 += m3_b + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2 + 3 * delta * (n_a * m2_b - n_b * self.m2) / n
+        self.m2 += m2_b + delta ** 2 * n_a * n_b / n
+        self.mean += delta * n_b / n
+        self.n = n
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.digest.update(values)
+
+    def profile(self):
+        profile = ColumnProfile(
+            name=self.name,
+            dtype=str(self.dtype),
+            count=self.count,
+            nulls=self.nulls,
+            distinct=min(self.distinct.estimate(), self.count),
+            is_numeric=self.is_numeric,
+            is_categorical=self.is_categorical,
+            approximate=True,
+            distinct_error=self.distinct.relative_error,
+        )
+        profile.top_values, errors = self.top.top(TOP_K)
+        profile.top_values.index.name = self.name
+        profile.top_error = int(errors.max()) if len(errors) else 0
+        if self.is_numeric and self.n:
+            n = self.n
+            profile.min, profile.max, profile.mean = self.min, self.max, self.mean
+            profile.std = float(np.sqrt(self.m2 / (n - 1))) if n > 1 else np.nan
+            if n >= 3:
+                profile.skew = 0.0 if self.m2 == 0 else float(
+                    np.sqrt(n * (n - 1)) / (n - 2) * (self.m3 / n) / (self.m2 / n) ** 1.5
+                )
+            profile.q25, profile.q50, profile.q75 = (self.digest.quantile(q) for q in (0.25, 0.5, 0.75))
+            profile.quantile_error = max(self.digest.rank_error(q) for q in (0.25, 0.5, 0.75))
+        return profile
+
+
+@dataclass
+class StreamResult:
+    profile: DatasetProfile
+    correlation: pd.DataFrame
+    sample: pd.DataFrame
+    store_dir: str = None
+    n_chunks: int = 0
+
+
+def spill_dir(fingerprint):
+    return os.path.join(CACHE_DIR, f"{fingerprint}.parts")
+
+
+def _write_part(chunk, path):
+    try:
+        chunk.to_parquet(path, index=False)
+    except Exception:
+        # Mixed-type object columns: store them as nullable strings instead
+        objects = chunk.select_dtypes(include="object").columns
+        chunk.astype({col: "string" for col in objects}).to_parquet(path, index=False)
+
+
+def _reservoir(sample, chunk, keys, size):
+    # Bottom-k over uniform random keys == uniform sample without replacement
+    candidates = chunk.assign(_sample_key=keys)
+    if sample is not None:
+        candidates = pd.concat([sample, candidates])
+    return candidates.nsmallest(size, "_sample_key") if len(candidates) > size else candidates
+
+
+def stream_csv(source, store_dir=None, chunksize=CHUNK_ROWS, sample_rows=SAMPLE_ROWS,
+               progress=None, random_state=0):
+    """Profile a CSV chunk by chunk with bounded memory.
+
+    Builds the column profile and correlation matrix incrementally, keeps a
+    uniform row sample for the interactive tabs and, if `store_dir` is
+    given, spills every chunk to Parquet there. `progress(fraction, rows)`
+    is called after each chunk.
+    """
+    handle = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+    handle.seek(0, os.SEEK_END)
+    total_bytes = max(handle.tell(), 1)
+    handle.seek(0)
+
+    if store_dir:
+        shutil.rmtree(store_dir, ignore_errors=True)
+        os.makedirs(store_dir)
+
+    rng = np.random.default_rng(random_state)
+    accumulators, corr, sample = None, None, None
+    n_rows = n_chunks = 0
+    try:
+        for chunk in pd.read_csv(handle, chunksize=chunksize, low_memory=False):
+            if accumulators is None:
+                accumulators = {col: ColumnAccumulator(col) for col in chunk.columns}
+                corr = CorrelationAccumulator(chunk.select_dtypes(include="number").columns)
+
+            for col, acc in accumulators.items():
+                acc.update(chunk[col])
+            numeric = chunk[corr.columns].apply(pd.to_numeric, errors="coerce")
+            corr.update(numeric)
+            sample = _reservoir(sample, chunk, rng.random(len(chunk)), sample_rows)
+
+            if store_dir:
+                _write_part(chunk, os.path.join(store_dir, f"part-{n_chunks:05d}.parquet"))
+            n_rows += len(chunk)
+            n_chunks += 1
+            if progress:
+                progress(min(handle.tell() / total_bytes, 1.0), n_rows)
+    finally:
+        if handle is not source:
+            handle.close()
+
+    if accumulators is None:
+        raise ValueError("No columns to parse from file")
+
+    profile = DatasetProfile(n_rows=n_rows, columns={col: acc.profile() for col, acc in accumulators.items()})
+    still_numeric = [col for col in corr.columns if accumulators[col].is_numeric]
+    correlation = corr.matrix().loc[still_numeric, still_numeric]
+    sample = sample.drop(columns="_sample_key").sort_index()
+    if store_dir:
+        evict_cache(keep=(store_dir,))
+    return StreamResult(profile, correlation, sample, store_dir, n_chunks)
+
+
+def iter_store(store_dir, columns=None):
+    # Re-read spilled chunks one at a time (optionally only some columns)
+    for name in sorted(os.listdir(store_dir)):
+        if name.endswith(".parquet"):
+            yield pd.read_parquet(os.path.join(store_dir, name), columns=columns)
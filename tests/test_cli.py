@@ -0,0 +1,11 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_cli_imports_without_streamlit():
+    # Batch workers import the CLI module; it must not pull in the Streamlit app
+    code = "import sys, numerix_cli; assert not any(m.split('.')[0] == 'streamlit' for m in sys.modules)"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from core import auto_fix_types, infer_target_dtype
+
+
+def test_junk_in_numeric_column_is_kept_as_nan():
+    values = pd.Series([str(i) for i in range(1, 11)] * 100 + ["abc"] * 100)
+    assert infer_target_dtype(values) == "float"
+
+    result = auto_fix_types(pd.DataFrame({"n": values}))
+    fixed = result.df["n"]
+    assert result.details["report"].loc["n", "Applied"]
+    assert fixed.isna().sum() == 100
+    assert (fixed.dropna() > 0).all()
+
+
+def test_junk_missed_by_the_sample_is_kept_as_nan():
+    values = pd.Series([str(i) for i in range(5_000)] + ["x"])
+    result = auto_fix_types(pd.DataFrame({"n": values}))
+    assert result.step["dtypes"] == {"n": "float"}
+    assert result.df["n"].isna().sum() == 1
+
+
+def test_clean_integers_stay_int():
+    result = auto_fix_types(pd.DataFrame({"n": ["1", "2", "3", "4"] * 10}))
+    assert result.df["n"].dtype == "int64"
@@ -1,43 +1,64 @@
 import streamlit as st
+import pandas as pd
 import plotly.express as px
+from chart_reduction import line_chart, bar_chart, scatter_chart, histogram_chart
+from session import compute_backend, current_profile, value_counts
+from sketches import SKETCH_ROWS
 
 def generate_visualizations(df):
     st.subheader("Select Visualization Type")
 
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    numeric_cols = df.select_dtypes(include='number').columns.tolist()
+    categorical_cols = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
 
     chart_type = st.selectbox("Choose chart type", ["Line", "Bar", "Histogram", "Pie", "Scatter"])
 
     charts = []  # Collect figures for export
 
+    # Large frames are reduced server-side (downsampled, aggregated or binned)
+    # so only a bounded number of points is sent to the browser
     if chart_type in ["Line", "Bar", "Scatter"]:
         x_col = st.selectbox("Select X-axis", df.columns)
         y_col = st.selectbox("Select Y-axis", numeric_cols)
 
         if chart_type == "Line":
-            fig = px.line(df, x=x_col, y=y_col)
+            fig, shown, total = line_chart(df, x_col, y_col)
         elif chart_type == "Bar":
-            fig = px.bar(df, x=x_col, y=y_col)
+            fig, shown, total = bar_chart(df, x_col, y_col, backend=compute_backend())
         elif chart_type == "Scatter":
-            fig = px.scatter(df, x=x_col, y=y_col)
+            fig, shown, total = scatter_chart(df, x_col, y_col)
 
         st.plotly_chart(fig, use_container_width=True)
+        if shown < total and chart_type == "Bar":
+            st.caption(f"Showing the {shown:,} largest of {total:,} bars (reduced for display).")
+        elif shown < total:
+            st.caption(f"Showing {shown:,} of {total:,} points (reduced for display).")
         charts.append(fig)
 
     elif chart_type == "Histogram":
         col = st.selectbox("Select column for histogram", numeric_cols)
-        fig = px.histogram(df, x=col)
+        fig, bins, total, excluded = histogram_chart(df, col)
         st.plotly_chart(fig, use_container_width=True)
+        note = f" {excluded:,} infinite values excluded." if excluded else ""
+        st.caption(f"{total:,} values in {bins} precomputed bins.{note}")
         charts.append(fig)
 
     elif chart_type == "Pie":
         col = st.selectbox("Select categorical column", categorical_cols)
-        pie_data = df[col].value_counts().reset_index()
+        top_error = 0
+        if len(df) > SKETCH_ROWS:
+            # Long columns: the profile's top values (sketched for ID-like columns) plus one "Other" slice
+            profile = current_profile(df).columns[col]
+            counts, top_error = profile.top_values, profile.top_error
+            counts = pd.concat([counts, pd.Series({"Other": max(profile.count - int(counts.sum()), 0)})])
+        else:
+            counts = value_counts(df, col)
+        pie_data = counts.reset_index()
         pie_data.columns = [col, "Count"]
         fig = px.pie(pie_data, names=col, values="Count")
         st.plotly_chart(fig, use_container_width=True)
+        if top_error:
+            st.caption(f"Approximate counts: each slice may overcount by up to {top_error:,}.")
         charts.append(fig)
 
     return charts  # Return all created figures
-